@@ -4,11 +4,9 @@ from utils.news_fetcher import fetch_news
 from utils.sentiment import analyze_news
 from utils.ohlcv import fetch_ohlcv_data
 from utils.indicators import calculate_rsi, calculate_bollinger_bands, calculate_atr
-from openai import OpenAI
+from modules.llm_client import get_llm_client
 import re
 
-client = OpenAI()
-
 def generate_trading_prompt(news_data, sentiment_result):
     ohlcv = fetch_ohlcv_data("BTC/USDT", interval="15m", limit=100)
     rsi = calculate_rsi(ohlcv)
@@ -41,12 +39,11 @@ def generate_trading_prompt(news_data, sentiment_result):
 - 단, 퍼센트는 AI가 상황에 따라 유연하게 조절하며 반드시 정해진 수치는 아닙니다.
 """
 
-    response = client.chat.completions.create(
+    return get_llm_client("openai").chat(
+        [{"role": "user", "content": gpt_prompt}],
         model="gpt-4",
-        messages=[{"role": "user", "content": gpt_prompt}],
         temperature=0.4
     )
-    return response.choices[0].message.content
 
 def parse_ai_decision(ai_text):
     decision_match = re.search(r"(롱|숏|관망)", ai_text)
@@ -1,20 +1,23 @@
 """
 ✅ 자동매매 실행기: auto_trader.py
 설명: 뉴스 + 가격 + 지표 + 감정분석 기반 전략 판단 후 텔레그램 알림 전송 + 일일 요약 저장
+      (config.json symbols 전체를 병렬 판단, 뉴스 감정은 1회만 계산해 공유)
+      - utils/cycle_runner.py 단계 그래프(run_stages)로 실행: 뉴스/캔들 조회는 asyncio 단계로 동시에,
+        지표 계산은 지표 프로세스 풀(compute_frames)에서 CPU 병렬로 처리
 """
 
 import os
-import time
+import asyncio
 import traceback
 from datetime import datetime
 
 from dotenv import load_dotenv
-import pandas as pd
 
 from utils.news_fetcher import fetch_news
-from utils.sentiment import analyze_sentiment
-from utils.ohlcv import fetch_ohlcv_data as get_ohlcv
-from utils.indicators import calculate_rsi, calculate_bollinger_bands
+from utils.sentiment import score_news_items
+from utils.candle_store import load_candles
+from utils.cycle_runner import Stage, run_stages, compute_frames, shutdown_process_pool
+from modules.config_loader import get_symbols
 import requests
 
 # ==== 1. 설정 불러오기 ====
@@ -22,7 +25,7 @@ load_dotenv()
 TELEGRAM_TOKEN = os.getenv("TELEGRAM_TOKEN")
 TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID")
 
-SYMBOL = "BTC/USDT"
+SYMBOLS = get_symbols()
 INTERVAL = "15m"
 LIMIT = 150
 
@@ -42,56 +45,76 @@ def save_daily_summary(message):
     os.makedirs(folder, exist_ok=True)
     filename = datetime.now().strftime("%Y-%m-%d") + ".txt"
     filepath = os.path.join(folder, filename)
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(message)
-
-# ==== 4. 전략 판단 로직 ====
-def analyze_strategy():
-    try:
-        # 1) 가격/지표 수집
-        df = get_ohlcv(symbol=SYMBOL, interval=INTERVAL, limit=LIMIT)
-        df["RSI"] = calculate_rsi(df["close"])
-        df = calculate_bollinger_bands(df)
-
-        # 2) 뉴스 수집 + 감정 분석
-        news_list = fetch_news()
-        news_summary = ""
-        sentiment_score = 0
-        count = 0
-
-        for news in news_list:
-            sentiment = analyze_sentiment(news['title'])
-            sentiment_score += sentiment
-            news_summary += f"\n- {news['title']} (감정: {sentiment})"
-            count += 1
-
-        avg_sentiment = sentiment_score / max(count, 1)
-
-        # 3) 전략 판단
-        last_close = df["close"].iloc[-1]
-        last_rsi = df["RSI"].iloc[-1]
-        bb_upper = df["BB_upper"].iloc[-1]
-        bb_lower = df["BB_lower"].iloc[-1]
-
-        if avg_sentiment > 0.2 and last_rsi < 30 and last_close < bb_lower:
-            signal = "🟢 롱 진입 시그널 발생"
-        elif avg_sentiment < -0.2 and last_rsi > 70 and last_close > bb_upper:
-            signal = "🔴 숏 진입 시그널 발생"
-        else:
-            signal = "⚪ 관망 유지"
-
-        # 4) 텔레그램 + 요약 저장
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        msg = f"[{now}]\n전략 판단 결과: {signal}\n\nRSI: {last_rsi:.2f}, 종가: {last_close:.2f}\n뉴스 감정 점수: {avg_sentiment:.2f}\n{news_summary}"
-
-        send_telegram(msg)
-        save_daily_summary(msg)
-
-    except Exception as e:
-        error_msg = f"❌ 전략 판단 중 오류 발생:\n{traceback.format_exc()}"
-        send_telegram(error_msg)
-        save_daily_summary(error_msg)
-
-# ==== 5. 실행 ====
+    with open(filepath, "a", encoding="utf-8") as f:
+        f.write(message + "\n\n")
+
+# ==== 4. 뉴스 감정 요약 (모든 심볼 공유) ====
+def summarize_news_sentiment(scored):
+    news_summary = ""
+    sentiment_score = 0
+    for news, sentiment in scored:
+        sentiment_score += sentiment
+        news_summary += f"\n- {news['title']} (감정: {sentiment:.2f})"
+    return news_summary, sentiment_score / max(len(scored), 1)
+
+# ==== 5. 단계 그래프 구성 ====
+def build_stages(symbols):
+    """
+    news → scored (공유) / 심볼별 candles → frames(프로세스 풀)
+    """
+    stages = [
+        Stage("news", fetch_news, timeout=20, default=[]),
+        Stage("scored", score_news_items, deps=("news",), timeout=30, default=[]),
+    ]
+    for symbol in symbols:
+        stages.append(Stage(f"{symbol}:candles", lambda symbol=symbol: load_candles(symbol, INTERVAL, limit=LIMIT),
+                            timeout=20))
+        stages.append(Stage(f"{symbol}:frames", lambda candles: compute_frames(candles, (INTERVAL,), INTERVAL),
+                            deps=(f"{symbol}:candles",), timeout=20))
+    return stages
+
+# ==== 6. 전략 판단 로직 ====
+def analyze_strategy(symbol, indicators, news_summary, avg_sentiment):
+    # 1) 가격/지표 (사이클에서 계산된 결과 사용)
+    last_close = indicators["close"]
+    last_rsi = indicators["rsi"]
+    bb_location = indicators["bb"]
+
+    # 2) 전략 판단
+    if avg_sentiment > 0.2 and last_rsi < 30 and bb_location == "하단":
+        signal = "🟢 롱 진입 시그널 발생"
+    elif avg_sentiment < -0.2 and last_rsi > 70 and bb_location == "상단":
+        signal = "🔴 숏 진입 시그널 발생"
+    else:
+        signal = "⚪ 관망 유지"
+
+    # 3) 텔레그램 + 요약 저장
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    msg = f"[{now}] {symbol}\n전략 판단 결과: {signal}\n\nRSI: {last_rsi:.2f}, 종가: {last_close:.2f}\n뉴스 감정 점수: {avg_sentiment:.2f}\n{news_summary}"
+
+    send_telegram(msg)
+    save_daily_summary(msg)
+
+def run_cycle(symbols):
+    report = asyncio.run(run_stages(build_stages(symbols)))
+    news_summary, avg_sentiment = summarize_news_sentiment(report.results["scored"])
+
+    for symbol in symbols:
+        try:
+            indicators = (report.results[f"{symbol}:frames"] or {}).get(INTERVAL)
+            if not indicators:
+                error = report.errors.get(f"{symbol}:frames") or report.errors.get(f"{symbol}:candles") or "데이터 없음"
+                raise RuntimeError(f"지표 계산 실패: {error}")
+            analyze_strategy(symbol, indicators, news_summary, avg_sentiment)
+        except Exception:
+            error_msg = f"❌ {symbol} 전략 판단 중 오류 발생:\n{traceback.format_exc()}"
+            send_telegram(error_msg)
+            save_daily_summary(error_msg)
+
+# ==== 7. 실행 ====
+# 지표 프로세스 풀(spawn)이 이 파일을 다시 import해도 사이클이 실행되지 않도록 main 가드
 if __name__ == "__main__":
-    analyze_strategy()
+    try:
+        run_cycle(list(dict.fromkeys(SYMBOLS)))
+    finally:
+        shutdown_process_pool()
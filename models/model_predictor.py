@@ -1,49 +1,80 @@
 # 📁 models/model_predictor.py
 # 🎯 시계열 누적 저장 및 딥러닝 예측 함수만 정의
+#    - 시계열은 심볼별 링 버퍼(SequenceBuffer)에 누적 (symbol 생략 시 기본 시퀀스)
+#    - predict_with_model_batch(symbols): 모든 심볼을 LSTM 1회 추론으로 예측
+#    - LSTM 모델은 model_registry에 상주 (파일 변경 시 자동 재로딩)
 
 import os
 import numpy as np
 from tensorflow.keras.models import load_model
 
+from models.model_registry import register_model, predict
+from models.sequence_buffer import SequenceBuffer
+
 SEQUENCE_LENGTH = 10
-DATA_SEQUENCE = []
+FEATURES = ("rsi", "macd", "ema", "tema", "sentiment")
+FEATURE_DEFAULTS = {"rsi": 50}
+DEFAULT_SEQUENCE_KEY = "default"
+SIGNALS = ["long", "short", "hold"]
+
+# 심볼별 최근 SEQUENCE_LENGTH개 특징 벡터 (미리 할당한 링 버퍼)
+SEQUENCE_BUFFER = SequenceBuffer(SEQUENCE_LENGTH, len(FEATURES))
 
 MODEL_PATH = "models/lstm_model.h5"
+MODEL_NAME = "lstm"
+
+def _load_lstm(path: str):
+    # 추론 전용이므로 compile 생략 (로딩 시간 단축)
+    return load_model(path, compile=False)
+
+def _predict_lstm(model, X: np.ndarray) -> np.ndarray:
+    # 소규모 배치는 model.predict()보다 직접 호출이 훨씬 빠름 (predict는 매번 데이터 파이프라인 구성)
+    return np.asarray(model(X, training=False))
+
+register_model(MODEL_NAME, MODEL_PATH, _load_lstm, _predict_lstm)
+
+def get_sequence(symbol: str = None) -> np.ndarray:
+    return SEQUENCE_BUFFER.window(symbol or DEFAULT_SEQUENCE_KEY)
 
-def update_sequence(entry: dict):
+def update_sequence(entry: dict, symbol: str = None):
     """
     시계열 데이터 누적 (LSTM 입력용)
     """
-    global DATA_SEQUENCE
-    features = [
-        entry.get("rsi", 50),
-        entry.get("macd", 0),
-        entry.get("ema", 0),
-        entry.get("tema", 0),
-        entry.get("sentiment", 0),
-    ]
-    DATA_SEQUENCE.append(features)
-    if len(DATA_SEQUENCE) > SEQUENCE_LENGTH:
-        DATA_SEQUENCE.pop(0)
-
-def predict_with_model() -> str:
+    features = []
+    for key in FEATURES:
+        value = entry.get(key)
+        features.append(FEATURE_DEFAULTS.get(key, 0) if value is None else value)
+    SEQUENCE_BUFFER.append(symbol or DEFAULT_SEQUENCE_KEY, features)
+
+def predict_with_model_batch(symbols) -> dict:
     """
-    누적된 시계열 데이터를 기반으로 전략 예측
+    ✅ 여러 심볼을 한 번의 LSTM 추론으로 예측
+    - 시계열이 다 찬 심볼만 (N, 10, 5) 배치로 묶어 1회 forward, 나머지는 "hold"
     """
+    symbols = [symbol or DEFAULT_SEQUENCE_KEY for symbol in symbols]
+    signals = {symbol: "hold" for symbol in symbols}
     if not os.path.exists(MODEL_PATH):
         print("❌ 모델 파일이 존재하지 않습니다.")
-        return "hold"
+        return signals
 
-    if len(DATA_SEQUENCE) < SEQUENCE_LENGTH:
-        print("⏳ 시계열 데이터 부족 (예측 보류)")
-        return "hold"
+    ready = [symbol for symbol in symbols if SEQUENCE_BUFFER.ready(symbol)]
+    if len(ready) < len(symbols):
+        print(f"⏳ 시계열 데이터 부족 (예측 보류): {', '.join(s for s in symbols if s not in ready)}")
+    if not ready:
+        return signals
 
     try:
-        model = load_model(MODEL_PATH)
-        X = np.array([DATA_SEQUENCE], dtype=np.float32)  # (1, 10, 5)
-        prediction = model.predict(X, verbose=0)
-        idx = int(np.argmax(prediction))
-        return ["long", "short", "hold"][idx]
+        X = SEQUENCE_BUFFER.batch(ready)  # (N, 10, 5)
+        prediction = predict(MODEL_NAME, X)
+        for symbol, idx in zip(ready, np.argmax(prediction, axis=1)):
+            signals[symbol] = SIGNALS[int(idx)]
     except Exception as e:
         print(f"⚠️ 예측 오류: {e}")
-        return "hold"
+    return signals
+
+def predict_with_model(symbol: str = None) -> str:
+    """
+    누적된 시계열 데이터를 기반으로 전략 예측
+    """
+    key = symbol or DEFAULT_SEQUENCE_KEY
+    return predict_with_model_batch([key])[key]
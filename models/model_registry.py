@@ -0,0 +1,150 @@
+# 📁 파일명: models/model_registry.py
+"""
+📌 목적: 딥러닝 모델(LSTM / Attention 등)을 프로세스에 상주시켜 예측마다 다시 로딩하지 않도록 관리
+📌 기능:
+  - register_model(name, path, loader, predict_fn): 모델 등록 (로딩은 첫 사용 시)
+  - predict(name, X): 상주 모델로 예측 (모델별 잠금으로 스레드 안전)
+  - get_model(name): 상주 모델 객체 반환
+  - warm_up_models(names): 트레이딩 루프 시작 전 사전 로딩 (MODEL_MODULES를 먼저 import해 등록)
+  - get_model_stats(): 모델별 로딩/재로딩 횟수, 로딩 시간, 예측 호출 수/오류/지연(ms)
+📌 핫 리로드:
+  - 모델 파일 수정 시각(mtime)이 바뀌면 다음 사용 시 새 파일로 교체
+  - 재로딩 실패 시 기존 모델을 계속 사용 (재학습 중 불완전한 파일 대비)
+📌 작업 프롬프트 요약:
+  ▶ "예측할 때마다 load_model 하지 말고, 모델을 한 번만 올려 상주시킨 뒤 파일이 바뀌면 자동 교체하고 예측 지연을 기록하라."
+"""
+
+import os
+import time
+import threading
+import importlib
+
+
+class ModelEntry:
+    """
+    ✅ 등록 모델 1개 (로딩 상태 + 통계)
+    """
+
+    def __init__(self, name: str, path: str, loader, predict_fn):
+        self.name = name
+        self.path = path
+        self.loader = loader            # loader(path) → 모델 객체
+        self.predict_fn = predict_fn    # predict_fn(model, X) → np.ndarray
+        self.model = None
+        self.mtime = None
+        self.lock = threading.Lock()
+        self.stats = {"loads": 0, "reloads": 0, "load_errors": 0, "load_ms": 0.0,
+                      "calls": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0, "last_ms": 0.0}
+
+    def _current_mtime(self):
+        try:
+            return os.path.getmtime(self.path)
+        except OSError:
+            return None
+
+    def ensure_loaded(self):
+        """
+        처음이거나 파일이 바뀌었으면 로딩 (호출 측에서 self.lock 보유)
+        """
+        mtime = self._current_mtime()
+        if mtime is None:
+            if self.model is None:
+                raise FileNotFoundError(f"모델 파일이 존재하지 않습니다: {self.path}")
+            return self.model
+        if self.model is not None and mtime == self.mtime:
+            return self.model
+
+        reloading = self.model is not None
+        started = time.perf_counter()
+        try:
+            model = self.loader(self.path)
+        except Exception as e:
+            self.stats["load_errors"] += 1
+            if not reloading:
+                raise
+            print(f"⚠️ {self.name} 모델 재로딩 실패 → 기존 모델 유지: {e}")
+            self.mtime = mtime   # 같은 파일로 매번 재시도하지 않음
+            return self.model
+
+        self.stats["load_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        self.stats["reloads" if reloading else "loads"] += 1
+        print(f"🧠 {self.name} 모델 {'재로딩' if reloading else '로딩'} 완료 ({self.stats['load_ms']:.0f}ms)")
+        self.model = model
+        self.mtime = mtime
+        return model
+
+    def predict(self, X):
+        with self.lock:
+            model = self.ensure_loaded()
+            started = time.perf_counter()
+            try:
+                return self.predict_fn(model, X)
+            except Exception:
+                self.stats["errors"] += 1
+                raise
+            finally:
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                self.stats["calls"] += 1
+                self.stats["total_ms"] += elapsed_ms
+                self.stats["max_ms"] = max(self.stats["max_ms"], elapsed_ms)
+                self.stats["last_ms"] = elapsed_ms
+
+    def get_stats(self) -> dict:
+        calls = self.stats["calls"]
+        return {
+            **self.stats,
+            "loaded": self.model is not None,
+            "avg_ms": round(self.stats["total_ms"] / calls, 2) if calls else 0.0,
+        }
+
+
+_MODELS = {}
+_REGISTRY_LOCK = threading.Lock()
+
+# import 시 register_model()을 호출하는 모듈 (warm_up_models 전에 등록되도록 미리 import)
+MODEL_MODULES = ("models.model_predictor", "modules.attention_model")
+
+def register_model(name: str, path: str, loader, predict_fn) -> ModelEntry:
+    """
+    모델 등록 (같은 이름 재등록 시 기존 상주 모델은 유지하고 설정만 갱신)
+    """
+    with _REGISTRY_LOCK:
+        entry = _MODELS.get(name)
+        if entry is None:
+            entry = ModelEntry(name, path, loader, predict_fn)
+            _MODELS[name] = entry
+        else:
+            entry.path, entry.loader, entry.predict_fn = path, loader, predict_fn
+        return entry
+
+def _get_entry(name: str) -> ModelEntry:
+    entry = _MODELS.get(name)
+    if entry is None:
+        raise KeyError(f"등록되지 않은 모델: {name}")
+    return entry
+
+def get_model(name: str):
+    entry = _get_entry(name)
+    with entry.lock:
+        return entry.ensure_loaded()
+
+def predict(name: str, X):
+    return _get_entry(name).predict(X)
+
+def warm_up_models(names=None):
+    """
+    등록 모델 사전 로딩 (파일 없는 모델은 건너뜀)
+    """
+    for module in MODEL_MODULES:
+        try:
+            importlib.import_module(module)
+        except ImportError as e:
+            print(f"⚠️ 모델 모듈 import 실패 ({module}): {e}")
+    for name in names or list(_MODELS.keys()):
+        try:
+            get_model(name)
+        except FileNotFoundError as e:
+            print(f"⚠️ {e}")
+
+def get_model_stats() -> dict:
+    return {name: entry.get_stats() for name, entry in _MODELS.items()}
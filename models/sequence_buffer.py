@@ -0,0 +1,86 @@
+# 📁 파일명: models/sequence_buffer.py
+"""
+📌 목적: 심볼별 시계열 입력(최근 N개 특징 벡터)을 미리 할당한 NumPy 배열 하나에 링 버퍼로 보관
+📌 기능:
+  - SequenceBuffer(length, n_features): (심볼 × length × 특징) 배열, 심볼 추가 시에만 용량 2배 확장
+  - append(symbol, features): 해당 심볼 링 버퍼에 1개 기록 (O(1), 리스트 pop(0) 없음)
+  - window(symbol): 오래된 → 최신 순서 (length, 특징) 배열
+  - batch(symbols): 여러 심볼 윈도우를 (심볼 수, length, 특징) 배열로 한 번에 추출 → 모델 1회 추론
+  - ready(symbol): length개가 모두 찼는지 여부
+📌 작업 프롬프트 요약:
+  ▶ "전역 리스트 하나 대신 심볼별 링 버퍼를 미리 할당한 NumPy 배열에 두고, 모든 심볼을 한 번의 배치 추론으로 평가하라."
+"""
+
+import threading
+
+import numpy as np
+
+
+class SequenceBuffer:
+    """
+    ✅ 심볼별 링 버퍼 시계열 저장소
+    """
+
+    def __init__(self, length: int, n_features: int, capacity: int = 8, dtype=np.float32):
+        self.length = length
+        self.n_features = n_features
+        self.data = np.zeros((capacity, length, n_features), dtype=dtype)
+        self.positions = np.zeros(capacity, dtype=np.int64)   # 다음 기록 위치
+        self.counts = np.zeros(capacity, dtype=np.int64)      # 누적 기록 수 (최대 length)
+        self.index = {}                                       # 심볼 → 행 번호
+        self._offsets = np.arange(length)
+        self._lock = threading.Lock()
+
+    def _row(self, symbol: str) -> int:
+        row = self.index.get(symbol)
+        if row is None:
+            row = len(self.index)
+            if row >= len(self.data):
+                grow = len(self.data)
+                self.data = np.concatenate([self.data, np.zeros_like(self.data[:grow])])
+                self.positions = np.concatenate([self.positions, np.zeros(grow, dtype=np.int64)])
+                self.counts = np.concatenate([self.counts, np.zeros(grow, dtype=np.int64)])
+            self.index[symbol] = row
+        return row
+
+    def append(self, symbol: str, features):
+        with self._lock:
+            row = self._row(symbol)
+            pos = self.positions[row]
+            self.data[row, pos] = features
+            self.positions[row] = (pos + 1) % self.length
+            self.counts[row] = min(self.counts[row] + 1, self.length)
+
+    def count(self, symbol: str) -> int:
+        row = self.index.get(symbol)
+        return 0 if row is None else int(self.counts[row])
+
+    def ready(self, symbol: str) -> bool:
+        return self.count(symbol) >= self.length
+
+    def batch(self, symbols) -> np.ndarray:
+        """
+        (심볼 수, length, 특징) 윈도우 배열 (오래된 → 최신 순, 미등록 심볼은 0)
+        """
+        with self._lock:
+            rows = np.array([self._row(symbol) for symbol in symbols], dtype=np.int64)
+            # 링 버퍼 시작점(다음 기록 위치)부터 length개를 순서대로 모음
+            steps = (self.positions[rows, None] + self._offsets[None, :]) % self.length
+            return self.data[rows[:, None], steps]
+
+    def window(self, symbol: str) -> np.ndarray:
+        """
+        (length, 특징) 윈도우, 아직 덜 찼으면 채워진 부분만 반환
+        """
+        window = self.batch([symbol])[0]
+        return window[self.length - self.count(symbol):]
+
+    def reset(self, symbol: str = None):
+        with self._lock:
+            if symbol is None:
+                self.positions[:] = 0
+                self.counts[:] = 0
+            elif symbol in self.index:
+                row = self.index[symbol]
+                self.positions[row] = 0
+                self.counts[row] = 0
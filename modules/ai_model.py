@@ -14,32 +14,14 @@ def example():
   ▶ "기술 지표와 감정 점수를 포함한 전략 프롬프트를 받아 Grok 모델로 응답 받고, 해당 응답을 원문 그대로 반환하라."
 """
 
-import os
-import requests
-
-GROK_API_KEY = os.getenv("GROK_API_KEY")
+from modules.llm_client import get_llm_client, LLMUnavailableError
 
 def query_grok(prompt: str, model: str = "grok-3"):
     """
-    Grok API에 프롬프트 전달 후 응답 반환
+    Grok API에 프롬프트 전달 후 응답 반환 (공용 LLM 클라이언트 사용)
     """
-    url = "https://api.grok.x.ai/v1/chat/completions"
-    headers = {
-        "Authorization": f"Bearer {GROK_API_KEY}",
-        "Content-Type": "application/json"
-    }
-    payload = {
-        "model": model,
-        "messages": [
-            {"role": "user", "content": prompt}
-        ]
-    }
-
     try:
-        response = requests.post(url, headers=headers, json=payload)
-        response.raise_for_status()
-        result = response.json()
-        return result["choices"][0]["message"]["content"]
-    except Exception as e:
+        return get_llm_client("grok").chat([{"role": "user", "content": prompt}], model)
+    except LLMUnavailableError as e:
         print(f"⚠️ Grok 응답 오류: {e}")
         return "HOLD"
@@ -6,7 +6,9 @@
 # 🔧 주요 함수:
 #     - train_model(): 과거 데이터를 기반으로 예측 모델 학습
 #     - predict_signal(): 현재 지표 기반 시그널 예측
+#     - predict_signal_batch(): 여러 심볼 시그널을 한 번의 forward로 예측
 #     - save_model() / load_model(): 모델 저장 및 불러오기
+#     - 예측 모델은 models/model_registry에 상주 (파일 변경 시 자동 재로딩)
 # 💬 프롬프트 요약:
 #     ▶ "기술 지표와 감정 데이터를 입력 받아, 딥러닝으로 전략 시그널을 예측하라."
 
@@ -16,7 +18,11 @@ import numpy as np
 import pandas as pd
 import os
 
+from models.model_registry import register_model, predict
+
 MODEL_PATH = "models/attention_model.pt"
+MODEL_NAME = "attention"
+INPUT_SIZE = 6
 
 # 🔹 Attention 기반 간단한 시계열 예측 모델 정의
 class AttentionModel(nn.Module):
@@ -41,7 +47,7 @@ def decode_signal(index: int) -> str:
 
 # 🔹 모델 학습 함수
 def train_model(df: pd.DataFrame):
-    model = AttentionModel(input_size=6)
+    model = AttentionModel(input_size=INPUT_SIZE)
     criterion = nn.CrossEntropyLoss()
     optimizer = torch.optim.Adam(model.parameters(), lr=0.001)
 
@@ -62,19 +68,38 @@ def train_model(df: pd.DataFrame):
     os.makedirs("models", exist_ok=True)
     torch.save(model.state_dict(), MODEL_PATH)
 
-# 🔹 예측 함수
-def predict_signal(indicators: dict, sentiment_score: float):
-    model = AttentionModel(input_size=6)
-    if not os.path.exists(MODEL_PATH):
-        return "hold"
-
-    model.load_state_dict(torch.load(MODEL_PATH))
+# 🔹 상주 모델 로딩 / 추론 (model_registry 등록용)
+def _load_attention(path: str) -> AttentionModel:
+    model = AttentionModel(input_size=INPUT_SIZE)
+    model.load_state_dict(torch.load(path, map_location="cpu"))
     model.eval()
+    return model
 
-    x = np.array([[indicators["rsi"], indicators["macd"], indicators["ema"],
-                   indicators["tema"], sentiment_score, indicators["close"]]])
-    x_tensor = torch.tensor(x, dtype=torch.float32).unsqueeze(1)
+def _predict_attention(model: AttentionModel, X: np.ndarray) -> np.ndarray:
     with torch.no_grad():
-        output = model(x_tensor)
-        prediction = torch.argmax(output, dim=1).item()
-    return decode_signal(prediction)
+        return model(torch.as_tensor(X, dtype=torch.float32)).numpy()
+
+register_model(MODEL_NAME, MODEL_PATH, _load_attention, _predict_attention)
+
+# 🔹 입력 특징 벡터 [rsi, macd, ema, tema, sentiment, close]
+def _feature_row(indicators: dict, sentiment_score: float) -> list:
+    return [indicators["rsi"], indicators["macd"], indicators["ema"],
+            indicators["tema"], sentiment_score, indicators["close"]]
+
+# 🔹 배치 예측 함수 (심볼 전체를 1회 forward)
+def predict_signal_batch(inputs: dict) -> dict:
+    """
+    inputs: {symbol: (indicators, sentiment_score)} → {symbol: signal}
+    - 학습과 같은 (배치, 1, 6) 입력으로 모든 심볼을 한 번에 추론
+    """
+    symbols = list(inputs.keys())
+    if not symbols or not os.path.exists(MODEL_PATH):
+        return {symbol: "hold" for symbol in symbols}
+
+    x = np.array([_feature_row(*inputs[symbol]) for symbol in symbols], dtype=np.float32)
+    output = predict(MODEL_NAME, x[:, np.newaxis, :])
+    return {symbol: decode_signal(int(idx)) for symbol, idx in zip(symbols, np.argmax(output, axis=1))}
+
+# 🔹 예측 함수
+def predict_signal(indicators: dict, sentiment_score: float):
+    return predict_signal_batch({None: (indicators, sentiment_score)})[None]
@@ -4,7 +4,8 @@
 import os
 import praw
 import logging
-from transformers import AutoTokenizer, AutoModelForSequenceClassification, pipeline
+from utils.sentiment_service import PROSUS_FINBERT_MODEL
+from utils.sentiment_cache import cached_score_texts
 
 # ✅ .env 또는 환경변수에서 Reddit 인증 정보 로드
 REDDIT_CLIENT_ID = os.getenv("REDDIT_CLIENT_ID")
@@ -18,11 +19,8 @@ reddit = praw.Reddit(
     user_agent=REDDIT_USER_AGENT
 )
 
-# ✅ FinBERT 모델 로드
-model_name = "yiyanghkust/finbert-tone"
-tokenizer = AutoTokenizer.from_pretrained(model_name)
-model = AutoModelForSequenceClassification.from_pretrained(model_name)
-sentiment_pipeline = pipeline("sentiment-analysis", model="ProsusAI/finbert")
+# ✅ FinBERT 모델: 공유 감정 분석 서비스에서 첫 사용 시 지연 로딩
+COMMUNITY_MODEL = PROSUS_FINBERT_MODEL
 
 def analyze_community_sentiment(keyword: str = "bitcoin") -> float:
     """
@@ -31,10 +29,9 @@ def analyze_community_sentiment(keyword: str = "bitcoin") -> float:
     """
     try:
         posts = reddit.subreddit("CryptoCurrency").search(keyword, limit=10)
+        texts = [post.title + ". " + (post.selftext or "") for post in posts]
         scores = []
-        for post in posts:
-            text = post.title + ". " + (post.selftext or "")
-            result = sentiment_pipeline(text[:512])[0]
+        for result in cached_score_texts(texts, COMMUNITY_MODEL):
             label = result["label"]
             if label == "positive":
                 scores.append(1.0)
@@ -69,7 +66,7 @@ def analyze_finbert_sentiment(query="btc OR bitcoin OR crypto", subreddit="Crypt
         if not texts:
             return 0.0  # 분석할 텍스트 없음
 
-        results = sentiment_pipeline(texts)
+        results = cached_score_texts(texts, COMMUNITY_MODEL)
         score = 0.0
         for result in results:
             label = result["label"].lower()
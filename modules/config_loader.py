@@ -1,33 +1,48 @@
 # 📁 파일명: modules/config_loader.py
 # 🎯 목적: config.json 및 .env 등 설정 파일 불러오기 전용
 # 기능 요약:
-#   - load_config(): config.json 파일 불러오기
+#   - load_config(): config.json 파일 불러오기 (// 주석 허용)
+#   - get_symbols(): 전략 대상 심볼 목록
 #   - load_env(): .env 파일에서 환경 변수 불러오기
 # 사용 프롬프트 요약:
 #   ▶ "자동매매에 필요한 설정을 config.json 및 .env 파일로 분리 관리하고, 유연하게 로드하라."
 
+import re
 import json
 import os
 from dotenv import load_dotenv
 
+DEFAULT_SYMBOLS = ("BTC/USDT",)
+
+# 문자열 밖의 // 주석만 제거 (URL 등 문자열 안의 //는 유지)
+_COMMENT_PATTERN = re.compile(r'("(?:\\.|[^"\\])*")|//[^\n]*')
+
+def _strip_json_comments(text: str) -> str:
+    return _COMMENT_PATTERN.sub(lambda m: m.group(1) or "", text)
+
 def load_config(path: str = "config.json") -> dict:
     """
     ⚙️ config.json 파일 로딩
     - 기본 설정 (레버리지, 심볼, 지표 등)
+    - 항목 옆 // 설명 주석 허용
     """
     try:
         with open(path, "r", encoding="utf-8") as f:
-            config = json.load(f)
+            config = json.loads(_strip_json_comments(f.read()))
         return config
     except Exception as e:
         print(f"⚠️ 설정 파일 로딩 실패: {e}")
         return {}
 
 def get_config(key: str, default=None):
-    import json
-    with open("config.json", "r", encoding="utf-8") as f:
-        config = json.load(f)
-    return config.get(key, default)
+    return load_config().get(key, default)
+
+def get_symbols(path: str = "config.json") -> list:
+    """
+    📈 전략 대상 심볼 목록 (config.json "symbols", 없으면 BTC/USDT)
+    """
+    symbols = load_config(path).get("symbols") or DEFAULT_SYMBOLS
+    return list(dict.fromkeys(symbols))
 
 def load_env(env_path: str = ".env"):
     """
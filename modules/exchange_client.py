@@ -0,0 +1,64 @@
+# 📁 파일명: modules/exchange_client.py
+"""
+📌 목적: 거래소(ccxt) 클라이언트를 프로세스당 1개씩 유지하여 재사용
+📌 기능:
+  - get_exchange_client(exchange_id, sandbox): (거래소, 샌드박스, 계정) 단위로 장기 유지 클라이언트 반환
+  - close_exchange_clients(): 보관 중인 클라이언트 정리
+📌 특징:
+  - 마켓 정보(load_markets)는 클라이언트 생성 시 1회만 로딩
+  - ccxt는 실제 사용 시점에만 import (설치되지 않은 환경에서도 다른 모듈 사용 가능)
+📌 작업 프롬프트 요약:
+  ▶ "호출마다 ccxt 클라이언트를 새로 만들지 말고, 거래소별 클라이언트를 한 번 만들어 마켓 정보와 함께 재사용하라."
+"""
+
+import threading
+
+_CLIENTS = {}
+_CLIENTS_LOCK = threading.Lock()
+
+def get_exchange_client(exchange_id: str = "bybit", sandbox: bool = False, api_key: str = None,
+                        secret: str = None, default_type: str = "future", load_markets: bool = True):
+    """
+    ✅ 장기 유지 ccxt 클라이언트 조회 (없으면 생성 후 보관)
+    """
+    key = (exchange_id, sandbox, api_key, default_type)
+    client = _CLIENTS.get(key)
+    if client is not None:
+        return client
+
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(key)
+        if client is None:
+            import ccxt
+
+            params = {
+                "enableRateLimit": True,
+                "options": {"defaultType": default_type},
+            }
+            if api_key:
+                params["apiKey"] = api_key
+                params["secret"] = secret
+            client = getattr(ccxt, exchange_id)(params)
+            if sandbox:
+                client.set_sandbox_mode(True)
+            if load_markets:
+                try:
+                    client.load_markets()
+                except Exception as e:
+                    print(f"⚠️ {exchange_id} 마켓 정보 로딩 실패 (첫 요청 시 재시도): {e}")
+            _CLIENTS[key] = client
+    return client
+
+def close_exchange_clients():
+    """
+    보관 중인 클라이언트 세션 정리
+    """
+    with _CLIENTS_LOCK:
+        for client in _CLIENTS.values():
+            close = getattr(client, "close", None)
+            if callable(close):
+                try:
+                    close()
+                except Exception:
+                    pass
+        _CLIENTS.clear()
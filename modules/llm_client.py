@@ -0,0 +1,237 @@
+# 📁 파일명: modules/llm_client.py
+"""
+📌 목적: Grok / OpenAI 등 LLM API 호출용 공용 HTTP 클라이언트
+📌 기능:
+  - LLMClient.chat(messages, model): chat/completions 호출 후 응답 텍스트 반환
+  - get_llm_client(provider): 프로바이더별 공용 클라이언트 ("grok", "openai")
+  - get_llm_stats(): 프로바이더별 호출 수 / 실패 수 / 지연(ms) / 회로 상태 조회
+📌 특징:
+  - keep-alive 세션 + 커넥션 풀 재사용 (매 호출 새 연결 X)
+  - 타임아웃·연결 오류·429·5xx는 지터 포함 지수 백오프로 제한 횟수 재시도
+  - 연속 실패 시 회로 차단기 OPEN → 일정 시간 즉시 실패(LLMUnavailableError), 이후 1회 시험 호출(HALF_OPEN)
+  - 모든 요청 예외·4xx·형식이 잘못된 응답도 LLMUnavailableError로 변환하고 회로 차단기 실패로 기록
+  - last_usage는 스레드별로 보관 (병렬 사이클에서 다른 호출의 토큰 사용량과 섞이지 않음), 통계는 락으로 갱신
+📌 작업 프롬프트 요약:
+  ▶ "LLM 호출마다 새 연결을 만들지 말고, 재시도와 회로 차단기를 갖춘 공용 클라이언트로 통일하며 호출 지연을 기록하라."
+"""
+
+import os
+import time
+import random
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from dotenv import load_dotenv
+
+load_dotenv()
+
+LLM_PROVIDERS = {
+    "grok": {
+        "url": "https://api.x.ai/v1/chat/completions",
+        "api_key_env": "GROK_API_KEY",
+    },
+    "openai": {
+        "url": "https://api.openai.com/v1/chat/completions",
+        "api_key_env": "OPENAI_API_KEY",
+    },
+}
+
+MAX_RETRIES = 3
+BACKOFF_BASE = 0.5         # 초, 시도마다 2배
+BACKOFF_MAX = 8.0
+FAILURE_THRESHOLD = 5      # 연속 실패 횟수 → 회로 OPEN
+RESET_TIMEOUT = 60         # OPEN 유지 시간 (초)
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class LLMUnavailableError(Exception):
+    """LLM 호출 실패 (재시도 소진 또는 회로 차단 중)"""
+
+
+class CircuitBreaker:
+    """
+    ✅ 연속 실패 기반 회로 차단기 (CLOSED → OPEN → HALF_OPEN → CLOSED)
+    """
+
+    def __init__(self, failure_threshold: int = FAILURE_THRESHOLD, reset_timeout: float = RESET_TIMEOUT):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "CLOSED"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "HALF_OPEN"
+        return "OPEN"
+
+    def allow(self) -> bool:
+        with self._lock:
+            state = self.state
+            if state == "HALF_OPEN":
+                # 시험 호출 1회만 통과시키고, 결과가 나올 때까지 다시 OPEN 취급
+                self.opened_at = time.monotonic()
+                return True
+            return state == "CLOSED"
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+
+def _extract_content(data) -> str:
+    """
+    chat/completions 응답에서 텍스트 추출 (형식 오류 시 ValueError)
+    """
+    try:
+        content = data["choices"][0]["message"]["content"]
+    except (KeyError, IndexError, TypeError) as e:
+        raise ValueError(f"응답 형식 오류: {e!r}")
+    if not isinstance(content, str):
+        raise ValueError(f"응답 내용이 문자열이 아님: {type(content).__name__}")
+    return content
+
+
+class LLMClient:
+    """
+    ✅ chat/completions 호환 API 공용 클라이언트
+    """
+
+    def __init__(self, name: str, url: str, api_key: str = None, timeout: float = 15,
+                 max_retries: int = MAX_RETRIES, pool_size: int = 4):
+        self.name = name
+        self.url = url
+        self.api_key = api_key
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.breaker = CircuitBreaker()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self.stats = {"calls": 0, "errors": 0, "retries": 0, "rejected": 0,
+                      "total_ms": 0.0, "max_ms": 0.0, "last_ms": 0.0}
+
+    @property
+    def last_usage(self) -> dict:
+        """
+        현재 스레드가 마지막으로 성공한 호출의 usage (다른 스레드 호출과 섞이지 않음)
+        """
+        return getattr(self._local, "usage", {})
+
+    def _count(self, key: str):
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def _backoff(self, attempt: int) -> float:
+        delay = min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt))
+        return random.uniform(0, delay)  # full jitter
+
+    def _record_latency(self, started: float):
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._stats_lock:
+            self.stats["calls"] += 1
+            self.stats["total_ms"] += elapsed_ms
+            self.stats["max_ms"] = max(self.stats["max_ms"], elapsed_ms)
+            self.stats["last_ms"] = elapsed_ms
+
+    def chat_completion(self, messages: list, model: str, timeout: float = None, **params) -> dict:
+        """
+        chat/completions 원본 JSON 응답 반환 (실패 시 LLMUnavailableError)
+        - choices[0].message.content가 문자열인 응답만 성공으로 취급
+        """
+        if not self.breaker.allow():
+            self._count("rejected")
+            raise LLMUnavailableError(f"{self.name} 회로 차단 중 (최근 연속 실패 {self.breaker.failures}회)")
+
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        payload = {"model": model, "messages": messages, **params}
+
+        started = time.perf_counter()
+        last_error = None
+        try:
+            for attempt in range(self.max_retries + 1):
+                if attempt:
+                    self._count("retries")
+                    time.sleep(self._backoff(attempt - 1))
+                try:
+                    response = self.session.post(self.url, headers=headers, json=payload,
+                                                 timeout=timeout or self.timeout)
+                except (requests.Timeout, requests.ConnectionError) as e:
+                    last_error = e
+                    continue
+                except requests.RequestException as e:
+                    # 잘못된 URL/헤더 등 재시도해도 같은 결과인 요청 오류
+                    last_error = e
+                    break
+                if response.status_code in RETRY_STATUS:
+                    last_error = requests.HTTPError(f"HTTP {response.status_code}", response=response)
+                    continue
+                try:
+                    response.raise_for_status()
+                    data = response.json()
+                    _extract_content(data)
+                except Exception as e:
+                    # 4xx(인증/요청 오류) 및 응답 형식 오류는 재시도해도 같은 결과
+                    last_error = e
+                    break
+                self.breaker.record_success()
+                self._local.usage = data.get("usage") or {}
+                return data
+        finally:
+            self._record_latency(started)
+
+        self._count("errors")
+        self.breaker.record_failure()
+        raise LLMUnavailableError(f"{self.name} 호출 실패: {last_error}")
+
+    def chat(self, messages: list, model: str, **params) -> str:
+        """
+        응답 텍스트만 반환
+        """
+        return _extract_content(self.chat_completion(messages, model, **params))
+
+    def get_stats(self) -> dict:
+        with self._stats_lock:
+            stats = dict(self.stats)
+        calls = stats["calls"]
+        return {
+            **stats,
+            "avg_ms": round(stats["total_ms"] / calls, 1) if calls else 0.0,
+            "circuit": self.breaker.state,
+        }
+
+
+_CLIENTS = {}
+_CLIENTS_LOCK = threading.Lock()
+
+def get_llm_client(provider: str = "grok") -> LLMClient:
+    """
+    프로바이더별 공용 LLMClient (최초 호출 시 생성)
+    """
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(provider)
+        if client is None:
+            config = LLM_PROVIDERS[provider]
+            client = LLMClient(provider, config["url"], os.getenv(config["api_key_env"]))
+            _CLIENTS[provider] = client
+        return client
+
+def get_llm_stats() -> dict:
+    return {name: client.get_stats() for name, client in _CLIENTS.items()}
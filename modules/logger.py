@@ -6,17 +6,19 @@
 # 📚 주요 함수:
 #     - log_trade_result(): 전략 결과 단건 로그 저장
 #     - log_daily_summary(): 일별 수익 요약 정리
-#     - save_json_log(): 시뮬레이션/실매매 결과 JSON 형태로 기록
+#     - save_json_log(): 시뮬레이션/실매매 결과를 거래 저널(utils/trade_journal)에 추가 기록
 # 💬 작업 프롬프트 요약:
 #     ▶ "전략 실행 시점, 수익률, 신호, 감정 분석 결과를 모두 로컬 로그 파일로 저장하고, 하루 단위 요약도 함께 생성하라."
 
 import os
-import json
 from datetime import datetime
 
+from utils.trade_journal import get_trade_journal
+
 TRADE_LOG_PATH = "logs/trade_log.txt"
 SUMMARY_PATH = "logs/daily_summary.txt"
-JSON_LOG_PATH = "logs/simulation/simulated_trades.json"
+JSON_LOG_PATH = "logs/simulation/simulated_trades.json"   # 기존 JSON 로그 (저널로 1회 이관됨)
+JOURNAL_SOURCE = "simulation"
 
 def log_trade_result(entry: dict, result: dict):
     os.makedirs("logs", exist_ok=True)
@@ -31,19 +33,8 @@ def log_daily_summary(entry: dict, balance: float):
         f.write(f"{today} | 전략: {entry['signal']} | 수익률: {entry['pnl']} | 누적 잔고: {balance}\n")
 
 def save_json_log(entry: dict):
-    os.makedirs(os.path.dirname(JSON_LOG_PATH), exist_ok=True)
-    try:
-        with open(JSON_LOG_PATH, "r", encoding="utf-8") as f:
-            logs = json.load(f)
-    except:
-        logs = []
-
     entry["timestamp"] = datetime.now().isoformat()
-    logs.append(entry)
-    logs = logs[-1000:]  # 최근 1000개만 유지
-
-    with open(JSON_LOG_PATH, "w", encoding="utf-8") as f:
-        json.dump(logs, f, indent=2, ensure_ascii=False)
+    get_trade_journal().append(entry, JOURNAL_SOURCE)
 
 # ✅ 예시
 if __name__ == "__main__":
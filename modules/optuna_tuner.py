@@ -11,36 +11,41 @@
 #     ▶ "과거 전략 수익률을 기준으로 take_profit, stop_loss 비율을 튜닝하라."
 
 import optuna
-import json
+import numpy as np
 
-def load_simulation_data():
-    with open("logs/simulation/simulated_trades.json", "r", encoding="utf-8") as f:
-        return json.load(f)
+from utils.log_archive import compact_logs, query_archive
+
+_SIMULATION_DATA = None
+
+def load_simulation_data(refresh: bool = False):
+    """
+    시뮬레이션 거래 아카이브에서 signal / profit 컬럼만 1회 로딩 (trial마다 다시 읽지 않음)
+    """
+    global _SIMULATION_DATA
+    if _SIMULATION_DATA is None or refresh:
+        compact_logs(["simulation"])
+        columns = query_archive("simulation", columns=["signal", "profit"], as_numpy=True)
+        # 기존 로직과 같이 "hold"만 제외 (signal 누락 기록은 거래로 집계)
+        traded = np.asarray(columns["signal"], dtype=object) != "hold"
+        _SIMULATION_DATA = np.nan_to_num(columns["profit"][traded].astype(float))
+    return _SIMULATION_DATA
 
 def objective(trial):
-    data = load_simulation_data()
+    profits = load_simulation_data()
     tp = trial.suggest_float("tp", 0.5, 3.0)
+    sl = trial.suggest_float("sl", 0.2, 2.0)
 
-    win = 0
-    loss = 0
-    for trade in data:
-        if trade["signal"] == "hold":
-            continue
-        simulated_profit = tp if trade["profit"] > 0 else -sl
-        if simulated_profit > 0:
-            win += 1
-        else:
-            loss += 1
-
-    total = win + loss
+    total = len(profits)
     if total == 0:
         return 0
+    win = int(np.count_nonzero(profits > 0))
     win_rate = win / total
     return (tp * win_rate) - (sl * (1 - win_rate))
 
 
 # Optuna 최적화 실행
 def optimize_strategy(n_trials=30):
+    load_simulation_data(refresh=True)
     study = optuna.create_study(direction="maximize")
     study.optimize(objective, n_trials=n_trials)
 
@@ -5,24 +5,25 @@
   - execute_bybit_testnet_trade(): 시그널에 따라 테스트 거래 실행
 📌 특징:
   - pybit 사용
+  - ccxt 클라이언트는 modules/exchange_client.py에서 재사용
   - .env의 BYBIT_API_KEY_TEST, BYBIT_API_SECRET_TEST 활용
 📌 작업 프롬프트 요약:
   ▶ "매수/매도 시그널을 받아 Bybit 테스트넷에 시장가 거래를 실행하는 함수를 구성하라."
 """
 
 def execute_bybit_test_trade(symbol: str, side: str, entry_price: float, take_profit: float, stop_loss: float):
-    import ccxt
     import os
     from dotenv import load_dotenv
+    from modules.exchange_client import get_exchange_client
 
     load_dotenv()
-    bybit = ccxt.bybit({
-        "apiKey": os.getenv("BYBIT_API_KEY_TESTNET"),
-        "secret": os.getenv("BYBIT_SECRET_TESTNET"),
-        "enableRateLimit": True,
-        "options": {"defaultType": "future"},
-    })
-    bybit.set_sandbox_mode(True)
+    # 호출마다 새 클라이언트를 만들지 않고 장기 유지 클라이언트 재사용 (마켓 정보 1회 로딩)
+    bybit = get_exchange_client(
+        "bybit",
+        sandbox=True,
+        api_key=os.getenv("BYBIT_API_KEY_TESTNET"),
+        secret=os.getenv("BYBIT_SECRET_TESTNET"),
+    )
 
     print(f"🛠️ Bybit 테스트넷 주문 실행 중: {side.upper()}")
 
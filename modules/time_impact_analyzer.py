@@ -1,62 +1,168 @@
 # 📁 파일명: modules/time_impact_analyzer.py
 # 🎯 목적: 시간대별 전략 성능(승률, 수익률 등)을 분석하여 최적 매매 시간 도출
 # 🔁 전체 흐름도:
-#     - 거래 로그를 시간(HH) 단위로 그룹화
-#     - 승률, 평균 수익률 등 산출
-#     - 시각화 또는 전략 판단 최적 시간대 추론에 활용
+#     - 거래 로그의 timestamp를 한 번에 파싱 (거래별 pd.to_datetime 호출 없음)
+#     - 시간(HH) × 요일 × 세션 × 심볼 기준 groupby 1회로 기본 집계표 생성
+#     - 시간대별 / 요일별 / 세션별 / 심볼별 요약은 작은 기본 집계표를 재집계해 산출
+#     - TimeImpactAccumulator로 새 거래만 집계표에 더해 증분 갱신 (대시보드용)
 # 🔧 주요 함수:
 #     - analyze_by_hour(): 시간대별 요약 통계 반환
+#     - analyze_time_impact(): 시간/요일/세션/심볼 중 원하는 기준의 요약 DataFrame
+#     - TimeImpactAccumulator: 증분 집계 (update / update_from_journal / summary / by_hour)
 # 💬 작업 프롬프트 요약:
 #     ▶ "하루 중 어느 시간대에 전략 성능이 좋은지 분석하라."
+#     ▶ "거래마다 반복하지 말고 timestamp를 한 번에 파싱해 한 번의 groupby로 집계하고, 새 거래만 증분 반영하라."
 
+import os
+import threading
+from datetime import datetime
+
+import numpy as np
 import pandas as pd
-from collections import defaultdict
-from typing import List, Dict
+from typing import List, Dict, Union
+
+from utils.log_archive import parse_timestamps
+
+GROUP_KEYS = ["hour", "weekday", "session", "symbol"]
+SUM_COLUMNS = ["trade_count", "wins", "losses", "total_profit"]
+
+# 로그 시각은 기록한 호스트의 로컬 시각(datetime.now()) → 세션은 UTC 시각으로 구분
+# 기본값은 현재 호스트의 UTC 오프셋, 다른 호스트에서 기록한 로그를 분석할 때는 환경변수로 지정 (예: 9)
+LOG_UTC_OFFSET_HOURS = float(os.getenv("LOG_UTC_OFFSET_HOURS",
+                                       datetime.now().astimezone().utcoffset().total_seconds() / 3600))
+# UTC 시작 시각 → 세션 (다음 시작 시각 전까지)
+SESSIONS = ((0, "asia"), (8, "europe"), (13, "us"), (21, "asia"))
+_SESSION_BY_UTC_HOUR = np.array([
+    next(name for start, name in reversed(SESSIONS) if hour >= start) for hour in range(24)
+], dtype=object)
+UNKNOWN_SYMBOL = "unknown"
+
+
+def _utc_hours(hours: np.ndarray, minutes: np.ndarray) -> np.ndarray:
+    # 로컬 시/분 → UTC 시 (30분 단위 오프셋 시간대 포함)
+    offset_minutes = int(round(LOG_UTC_OFFSET_HOURS * 60))
+    return ((hours * 60 + minutes - offset_minutes) // 60) % 24
+
+def _grouped(trade_logs: Union[List[Dict], pd.DataFrame], fill_result: bool = False) -> pd.DataFrame:
+    """
+    거래 로그 → (hour, weekday, session, symbol) 기본 집계표 (합계 컬럼만)
+    - fill_result=True: result 없는 거래는 profit 부호로 WIN/LOSS 판정 (trade_result_parser와 동일 기준)
+    """
+    df = trade_logs if isinstance(trade_logs, pd.DataFrame) else pd.DataFrame.from_records(trade_logs)
+    if df.empty or "timestamp" not in df:
+        return pd.DataFrame(columns=SUM_COLUMNS, index=pd.MultiIndex.from_arrays([[]] * 4, names=GROUP_KEYS))
+
+    times = df["timestamp"]
+    if not pd.api.types.is_datetime64_any_dtype(times):
+        times = parse_timestamps(times.astype(object))
+    valid = times.notna().to_numpy()
+    times = times[valid]
+    hours = times.dt.hour.to_numpy()
+
+    n = len(df)
+    result = (df["result"] if "result" in df else pd.Series([""] * n, index=df.index))[valid]
+    result = result.fillna("").astype(str)
+    profit = (df["profit"] if "profit" in df else pd.Series([0.0] * n, index=df.index))[valid]
+    profit = pd.to_numeric(profit, errors="coerce").fillna(0.0)
+    if fill_result:
+        derived = np.select([profit > 0, profit < 0], ["✅ WIN", "❌ LOSS"], "⚪ HOLD")
+        result = result.where(result != "", pd.Series(derived, index=result.index))
+    symbol = (df["symbol"] if "symbol" in df else pd.Series([None] * n, index=df.index))[valid]
+
+    frame = pd.DataFrame({
+        "hour": hours,
+        "weekday": times.dt.weekday.to_numpy(),
+        "session": _SESSION_BY_UTC_HOUR[_utc_hours(hours, times.dt.minute.to_numpy())],
+        "symbol": symbol.fillna(UNKNOWN_SYMBOL).astype(str).to_numpy(),
+        "trade_count": 1,
+        "wins": result.str.contains("WIN", regex=False).to_numpy().astype(np.int64),
+        "losses": result.str.contains("LOSS", regex=False).to_numpy().astype(np.int64),
+        "total_profit": profit.to_numpy(),
+    })
+    return frame.groupby(GROUP_KEYS, sort=False)[SUM_COLUMNS].sum()
 
-def analyze_by_hour(trade_logs: List[Dict]) -> Dict[int, Dict]:
+def _summarize(grouped: pd.DataFrame, by) -> pd.DataFrame:
+    """
+    기본 집계표 → by 기준 재집계 + 승률 / 평균 수익
+    """
+    by = [by] if isinstance(by, str) else list(by)
+    summary = grouped.groupby(level=by).sum() if len(grouped) else grouped.droplevel(
+        [key for key in GROUP_KEYS if key not in by])
+    summary = summary.astype({"trade_count": np.int64, "wins": np.int64, "losses": np.int64, "total_profit": float})
+    count = summary["trade_count"].replace(0, np.nan)
+    summary["win_rate"] = (summary["wins"] / count).fillna(0.0).round(3)
+    summary["avg_profit"] = (summary["total_profit"] / count).fillna(0.0).round(2)
+    return summary.sort_index()
+
+def _hour_dict(summary: pd.DataFrame) -> Dict[int, Dict]:
+    return {
+        int(hour): {"win_rate": float(row.win_rate), "trade_count": int(row.trade_count),
+                    "avg_profit": float(row.avg_profit)}
+        for hour, row in summary.iterrows()
+    }
+
+def analyze_time_impact(trade_logs: Union[List[Dict], pd.DataFrame], by=("hour",)) -> pd.DataFrame:
+    """
+    시간(hour) / 요일(weekday, 0=월) / 세션(session) / 심볼(symbol) 중 by 기준 성능 요약
+
+    Returns:
+        pd.DataFrame: index=by, columns=[trade_count, wins, losses, total_profit, win_rate, avg_profit]
+    """
+    return _summarize(_grouped(trade_logs), by)
+
+def analyze_by_hour(trade_logs: Union[List[Dict], pd.DataFrame]) -> Dict[int, Dict]:
     """
     거래 기록을 시간대별로 분석하여 전략 성능 통계를 반환합니다.
 
     Args:
-        trade_logs (List[Dict]): 전략 실행 로그
+        trade_logs (List[Dict] | pd.DataFrame): 전략 실행 로그
             예: [{"timestamp": "2025-04-14T02:15:00", "result": "✅ WIN", "profit": 42.5}, ...]
 
     Returns:
         Dict[int, Dict]: 시간(HH)별 성능 요약 {hour: {"win_rate": float, "avg_profit": float, "trade_count": int}}
     """
-    hourly_stats = defaultdict(lambda: {"wins": 0, "losses": 0, "count": 0, "total_profit": 0.0})
+    return _hour_dict(analyze_time_impact(trade_logs, "hour"))
 
-    for trade in trade_logs:
-        time_str = trade.get("timestamp")
-        try:
-            hour = pd.to_datetime(time_str).hour
-        except Exception:
-            continue
 
-        result = trade.get("result", "")
-        profit = trade.get("profit", 0.0)
+class TimeImpactAccumulator:
+    """
+    ✅ 증분 시간대 성능 집계
+    - update(trades): 새 거래만 groupby 후 기본 집계표에 더함 (기존 거래 재파싱 없음)
+    - update_from_journal(source): 거래 저널에서 마지막으로 읽은 id 이후 기록만 반영 (result 누락은 profit으로 판정)
+    """
+
+    def __init__(self):
+        self.grouped = _grouped([])
+        self.last_id = 0
+        self._lock = threading.RLock()
 
-        hourly_stats[hour]["count"] += 1
-        hourly_stats[hour]["total_profit"] += profit
+    def update(self, trade_logs: Union[List[Dict], pd.DataFrame], fill_result: bool = False) -> int:
+        new = _grouped(trade_logs, fill_result)
+        if len(new):
+            with self._lock:
+                self.grouped = new if not len(self.grouped) else self.grouped.add(new, fill_value=0)
+        return int(new["trade_count"].sum()) if len(new) else 0
 
-        if "WIN" in result:
-            hourly_stats[hour]["wins"] += 1
-        elif "LOSS" in result:
-            hourly_stats[hour]["losses"] += 1
+    def update_from_journal(self, source: str = "simulation", chunk: int = 50_000) -> int:
+        from utils.trade_journal import get_trade_journal
 
-    summary = {}
-    for hour, stats in hourly_stats.items():
-        count = stats["count"]
-        winrate = stats["wins"] / count if count > 0 else 0.0
-        avg_profit = stats["total_profit"] / count if count > 0 else 0.0
+        journal = get_trade_journal()
+        added = 0
+        with self._lock:   # 동시 갱신 시 같은 기록을 두 번 더하지 않도록 커서와 함께 잠금
+            while True:
+                rows = journal.rows_after(self.last_id, source, chunk)
+                if not rows:
+                    return added
+                added += self.update([entry for _, entry in rows], fill_result=True)
+                self.last_id = rows[-1][0]
 
-        summary[hour] = {
-            "win_rate": round(winrate, 3),
-            "trade_count": count,
-            "avg_profit": round(avg_profit, 2)
-        }
+    def summary(self, by=("hour",)) -> pd.DataFrame:
+        with self._lock:
+            grouped = self.grouped
+        return _summarize(grouped, by)
 
-    return summary
+    def by_hour(self) -> Dict[int, Dict]:
+        return _hour_dict(self.summary("hour"))
 
 
 # ✅ 예시 사용
@@ -66,4 +172,6 @@ if __name__ == "__main__":
         {"timestamp": "2025-04-14T02:45:00", "result": "❌ LOSS", "profit": -20.0},
         {"timestamp": "2025-04-14T14:00:00", "result": "✅ WIN", "profit": 70.0},
     ]
-    result
+    result = analyze_by_hour(sample_logs)
+    for hour, stats in result.items():
+        print(f"{hour:02d}시 ➤ 승률: {stats['win_rate']*100:.1f}%, 거래 수: {stats['trade_count']}, 평균 수익: {stats['avg_profit']}")
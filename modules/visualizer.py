@@ -4,6 +4,8 @@
 import matplotlib.pyplot as plt
 import pandas as pd
 
+from utils.log_archive import parse_timestamps
+
 def plot_sentiment_trend(data: list):
     df = pd.DataFrame(data)
     df['time'] = pd.to_datetime(df['time'])
@@ -58,7 +60,8 @@ def plot_indicators(data: list):
     import matplotlib.pyplot as plt
 
     df = pd.DataFrame(data)
-    df['time'] = pd.to_datetime(df['time'])
+    # 거래 저널 기록은 timestamp, 기존 JSON 로그는 time 필드 사용
+    df['time'] = parse_timestamps((df['time'] if 'time' in df else df['timestamp']).astype(object))
 
     fig, axs = plt.subplots(2, 1, figsize=(10, 6), sharex=True)
 
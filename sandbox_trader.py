@@ -1,90 +1,110 @@
 # 📁 파일명: sandbox_trader.py
 # 🎯 목적: Grok + 딥러닝 + 커뮤니티 기반 전략 테스트 및 시뮬레이션
-# 🔄 15분 루프 실행 구조로, 실제 매매 대신 로그/시뮬레이션 기반 전략을 기록
+# 🔄 15분봉 마감에 맞춰 실행(CandleScheduler), 실제 매매 대신 로그/시뮬레이션 기반 전략을 기록
+#    config.json의 symbols 전체를 병렬 평가 (뉴스/감정은 사이클당 1회 공유)
 # 💬 프롬프트:
 #     ▶ "현재 지표와 뉴스 감정 기반으로 전략을 판단하고, 보완 전략 및 딥러닝 보조, 커뮤니티 반응까지 종합하여 매매 시뮬레이션을 실행하라."
 
-import time
+import asyncio
 from datetime import datetime
 
-from utils.indicators import get_indicators
+from utils.cycle_runner import run_multi_symbol_cycle, shutdown_process_pool
+from utils.candle_scheduler import CandleScheduler
 from utils.news_fetcher import fetch_news
-from utils.sentiment import analyze_news
-from utils.strategy_analyzer import (
-    analyze_strategy,
-    analyze_strategy_with_context,
-    apply_model_correction,
-    apply_community_adjustment
-)
-from utils.trade_simulator import simulate_trade, record_trade_log, record_daily_summary
-from modules.grok_bridge import query_grok
+from utils.trade_simulator import simulate_trade, record_trade_log, record_daily_summary, get_simulation_stats
 from modules.telegram_notifier import notify_trade_result, notify_system_event  # ← 시스템용 함수 포함
+from modules.community_sentiment import COMMUNITY_MODEL
+from modules.config_loader import get_symbols
+from utils.sentiment_service import warm_up
+from models.model_registry import warm_up_models, get_model_stats
 
-INTERVAL_MINUTES = 15
+SYMBOLS = get_symbols()
+TIMEFRAMES = ("15m", "1h", "4h")   # 봉 마감 경계 (사이클은 가장 짧은 15m마다 실행)
+PREFETCH_LEAD_SECONDS = 60         # 마감 1분 전 뉴스 피드 선행 조회 (사이클에서는 조건부 GET 캐시 적중)
+
+# 단계 오류 → 텔레그램 알림 제목 (지표/뉴스 등 나머지는 기본값으로 계속 진행)
+STAGE_ALERTS = {
+    "grok": ("Grok 호출 실패", "Grok 호출 실패"),
+    "model": ("딥러닝 예측 실패", "딥러닝 예측 오류"),
+}
+
+def process_symbol(outcome: dict):
+    symbol, core = outcome["symbol"], outcome["core"]
+
+    for stage, error in outcome["errors"].items():
+        title, label = STAGE_ALERTS.get(stage, (f"{stage} 단계 실패", f"{stage} 단계 오류"))
+        error_msg = f"[{symbol}] {label}: {error}"
+        print(f"⚠️ {error_msg}")
+        if stage in STAGE_ALERTS:
+            notify_system_event(title, error_msg)
+
+    if core is None:
+        return
+
+    print(f"📩 [{symbol}] AI 응답: {outcome['ai_response']}")
+    print(f"🧠 [{symbol}] 판단 요약: {outcome['summary']}")
+    print(f"📊 [{symbol}] 최종 전략: {core}")
+    print(f"⏱️ [{symbol}] 단계별 소요(초): {outcome['timings']}")
+
+    if core["signal"] in ["long", "short"]:
+        profit = simulate_trade(core["signal"], core["entry_price"], core["tp"], core["sl"])
+        core["profit"] = profit
+        record_trade_log(core)
+        record_daily_summary()
+        print(f"💰 [{symbol}] 매매 시뮬레이션 기록됨 | 수익: {profit:.2f}")
+
+        notify_trade_result(core, {
+            "result": "SIMULATED",
+            "pnl": profit,
+            "balance": f"{get_simulation_stats()['balance']:,.2f}"
+        })
+
+    else:
+        print(f"⏸️ [{symbol}] 전략 HOLD → 매매 미실행")
+
+
+def run_cycle(tick):
+    print(f"\n🕒 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} 전략 실행 시작 | {tick.label} 봉 마감 ({', '.join(tick.timeframes)}) "
+          f"| 마감 후 {tick.latency:.1f}초 | {', '.join(SYMBOLS)} -----------------------------")
 
-while True:
-    print(f"\n🕒 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} 전략 실행 시작 -----------------------------")
-    
     try:
-        indicators = get_indicators("BTC/USDT", "15m")
-        news_list = fetch_news()
-        sentiment_score = analyze_news(news_list) if news_list else 0.35
-
-        prompt = f"""
-        Technical Indicators:
-        RSI: {indicators['rsi']}, BB: {indicators['bb']}, EMA: {indicators['ema']}, TEMA: {indicators['tema']}, MACD: {indicators['macd']}
-        Market Sentiment: {sentiment_score}
-        Should we go LONG, SHORT, or HOLD?
-        """
-        try:
-            ai_response = query_grok(prompt)
-        except Exception as e:
-            error_msg = f"Grok 호출 실패: {e}"
-            print(f"⚠️ {error_msg}")
-            notify_system_event("Grok 호출 실패", error_msg)
-            ai_response = "HOLD"
-
-        core, summary = analyze_strategy(ai_response, indicators, sentiment_score)
-        print(f"📩 AI 응답: {ai_response}")
-        print(f"📊 전략 판단 결과: {core}")
-        print(f"🧠 판단 요약: {summary}")
-
-        if core["signal"] == "hold":
-            print("🤔 HOLD → 보완 전략 실행 중...")
-            fallback_core = analyze_strategy_with_context(sentiment_score)
-            print(f"📈 보완 전략 결과: {fallback_core}")
-            core = fallback_core
-
-        try:
-            core["signal"] = apply_model_correction(core["signal"], indicators, sentiment_score)
-        except Exception as e:
-            error_msg = f"딥러닝 예측 오류: {e}"
-            print(f"⚠️ {error_msg}")
-            notify_system_event("딥러닝 예측 실패", error_msg)
-            core["signal"] = "hold"
-
-        core["signal"] = apply_community_adjustment(core["signal"])
-
-        if core["signal"] in ["long", "short"]:
-            profit = simulate_trade(core["signal"], core["entry_price"], core["tp"], core["sl"])
-            core["profit"] = profit
-            record_trade_log(core)
-            record_daily_summary()
-            print(f"💰 매매 시뮬레이션 기록됨 | 수익: {profit:.2f}")
-
-            notify_trade_result(core, {
-                "result": "SIMULATED",
-                "pnl": profit,
-                "balance": "N/A"
-            })
-
-        else:
-            print("⏸️ 전략 HOLD → 매매 미실행")
+        # 심볼별 캔들 / 지표(프로세스 풀) / Grok / 딥러닝 / 커뮤니티 + 공유 뉴스→감정 단계를 동시에 실행
+        cycle = asyncio.run(run_multi_symbol_cycle(SYMBOLS, "15m"))
+        for stage, error in cycle["errors"].items():
+            print(f"⚠️ 공유 단계 {stage} 오류: {error} → 기본값 사용")
+            if stage in STAGE_ALERTS:
+                title, label = STAGE_ALERTS[stage]
+                notify_system_event(title, f"{label}: {error} (전 심볼 HOLD)")
+        print(f"📰 공유 감정 점수: {cycle['sentiment']} | 소요(초): {cycle['timings']}")
+
+        for symbol in SYMBOLS:
+            process_symbol(cycle["symbols"][symbol])
+        print(f"🧠 모델 통계: {get_model_stats()}")
 
     except Exception as e:
         error_msg = f"❌ 전체 오류 발생: {e}"
         print(error_msg)
         notify_system_event("전체 시스템 오류", error_msg)
 
-    print(f"⏳ 다음 실행까지 {INTERVAL_MINUTES}분 대기...\n")
-    time.sleep(INTERVAL_MINUTES * 60)
\ No newline at end of file
+
+def prefetch_news(tick):
+    fetch_news()
+
+
+def notify_overrun(tick, missed):
+    notify_system_event("사이클 지연", f"{tick.label} 봉 사이클 {tick.duration:.1f}초 소요 → 마감 경계 {missed}개 초과")
+
+
+# 지표 프로세스 풀(spawn)이 이 파일을 다시 import해도 루프가 실행되지 않도록 main 가드
+if __name__ == "__main__":
+    # 커뮤니티 감정 모델은 매 사이클 사용되므로 루프 시작 전에 미리 로딩
+    warm_up((COMMUNITY_MODEL,))
+    # 딥러닝 모델도 1회 로딩 후 상주 (파일 변경 시 자동 재로딩)
+    warm_up_models()
+
+    scheduler = CandleScheduler(TIMEFRAMES, lead_seconds=PREFETCH_LEAD_SECONDS, overrun_policy="coalesce",
+                                on_overrun=notify_overrun)
+    try:
+        scheduler.run(run_cycle, prefetch=prefetch_news)
+    finally:
+        shutdown_process_pool()
@@ -1,16 +1,18 @@
 # 📁 파일명: analyze_time_performance.py
-# 🎯 목적: 정제된 로그 기반 시간대별 전략 성능 분석 결과 콘솔에 출력
+# 🎯 목적: 시뮬레이션 거래 아카이브(Parquet) 기반 시간대별 전략 성능 분석 결과 콘솔에 출력
+#     - 실행 시 거래 저널의 신규 기록만 아카이브로 증분 압축 후, 필요한 컬럼만 조회
 
-import json
 from modules.time_impact_analyzer import analyze_by_hour
+from utils.log_archive import compact_logs, query_archive
 
-def load_logs(path: str):
-    with open(path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+def load_logs(since: str = None, until: str = None, symbols=None):
+    trades = query_archive("simulation", columns=["timestamp", "result", "profit"],
+                           since=since, until=until, symbols=symbols)
+    return trades
 
 if __name__ == "__main__":
-    log_path = "logs/simulation/simulated_trades_cleaned.json"
-    logs = load_logs(log_path)
+    compact_logs(["simulation"])
+    logs = load_logs()
 
     summary = analyze_by_hour(logs)
 
@@ -1,8 +1,11 @@
 # 📁 파일명: evaluate_strategy_accuracy.py
 # 🎯 목적: 예측된 신호와 실제 결과를 비교해 전략 판단 성능 수치 계산
+#     - 시뮬레이션 거래 아카이브(Parquet)에서 signal / result 컬럼만 읽어 벡터 연산으로 라벨 변환
+
+import numpy as np
 
-import json
 from modules.model_evaluator import evaluate_strategy_performance
+from utils.log_archive import compact_logs, query_archive
 
 def convert_to_label(signal: str) -> int:
     return 1 if signal == "long" else 0
@@ -10,18 +13,18 @@ def convert_to_label(signal: str) -> int:
 def convert_to_actual(result: str) -> int:
     return 1 if "WIN" in result else 0
 
-if __name__ == "__main__":
-    path = "logs/simulation/simulated_trades_cleaned.json"
-    with open(path, 'r', encoding='utf-8') as f:
-        logs = json.load(f)
-
-    predictions = []
-    actuals = []
+def load_labels(since: str = None, until: str = None, symbols=None):
+    columns = query_archive("simulation", columns=["signal", "result"], since=since, until=until,
+                            symbols=symbols, as_numpy=True)
+    signals, results = columns["signal"], columns["result"]
+    valid = np.array([s is not None for s in signals], dtype=bool) & np.array([r is not None for r in results], dtype=bool)
+    predictions = (signals[valid] == "long").astype(int)
+    actuals = np.char.find(results[valid].astype(str), "WIN") >= 0
+    return predictions.tolist(), actuals.astype(int).tolist()
 
-    for log in logs:
-        if "signal" in log and "result" in log:
-            predictions.append(convert_to_label(log["signal"]))
-            actuals.append(convert_to_actual(log["result"]))
+if __name__ == "__main__":
+    compact_logs(["simulation"])
+    predictions, actuals = load_labels()
 
     metrics = evaluate_strategy_performance(predictions, actuals)
 
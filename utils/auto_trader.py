@@ -1,22 +1,18 @@
 # utils/auto_trader.py
-import json
 import os
 from datetime import datetime
 import pandas as pd
 
-SIMULATION_LOG_PATH = "simulated_trades.json"
+from utils.trade_journal import get_trade_journal, get_trade_stats
+
+SIMULATION_LOG_PATH = "simulated_trades.json"   # 기존 JSON 로그 (저널로 1회 이관됨)
+JOURNAL_SOURCE = "auto_trader"
 DAILY_SUMMARY_PATH = "logs/daily_summaries"
 INITIAL_BALANCE = 10000
 
-def load_trade_log():
-    if not os.path.exists(SIMULATION_LOG_PATH):
-        return []
-    with open(SIMULATION_LOG_PATH, "r", encoding="utf-8") as f:
-        try:
-            return json.load(f)
-        except (json.JSONDecodeError, ValueError):
-            print("거래 로그 파일이 손상되었습니다. 새 로그 파일을 생성합니다.")
-            return []
+def load_trade_log(limit: int = None):
+    journal = get_trade_journal()
+    return journal.tail(limit, JOURNAL_SOURCE) if limit else journal.query(JOURNAL_SOURCE)
 
 # 기존 전략 판단
 strategy_result = run_strategy()
@@ -45,21 +41,15 @@ def save_trade_log(entry: dict):
         if isinstance(value, pd.Series):
             entry[key] = value.iloc[-1] if not value.empty else 0
     entry["timestamp"] = datetime.now().isoformat()
-    
-    logs = load_trade_log()
-    logs.append(entry)
-    logs = logs[-1000:]  # 최근 1000개만 유지
-    with open(SIMULATION_LOG_PATH, "w", encoding="utf-8") as f:
-        json.dump(logs, f, indent=2, ensure_ascii=False)
+    get_trade_journal().append(entry, JOURNAL_SOURCE)
 
 def save_daily_summary(entry: dict):
     os.makedirs(DAILY_SUMMARY_PATH, exist_ok=True)
     today = datetime.now().strftime("%Y-%m-%d")
     summary_path = os.path.join(DAILY_SUMMARY_PATH, f"{today}.txt")
     
-    logs = load_trade_log()
-    balance = INITIAL_BALANCE + sum(trade["profit"] for trade in logs)
-    
+    balance = get_trade_stats(JOURNAL_SOURCE, INITIAL_BALANCE)["balance"]
+
     with open(summary_path, "a", encoding="utf-8") as f:
         f.write(f"[{entry['timestamp']}] {entry['signal']} - 수익: ${entry['profit']:.2f}\n")
         f.write(f"시뮬레이션 잔고: ${balance:.2f}\n")
@@ -90,7 +80,7 @@ def execute_strategy(entry: dict, price: float):
     print(msg)
 
 def get_current_position(current_price: float):
-    logs = load_trade_log()
+    logs = load_trade_log(limit=1)
     if not logs:
         return {"status": "없음", "entry_price": 0, "profit": 0}
     
@@ -105,5 +95,4 @@ def get_current_position(current_price: float):
     return {"status": "없음", "entry_price": 0, "profit": 0}
 
 def get_trade_history(limit: int = 10):
-    logs = load_trade_log()
-    return logs[-limit:]
\ No newline at end of file
+    return load_trade_log(limit=limit)
\ No newline at end of file
@@ -0,0 +1,307 @@
+# 📁 파일명: utils/backtester.py
+"""
+📌 목적: 저장된 캔들 배열을 재생하며 신호별 TP/SL 도달 여부를 이후 고가/저가로 판정하는 NumPy 벡터화 백테스터
+📌 기능:
+  - run_backtest(ts, ohlcv, signals, tp, sl, ...): 캔들 1종목 백테스트 → 거래별 DataFrame
+  - backtest_symbols(symbols, strategy, timeframe): CandleStore 전체 이력으로 여러 심볼 병렬 백테스트
+  - summarize_backtest(trades): 거래 수, 승률, 누적 수익, 최대 낙폭, 청산 사유별 건수
+  - to_trade_log(trades): sandbox 시뮬레이션과 같은 거래 로그 entry 목록 (signal/tp/sl/entry_price/profit/result ...)
+  - record_backtest(trades, source): 거래 저널에 일괄 기록 (source="backtest", 누적 집계/아카이브 도구 재사용)
+  - rsi_reversal_strategy(): 전략 변형 예시 (ts, ohlcv) → 신호 배열
+📌 체결 규칙:
+  - 신호 봉 종가(entry="close") 또는 다음 봉 시가(entry="next_open")에 진입, 이후 봉의 고가/저가로 TP/SL 판정
+  - 같은 봉에서 TP와 SL이 모두 닿으면 SL 우선 (보수적)
+  - TP는 지정가 (시가가 TP를 넘어 갭 발생 시 시가 체결), 진입 / 손절 / 시간 청산은 시장가 (슬리피지 적용, 손절 갭은 시가 체결)
+  - 레버리지 청산가가 SL보다 가까우면 청산가에서 종료 (손실 -100% 제한)
+  - 수익(profit)은 simulate_trade()와 같은 단위 (진입가 1단위 증거금 기준 손익), pnl_pct는 증거금 대비 %
+  - 수수료(fee)도 profit과 같은 단위 (레버리지 포지션 왕복 수수료, profit에 이미 차감됨)
+  - 수수료 / 슬리피지 / 레버리지 / 최대 보유 봉 수 기본값은 config.json
+    (fee_percentage, slippage_percentage, leverage, take_profit_percentage, stop_loss_percentage, max_hold_bars)
+📌 벡터화 방식:
+  - 모든 미청산 신호를 (신호 × 구간 폭) 인덱스 행렬로 한 번에 비교, 구간 폭을 2배씩 늘려가며 청산된 신호는 제외
+    → 연산량이 신호 수 × 실제 보유 봉 수에 비례 (최대 보유 기간 전체를 매번 훑지 않음)
+📌 작업 프롬프트 요약:
+  ▶ "가격 경로를 보지 않는 simulate_trade() 대신, 캔들 배열을 재생하며 TP/SL을 이후 고가/저가로 판정하고 수수료·슬리피지·레버리지를 반영하는 벡터화 백테스터를 만들어라."
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from modules.config_loader import load_config
+from utils.candle_store import get_candle_store
+from utils.indicators import calculate_rsi
+from utils.trade_journal import get_trade_journal
+
+OPEN, HIGH, LOW, CLOSE, VOLUME = range(5)
+SIGNAL_CODES = {"long": 1, "short": -1, "hold": 0}
+FIRST_BLOCK = 16                  # 첫 탐색 구간 폭 (봉), 이후 2배씩 확장
+MAX_WINDOW_ELEMENTS = 4_000_000   # (신호 × 구간 폭) 행렬 최대 원소 수 (메모리 상한)
+BACKTEST_SOURCE = "backtest"
+EXIT_REASONS = ["tp", "sl", "liquidation", "timeout", "end"]
+RESULTS = ["✅ WIN", "❌ LOSS", "⚪ HOLD"]
+_NO_HIT = np.iinfo(np.int64).max
+DEFAULT_MAX_HOLD_BARS = 96        # config.json에 max_hold_bars가 없을 때 (15분봉 기준 24시간)
+TRADE_COLUMNS = ["symbol", "signal", "entry_idx", "exit_idx", "timestamp", "exit_timestamp", "entry_price",
+                 "exit_price", "tp", "sl", "leverage", "exit_reason", "bars_held", "fee", "pnl_pct", "profit", "result"]
+
+
+def get_backtest_config(path: str = "config.json") -> dict:
+    """
+    config.json → 백테스트 기본값 (%, 레버리지 배수)
+    """
+    config = load_config(path)
+    return {
+        "tp": float(config.get("take_profit_percentage", 1.0)),
+        "sl": float(config.get("stop_loss_percentage", 0.5)),
+        "leverage": float(config.get("leverage", 1)),
+        "fee": float(config.get("fee_percentage", 0.0)),
+        "slippage": float(config.get("slippage_percentage", 0.0)),
+        "max_hold_bars": int(config.get("max_hold_bars", DEFAULT_MAX_HOLD_BARS)),
+    }
+
+def _signal_codes(signals) -> np.ndarray:
+    signals = np.asarray(signals)
+    if signals.dtype.kind in "OUS":
+        codes = np.zeros(len(signals), dtype=np.int8)
+        for name, code in SIGNAL_CODES.items():
+            codes[signals == name] = code
+        return codes
+    return np.sign(np.nan_to_num(signals.astype(float))).astype(np.int8)
+
+def _per_signal(value, default: float, bars: np.ndarray) -> np.ndarray:
+    """
+    스칼라 또는 봉별 배열 → 신호 봉 값 (NaN / 0 / 음수 부호는 기본값 / 절댓값 처리)
+    """
+    if value is None:
+        return np.full(len(bars), default, dtype=float)
+    value = np.asarray(value, dtype=float)
+    picked = np.abs(value[bars] if value.ndim else np.full(len(bars), float(value)))
+    return np.where(np.isfinite(picked) & (picked > 0), picked, default)
+
+def _first_crossings(high: np.ndarray, low: np.ndarray, starts: np.ndarray, ends: np.ndarray,
+                     upper: np.ndarray, lower: np.ndarray) -> tuple:
+    """
+    신호별 [starts, ends) 구간에서 high >= upper, low <= lower가 처음 발생한 봉 번호 (없으면 _NO_HIT)
+    - 구간 폭을 FIRST_BLOCK부터 2배씩 늘리며 미판정 신호만 계속 탐색
+    """
+    n = len(high)
+    up_hit = np.full(len(starts), _NO_HIT, dtype=np.int64)
+    down_hit = np.full(len(starts), _NO_HIT, dtype=np.int64)
+    pending = np.flatnonzero(starts < ends)
+    offset, width = 0, FIRST_BLOCK
+
+    while pending.size:
+        step = max(1, MAX_WINDOW_ELEMENTS // width)
+        done = np.zeros(pending.size, dtype=bool)
+        for lo in range(0, pending.size, step):
+            part = pending[lo:lo + step]
+            first = starts[part] + offset
+            idx = first[:, None] + np.arange(width)
+            inside = idx < ends[part, None]
+            np.minimum(idx, n - 1, out=idx)
+
+            up = (high[idx] >= upper[part, None]) & inside
+            down = (low[idx] <= lower[part, None]) & inside
+            any_up, any_down = up.any(axis=1), down.any(axis=1)
+            up_hit[part[any_up]] = first[any_up] + up[any_up].argmax(axis=1)
+            down_hit[part[any_down]] = first[any_down] + down[any_down].argmax(axis=1)
+            done[lo:lo + step] = any_up | any_down | (first + width >= ends[part])
+
+        pending = pending[~done]
+        offset += width
+        width *= 2
+    return up_hit, down_hit
+
+def run_backtest(ts, ohlcv, signals, tp=None, sl=None, leverage: float = None, fee: float = None,
+                 slippage: float = None, max_hold_bars: int = None, entry: str = "close",
+                 allow_overlap: bool = True, symbol: str = None, config: dict = None) -> pd.DataFrame:
+    """
+    ✅ 캔들 1종목 백테스트
+    - ts: 캔들 시작 시각 (epoch ms), ohlcv: (봉, 5) open/high/low/close/volume (CandleStore.window_arrays() 형식)
+    - signals: 봉별 신호 (1/-1/0 또는 "long"/"short"/"hold"), 봉 마감 시점에 확정된 신호
+    - tp / sl: % (스칼라 또는 봉별 배열, 0/NaN이면 config 기본값), leverage / fee / slippage 미지정 시 config.json
+    - max_hold_bars: 최대 보유 봉 수 (초과 시 종가 청산, None이면 config 기본값, 0이면 데이터 끝까지)
+    - allow_overlap=False: 보유 중 발생한 신호는 무시 (심볼당 포지션 1개)
+    - 반환: 거래별 DataFrame (진입 순)
+    """
+    defaults = config or get_backtest_config()
+    leverage = float(defaults["leverage"] if leverage is None else leverage)
+    fee = float(defaults["fee"] if fee is None else fee) / 100
+    slip = float(defaults["slippage"] if slippage is None else slippage) / 100
+
+    ts = np.asarray(ts, dtype=np.int64)
+    ohlcv = np.asarray(ohlcv, dtype=float)
+    n = len(ts)
+    codes = _signal_codes(signals)[:n]
+    bars = np.flatnonzero(codes)
+    bars = bars[bars + 1 < n]   # 마지막 봉 신호는 판정할 이후 봉이 없음
+    if not bars.size:
+        return pd.DataFrame(columns=TRADE_COLUMNS)
+
+    direction = codes[bars].astype(float)
+    tp_pct = _per_signal(tp, defaults["tp"], bars)
+    sl_pct = _per_signal(sl, defaults["sl"], bars)
+    liq_pct = 100.0 / leverage if leverage > 0 else np.inf
+    liquidated = sl_pct >= liq_pct
+    stop_pct = np.where(liquidated, liq_pct, sl_pct)
+
+    opens, highs, lows, closes = ohlcv[:, OPEN], ohlcv[:, HIGH], ohlcv[:, LOW], ohlcv[:, CLOSE]
+    starts = bars + 1
+    base_price = opens[starts] if entry == "next_open" else closes[bars]
+    entry_price = base_price * (1 + direction * slip)
+    if max_hold_bars is None:
+        max_hold_bars = defaults.get("max_hold_bars", DEFAULT_MAX_HOLD_BARS)
+    horizon = int(max_hold_bars) if max_hold_bars and max_hold_bars > 0 else n
+    ends = np.minimum(starts + horizon, n)
+
+    tp_price = entry_price * (1 + direction * tp_pct / 100)
+    stop_price = entry_price * (1 - direction * stop_pct / 100)
+    is_long = direction > 0
+    upper = np.where(is_long, tp_price, stop_price)
+    lower = np.where(is_long, stop_price, tp_price)
+    up_hit, down_hit = _first_crossings(highs, lows, starts, ends, upper, lower)
+    tp_hit = np.where(is_long, up_hit, down_hit)
+    stop_hit = np.where(is_long, down_hit, up_hit)
+
+    hit_tp = tp_hit < stop_hit                  # 같은 봉이면 SL 우선
+    hit_stop = (stop_hit <= tp_hit) & (stop_hit != _NO_HIT)
+    exit_idx = np.where(hit_tp, tp_hit, np.where(hit_stop, stop_hit, ends - 1))
+
+    exit_open = opens[exit_idx]
+    tp_fill = np.where(is_long, np.maximum(tp_price, exit_open), np.minimum(tp_price, exit_open))
+    stop_fill = np.where(is_long, np.minimum(stop_price, exit_open), np.maximum(stop_price, exit_open))
+    stop_fill = np.where(liquidated, stop_price, stop_fill * (1 - direction * slip))
+    timeout_fill = closes[exit_idx] * (1 - direction * slip)
+    exit_price = np.where(hit_tp, tp_fill, np.where(hit_stop, stop_fill, timeout_fill))
+
+    price_return = direction * (exit_price - entry_price) / entry_price
+    pnl_pct = np.maximum(leverage * (price_return - 2 * fee) * 100, -100.0)
+    profit = base_price * pnl_pct / 100
+
+    reason = np.select([hit_tp, hit_stop & ~liquidated, hit_stop, ends - starts >= horizon], [0, 1, 2, 3], 4)
+    outcome = np.select([profit > 0, profit < 0], [0, 1], 2)
+    trades = pd.DataFrame({
+        "symbol": symbol,
+        "signal": pd.Categorical.from_codes((~is_long).astype(np.int8), ["long", "short"]),
+        "entry_idx": bars,
+        "exit_idx": exit_idx,
+        "timestamp": ts[bars].astype("datetime64[ms]"),
+        "exit_timestamp": ts[exit_idx].astype("datetime64[ms]"),
+        "entry_price": entry_price,
+        "exit_price": exit_price,
+        "tp": tp_pct,
+        "sl": sl_pct,
+        "leverage": leverage,
+        "exit_reason": pd.Categorical.from_codes(reason, EXIT_REASONS),
+        "bars_held": exit_idx - bars,
+        "fee": base_price * leverage * 2 * fee,
+        "pnl_pct": pnl_pct,
+        "profit": profit,
+        "result": pd.Categorical.from_codes(outcome, RESULTS),
+    }, columns=TRADE_COLUMNS)
+
+    if not allow_overlap:
+        keep = np.zeros(len(trades), dtype=bool)
+        busy_until = -1
+        for i, (start, end) in enumerate(zip(bars, exit_idx)):
+            if start >= busy_until:
+                keep[i] = True
+                busy_until = end
+        trades = trades[keep].reset_index(drop=True)
+    return trades
+
+
+def _strategy_output(strategy, ts, ohlcv) -> tuple:
+    output = strategy(ts, ohlcv)
+    if isinstance(output, tuple):
+        signals, tp, sl = (tuple(output) + (None, None))[:3]
+        return signals, tp, sl
+    return output, None, None
+
+def backtest_symbols(symbols, strategy, timeframe: str = "1m", limit: int = None, max_workers: int = None,
+                     **kwargs) -> dict:
+    """
+    ✅ CandleStore에 쌓인 캔들로 여러 심볼 백테스트 (심볼별 스레드, NumPy 연산은 GIL 해제 구간 병렬)
+    - strategy(ts, ohlcv) → 신호 배열 또는 (신호, tp, sl)
+    - limit: 최근 limit개 캔들만 사용 (None이면 전체 이력)
+    - 반환: {심볼: 거래 DataFrame}
+    """
+    config = kwargs.pop("config", None) or get_backtest_config()
+
+    def run(symbol):
+        store = get_candle_store(symbol, timeframe)
+        ts, ohlcv = store.window_arrays(limit or len(store))
+        if not len(ts):
+            print(f"⚠️ [{symbol}] {timeframe} 저장 캔들이 없어 백테스트를 건너뜁니다.")
+            return pd.DataFrame(columns=TRADE_COLUMNS)
+        signals, tp, sl = _strategy_output(strategy, ts, ohlcv)
+        return run_backtest(ts, ohlcv, signals, tp, sl, symbol=symbol, config=config, **kwargs)
+
+    symbols = list(symbols)
+    with ThreadPoolExecutor(max_workers=max_workers or min(8, max(len(symbols), 1))) as executor:
+        return dict(zip(symbols, executor.map(run, symbols)))
+
+def summarize_backtest(trades: pd.DataFrame) -> dict:
+    """
+    거래 DataFrame → 성과 요약 (최대 낙폭은 청산 순 누적 수익 기준)
+    """
+    if trades is None or not len(trades):
+        return {"trades": 0, "wins": 0, "losses": 0, "win_rate": 0.0, "total_profit": 0.0,
+                "avg_pnl_pct": 0.0, "max_drawdown": 0.0, "exit_reasons": {}}
+    profit = trades["profit"].to_numpy(dtype=float)
+    wins = int(np.count_nonzero(profit > 0))
+    order = np.lexsort((trades["exit_idx"].to_numpy(), trades["exit_timestamp"].to_numpy()))
+    equity = np.cumsum(profit[order])
+    drawdown = np.maximum.accumulate(np.maximum(equity, 0.0)) - equity
+    return {
+        "trades": len(trades),
+        "wins": wins,
+        "losses": int(np.count_nonzero(profit < 0)),
+        "win_rate": round(wins / len(trades) * 100, 1),
+        "total_profit": float(profit.sum()),
+        "avg_pnl_pct": round(float(trades["pnl_pct"].mean()), 3),
+        "max_drawdown": float(drawdown.max()),
+        "exit_reasons": {str(k): int(v) for k, v in trades["exit_reason"].value_counts().items() if v},
+    }
+
+def to_trade_log(trades: pd.DataFrame) -> list:
+    """
+    거래 DataFrame → record_trade_log()와 같은 형식의 entry 목록 (인덱스 컬럼 제외, 시각은 ISO 문자열)
+    """
+    columns = [column for column in TRADE_COLUMNS if column not in ("entry_idx", "exit_idx")]
+    entries = trades[columns].astype({"signal": object, "exit_reason": object, "result": object})
+    for column in ("timestamp", "exit_timestamp"):
+        entries[column] = np.datetime_as_string(trades[column].to_numpy(dtype="datetime64[ms]"), unit="s")
+    return entries.to_dict("records")
+
+def record_backtest(trades: pd.DataFrame, source: str = BACKTEST_SOURCE) -> int:
+    """
+    백테스트 거래를 거래 저널에 한 트랜잭션으로 기록 (실거래 시뮬레이션과 source로 구분)
+    """
+    return get_trade_journal().extend(to_trade_log(trades), source)
+
+
+def rsi_reversal_strategy(period: int = 14, lower: float = 30.0, upper: float = 70.0, tp=None, sl=None):
+    """
+    전략 변형 예시: RSI가 lower 아래로 내려가면 long, upper 위로 올라가면 short
+    """
+    def strategy(ts, ohlcv):
+        rsi = calculate_rsi(pd.Series(ohlcv[:, CLOSE]), period).to_numpy()
+        prev = np.roll(rsi, 1)
+        signals = np.zeros(len(rsi), dtype=np.int8)
+        signals[(rsi < lower) & (prev >= lower)] = 1
+        signals[(rsi > upper) & (prev <= upper)] = -1
+        signals[:period] = 0
+        return signals, tp, sl
+    return strategy
+
+
+# ✅ 단독 실행: config.json 심볼 / 저장 캔들로 RSI 전략 백테스트
+if __name__ == "__main__":
+    from modules.config_loader import get_symbols
+
+    results = backtest_symbols(get_symbols(), rsi_reversal_strategy(), timeframe="15m")
+    for symbol, trades in results.items():
+        print(f"📊 [{symbol}] {summarize_backtest(trades)}")
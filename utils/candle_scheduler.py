@@ -0,0 +1,163 @@
+# 📁 파일명: utils/candle_scheduler.py
+"""
+📌 목적: 고정 sleep 대신 봉 마감 시각에 맞춰 전략 사이클 실행
+📌 기능:
+  - CandleScheduler(timeframes, lead_seconds, settle_seconds, overrun_policy)
+      · 가장 짧은 타임프레임의 봉 마감(UTC epoch 기준, 거래소 봉 경계와 동일)마다 사이클 실행
+      · 각 틱에 이번 경계에서 함께 마감된 타임프레임 목록 제공 (예: 정각 → 15m + 1h)
+      · lead_seconds: 마감 전 선행 조회(prefetch) 콜백 실행 시점
+      · settle_seconds: 마감 후 거래소에 봉이 반영될 때까지 대기
+  - 지연(overrun) 감지: 사이클이 다음 경계를 넘기면 보고(on_overrun 콜백) 후
+      · "coalesce": 놓친 경계들을 하나로 합쳐 즉시 1회 실행
+      · "skip": 놓친 경계는 건너뛰고 다음 경계에 실행
+  - get_stats(): 사이클 수, 지연/병합/건너뜀 횟수, 마감→시작 지연, 사이클 소요 시간
+📌 작업 프롬프트 요약:
+  ▶ "사이클 소요 시간만큼 밀리는 고정 sleep 대신 봉 마감에 정렬된 스케줄러로 바꾸고, 지연 사이클은 감지·보고 후 건너뛰거나 합쳐라."
+"""
+
+import math
+import time
+from dataclasses import dataclass
+from datetime import datetime
+
+from utils.ohlcv import timeframe_to_minutes
+
+OVERRUN_POLICIES = ("coalesce", "skip")
+
+
+@dataclass
+class CandleTick:
+    boundary: float              # 봉 마감 시각 (epoch 초)
+    timeframes: tuple            # 이번 경계에서 마감된 타임프레임
+    coalesced: int = 0           # 합쳐진(놓친) 경계 수
+    started_at: float = None
+    finished_at: float = None
+
+    @property
+    def latency(self) -> float:
+        """봉 마감 → 사이클 시작 지연(초)"""
+        return (self.started_at - self.boundary) if self.started_at else None
+
+    @property
+    def duration(self) -> float:
+        return (self.finished_at - self.started_at) if self.finished_at and self.started_at else None
+
+    @property
+    def label(self) -> str:
+        return datetime.fromtimestamp(self.boundary).strftime("%Y-%m-%d %H:%M")
+
+
+class CandleScheduler:
+    """
+    ✅ 봉 마감 정렬 스케줄러
+    """
+
+    def __init__(self, timeframes=("15m",), lead_seconds: float = 0.0, settle_seconds: float = 2.0,
+                 overrun_policy: str = "coalesce", on_overrun=None, clock=time.time, sleep=time.sleep):
+        if overrun_policy not in OVERRUN_POLICIES:
+            raise ValueError(f"지원하지 않는 overrun_policy: {overrun_policy} ({', '.join(OVERRUN_POLICIES)})")
+        self.timeframes = tuple(timeframes)
+        self.periods = {tf: timeframe_to_minutes(tf) * 60 for tf in self.timeframes}
+        self.step = min(self.periods.values())
+        self.lead_seconds = lead_seconds
+        self.settle_seconds = settle_seconds
+        self.overrun_policy = overrun_policy
+        self.on_overrun = on_overrun   # on_overrun(tick, missed): 지연 알림용 콜백
+        self.clock = clock
+        self.sleep = sleep
+        self.stats = {"cycles": 0, "errors": 0, "overruns": 0, "coalesced": 0, "skipped": 0,
+                      "last_latency": 0.0, "max_latency": 0.0,
+                      "last_duration": 0.0, "max_duration": 0.0}
+
+    # ----- 경계 계산 -----
+    def last_boundary(self, now: float) -> float:
+        return math.floor(now / self.step) * self.step
+
+    def next_boundary(self, now: float) -> float:
+        return self.last_boundary(now) + self.step
+
+    def timeframes_at(self, boundary: float) -> tuple:
+        return tuple(tf for tf, period in self.periods.items() if int(boundary) % period == 0)
+
+    def _make_tick(self, boundary: float, missed: int = 0) -> CandleTick:
+        # 합쳐진 경계들 중 하나라도 마감된 타임프레임은 모두 포함
+        closed = set()
+        for i in range(missed + 1):
+            closed.update(self.timeframes_at(boundary - i * self.step))
+        timeframes = tuple(tf for tf in self.timeframes if tf in closed)
+        return CandleTick(boundary=boundary, timeframes=timeframes, coalesced=missed)
+
+    def _sleep_until(self, target: float):
+        while True:
+            remaining = target - self.clock()
+            if remaining <= 0:
+                return
+            self.sleep(min(remaining, 60))
+
+    # ----- 실행 -----
+    def _after_cycle(self, tick: CandleTick) -> CandleTick:
+        """
+        통계 기록 + 다음 틱 결정 (지연 시 정책에 따라 병합/건너뜀)
+        """
+        self.stats["cycles"] += 1
+        self.stats["last_latency"] = round(tick.latency, 3)
+        self.stats["max_latency"] = max(self.stats["max_latency"], self.stats["last_latency"])
+        self.stats["last_duration"] = round(tick.duration, 3)
+        self.stats["max_duration"] = max(self.stats["max_duration"], self.stats["last_duration"])
+
+        next_boundary = tick.boundary + self.step
+        latest = self.last_boundary(tick.finished_at - self.settle_seconds)
+        if latest < next_boundary:
+            return self._make_tick(next_boundary)
+
+        missed = int(round((latest - next_boundary) / self.step)) + 1
+        self.stats["overruns"] += 1
+        print(f"⚠️ 사이클 지연: {tick.label} 봉 사이클이 {tick.duration:.1f}초 소요 → 경계 {missed}개 초과")
+        if self.on_overrun:
+            try:
+                self.on_overrun(tick, missed)
+            except Exception as e:
+                print(f"⚠️ 지연 알림 오류: {e}")
+        if self.overrun_policy == "coalesce":
+            self.stats["coalesced"] += missed - 1
+            return self._make_tick(latest, missed - 1)
+        self.stats["skipped"] += missed
+        return self._make_tick(latest + self.step)
+
+    def run(self, cycle, prefetch=None, run_immediately: bool = True, max_cycles: int = None):
+        """
+        cycle(tick) / prefetch(tick)을 봉 마감에 맞춰 반복 실행
+        - run_immediately: 시작 직후 직전 마감 봉 기준으로 1회 실행
+        """
+        now = self.clock()
+        if run_immediately:
+            tick = self._make_tick(self.last_boundary(now))
+        else:
+            tick = self._make_tick(self.next_boundary(now))
+
+        count = 0
+        while max_cycles is None or count < max_cycles:
+            if prefetch and self.clock() < tick.boundary:
+                self._sleep_until(tick.boundary - self.lead_seconds)
+                try:
+                    prefetch(tick)
+                except Exception as e:
+                    print(f"⚠️ 선행 조회 오류: {e}")
+            self._sleep_until(tick.boundary + self.settle_seconds)
+
+            tick.started_at = self.clock()
+            try:
+                cycle(tick)
+            except Exception as e:
+                self.stats["errors"] += 1
+                print(f"❌ 사이클 오류: {e}")
+            tick.finished_at = self.clock()
+            count += 1
+
+            tick = self._after_cycle(tick)
+            if max_cycles is None or count < max_cycles:
+                wait = max(0.0, tick.boundary + self.settle_seconds - self.clock())
+                print(f"⏳ 다음 실행: {tick.label} 봉 마감 ({', '.join(tick.timeframes)}) | {wait / 60:.1f}분 후")
+
+    def get_stats(self) -> dict:
+        return dict(self.stats)
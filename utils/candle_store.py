@@ -0,0 +1,249 @@
+# 📁 파일명: utils/candle_store.py
+"""
+📌 목적: 심볼/타임프레임별 OHLCV 캔들을 로컬 디스크에 누적 저장하고 증분 동기화
+📌 기능:
+  - CandleStore: 메모리 매핑(np.memmap) 기반 컬럼형 캔들 저장소
+      · append(df): 마지막 저장 시각 이후 + 이미 마감된 캔들만 추가 (형성 중 캔들 제외)
+      · window_arrays(limit): 최근 limit개 캔들을 복사 없는 읽기 전용 배열 뷰로 반환
+      · window(limit): 최근 limit개 캔들을 fetch_ohlcv_data()와 같은 DataFrame 형태로 반환
+  - get_candle_store(symbol, timeframe): 프로세스 내 저장소 객체 재사용
+  - sync_candles(symbol, timeframe): 마지막 저장 이후 누락된 캔들 수만큼만 조회 후 추가
+      · 누락이 MAX_SYNC_CANDLES를 넘으면 경고 후 최근 캔들로 다시 채움 (중간 공백 없음)
+  - load_candles(symbol, timeframe, limit): 동기화 + 최근 윈도우 반환 (fetch_ohlcv_data 대체용)
+📌 저장 구조 (data/candles/):
+  - {SYMBOL}_{timeframe}.ts.npy    : 캔들 시작 시각 (epoch ms, int64)
+  - {SYMBOL}_{timeframe}.ohlcv.npy : open/high/low/close/volume (float64, 행 = 캔들)
+  - {SYMBOL}_{timeframe}.meta.json : 저장된 캔들 수 (데이터 기록 후 원자적으로 갱신)
+📌 작업 프롬프트 요약:
+  ▶ "매 사이클 전체 캔들을 다시 받지 않도록, 로컬 저장소에 누적하고 새로 생긴 캔들만 받아 붙여라."
+"""
+
+import os
+import json
+import threading
+
+import numpy as np
+import pandas as pd
+
+from utils.ohlcv import fetch_ohlcv_data, timeframe_to_minutes
+
+CANDLE_STORE_DIR = "data/candles"
+OHLCV_COLUMNS = ["open", "high", "low", "close", "volume"]
+INITIAL_CAPACITY = 4096
+MAX_SYNC_CANDLES = 1000  # 한 번의 동기화에서 조회할 최대 캔들 수
+
+
+class CandleStore:
+    """
+    ✅ 심볼 1개 + 타임프레임 1개 단위의 메모리 매핑 캔들 저장소
+    - 용량이 부족하면 2배로 늘린 파일로 교체 (추가 비용은 분할 상환 O(1))
+    - 조회 결과는 memmap 슬라이스이므로 복사가 발생하지 않음
+    """
+
+    def __init__(self, symbol: str, timeframe: str, root: str = CANDLE_STORE_DIR):
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.root = root
+        key = f"{symbol.replace('/', '')}_{timeframe}"
+        self._ts_path = os.path.join(root, f"{key}.ts.npy")
+        self._data_path = os.path.join(root, f"{key}.ohlcv.npy")
+        self._meta_path = os.path.join(root, f"{key}.meta.json")
+
+        self.count = 0
+        self._ts = None
+        self._data = None
+        self.lock = threading.RLock()   # 같은 (심볼, 타임프레임) 동시 동기화 방지
+        self._open()
+        self.seeded = self.count        # 이번 실행에서 확보한 최대 윈도우 (짧은 히스토리 반복 재조회 방지)
+
+    def _open(self):
+        if not (os.path.exists(self._meta_path) and os.path.exists(self._ts_path)
+                and os.path.exists(self._data_path)):
+            return
+        with open(self._meta_path, "r", encoding="utf-8") as f:
+            self.count = int(json.load(f).get("count", 0))
+        self._map_readonly()
+        self.count = min(self.count, len(self._ts))
+
+    def _map_readonly(self):
+        # 조회용 매핑은 읽기 전용 (쓰기는 append()에서만 r+로 잠깐 열어 기록)
+        self._ts = np.load(self._ts_path, mmap_mode="r")
+        self._data = np.load(self._data_path, mmap_mode="r")
+
+    def _ensure_capacity(self, needed: int):
+        capacity = 0 if self._ts is None else len(self._ts)
+        if needed <= capacity:
+            return
+
+        new_capacity = max(INITIAL_CAPACITY, capacity)
+        while new_capacity < needed:
+            new_capacity *= 2
+
+        os.makedirs(self.root, exist_ok=True)
+        tmp_ts_path = self._ts_path + ".tmp"
+        tmp_data_path = self._data_path + ".tmp"
+        ts = np.lib.format.open_memmap(tmp_ts_path, mode="w+", dtype=np.int64, shape=(new_capacity,))
+        data = np.lib.format.open_memmap(tmp_data_path, mode="w+", dtype=np.float64,
+                                         shape=(new_capacity, len(OHLCV_COLUMNS)))
+        if self.count:
+            ts[:self.count] = self._ts[:self.count]
+            data[:self.count] = self._data[:self.count]
+        ts.flush()
+        data.flush()
+        del ts, data
+        self._ts = self._data = None
+
+        os.replace(tmp_ts_path, self._ts_path)
+        os.replace(tmp_data_path, self._data_path)
+        self._map_readonly()
+
+    def _write_meta(self):
+        tmp_path = self._meta_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"symbol": self.symbol, "timeframe": self.timeframe, "count": self.count}, f)
+        os.replace(tmp_path, self._meta_path)
+
+    @property
+    def last_timestamp(self):
+        """
+        마지막 저장 캔들 시각 (epoch ms), 비어 있으면 None
+        """
+        return int(self._ts[self.count - 1]) if self.count else None
+
+    def __len__(self):
+        return self.count
+
+    def append(self, df: pd.DataFrame, now_ms: int = None) -> int:
+        """
+        OHLCV DataFrame(DatetimeIndex) 중 마지막 저장 시각 이후 + 이미 마감된 캔들만 추가
+        - 형성 중인 캔들(마감 시각 > now)은 저장하지 않음 (저장 후에는 갱신되지 않으므로)
+        - 반환: 실제로 추가된 캔들 수
+        """
+        if df is None or df.empty:
+            return 0
+
+        index = df.index
+        if getattr(index, "tz", None) is not None:
+            index = index.tz_convert(None)
+        ts = index.values.astype("datetime64[ms]").astype(np.int64)
+        values = df[OHLCV_COLUMNS].to_numpy(dtype=np.float64)
+        order = np.argsort(ts, kind="stable")
+        ts, values = ts[order], values[order]
+
+        frame_ms = timeframe_to_minutes(self.timeframe) * 60_000
+        now_ms = _now_ms() if now_ms is None else now_ms
+        keep = ts + frame_ms <= now_ms
+        last = self.last_timestamp
+        if last is not None:
+            keep &= ts > last
+        ts, values = ts[keep], values[keep]
+        if len(ts) == 0:
+            return 0
+
+        start = self.count
+        self._ensure_capacity(start + len(ts))
+        ts_out = np.load(self._ts_path, mmap_mode="r+")
+        data_out = np.load(self._data_path, mmap_mode="r+")
+        ts_out[start:start + len(ts)] = ts
+        data_out[start:start + len(ts)] = values
+        ts_out.flush()
+        data_out.flush()
+        del ts_out, data_out
+
+        # 데이터 기록 후 카운트를 갱신해야 중간 종료 시에도 반쯤 쓴 캔들이 노출되지 않음
+        self.count = start + len(ts)
+        self._write_meta()
+        return len(ts)
+
+    def reset(self):
+        """
+        저장된 캔들 비우기 (파일은 재사용, 다음 append부터 다시 채움)
+        """
+        self.count = 0
+        self._write_meta()
+
+    def window_arrays(self, limit: int = 100) -> tuple:
+        """
+        최근 limit개 캔들의 (시각 배열, OHLCV 배열) 읽기 전용 뷰 반환 (복사 없음)
+        - 호출 측에서 값을 바꾸면 ValueError (저장된 이력 보호), 수정이 필요하면 .copy() 사용
+        """
+        if not self.count:
+            return np.empty(0, dtype=np.int64), np.empty((0, len(OHLCV_COLUMNS)))
+        start = max(self.count - limit, 0)
+        ts = self._ts[start:self.count].view(np.ndarray)
+        values = self._data[start:self.count].view(np.ndarray)
+        ts.setflags(write=False)
+        values.setflags(write=False)
+        return ts, values
+
+    def window(self, limit: int = 100) -> pd.DataFrame:
+        """
+        최근 limit개 캔들을 fetch_ohlcv_data()와 같은 형태의 DataFrame으로 반환
+        - fetch_ohlcv_data()처럼 호출 측 전용 복사본 (수정해도 저장된 이력은 그대로, 윈도우 크기만큼만 복사)
+        """
+        ts, values = self.window_arrays(limit)
+        index = pd.DatetimeIndex(pd.to_datetime(ts, unit="ms"), name="timestamp")
+        return pd.DataFrame(values, index=index, columns=OHLCV_COLUMNS, copy=True)
+
+
+def _now_ms() -> int:
+    return pd.Timestamp.now().value // 1_000_000  # fetch_ohlcv_data와 같은 로컬 시각 기준
+
+_CANDLE_STORES = {}
+_STORES_LOCK = threading.Lock()
+
+def get_candle_store(symbol: str, timeframe: str = "15m", root: str = CANDLE_STORE_DIR) -> CandleStore:
+    """
+    (심볼, 타임프레임, 경로)별 CandleStore 재사용
+    """
+    key = (symbol, timeframe, root)
+    with _STORES_LOCK:
+        store = _CANDLE_STORES.get(key)
+        if store is None:
+            store = CandleStore(symbol, timeframe, root)
+            _CANDLE_STORES[key] = store
+    return store
+
+def sync_candles(symbol: str, timeframe: str = "15m", limit: int = 100,
+                 fetcher=fetch_ohlcv_data, root: str = CANDLE_STORE_DIR) -> int:
+    """
+    ✅ 증분 동기화
+    - 저장소가 비어 있거나 limit개보다 적으면 최근 limit개로 채움
+    - 이후에는 마지막 저장 시각부터 지금까지 새로 닫힌 캔들 수만큼만 조회
+    - 누락 캔들이 MAX_SYNC_CANDLES를 넘으면 (장시간 중단) 경고 후 최근 캔들로 다시 채움 → 중간 공백 없음
+    - 반환: 추가된 캔들 수
+    """
+    store = get_candle_store(symbol, timeframe, root)
+    with store.lock:
+        last = store.last_timestamp
+
+        if last is None or (len(store) < limit and store.seeded < limit):
+            fetch_count = limit + 1   # 형성 중 캔들이 빠져도 limit개 확보
+            reseed = last is not None
+        else:
+            frame_ms = timeframe_to_minutes(timeframe) * 60_000
+            fetch_count = (_now_ms() - last) // frame_ms
+            reseed = fetch_count > MAX_SYNC_CANDLES
+            if reseed:
+                print(f"⚠️ [{symbol} {timeframe}] 저장 캔들 이후 {fetch_count}개 누락 (최대 {MAX_SYNC_CANDLES}) "
+                      f"→ 공백 없이 최근 {max(limit, MAX_SYNC_CANDLES)}개로 다시 채움")
+                fetch_count = max(limit, MAX_SYNC_CANDLES)
+
+        if fetch_count <= 0:
+            return 0
+        df = fetcher(symbol, timeframe, limit=int(fetch_count))
+        if reseed:
+            store.reset()
+        added = store.append(df)
+        store.seeded = max(store.seeded, limit if fetch_count > limit else len(store))
+        return added
+
+def load_candles(symbol: str, timeframe: str = "15m", limit: int = 100,
+                 fetcher=fetch_ohlcv_data, root: str = CANDLE_STORE_DIR) -> pd.DataFrame:
+    """
+    ✅ fetch_ohlcv_data() 대체용: 증분 동기화 후 최근 limit개 캔들 반환
+    """
+    store = get_candle_store(symbol, timeframe, root)
+    with store.lock:
+        sync_candles(symbol, timeframe, limit, fetcher, root)
+        return store.window(limit)
@@ -0,0 +1,286 @@
+# 📁 파일명: utils/cycle_runner.py
+"""
+📌 목적: sandbox_trader 전략 사이클의 각 단계를 의존성 그래프(DAG)에 따라 asyncio로 동시 실행
+📌 기능:
+  - Stage(name, func, deps, timeout, default): 단계 정의 (func는 deps 결과를 순서대로 인자로 받음)
+  - run_stages(stages): 의존 단계가 끝나는 즉시 실행, 단계별 마감 시간 초과/오류 시 default 사용
+  - run_multi_symbol_cycle(symbols): config.json 심볼 전체를 한 그래프로 병렬 평가
+      · 뉴스 → 감정 점수는 사이클당 1회만 계산해 모든 심볼이 공유
+      · 캔들 조회 / Grok / 커뮤니티 등 네트워크 단계는 스레드(asyncio)로 동시 실행
+      · 지표 계산(다중 프레임 리샘플링 포함)은 프로세스 풀에서 실행 (CPU 병렬)
+      · 딥러닝 예측은 모든 심볼 지표가 모이면 LSTM 1회 배치 추론 (심볼 수와 무관한 추론 비용)
+  - run_strategy_cycle(symbol): 단일 심볼 버전 (기존 sandbox_trader와 같은 core dict 생성)
+📌 단계 그래프 (심볼마다 반복, 이름은 "심볼:단계"):
+    news ─ sentiment ───────────────┬─ grok ── fallback(HOLD일 때만)
+    candles ─ frames(프로세스 풀) ───┤
+                                    └─ model(공유: 전 심볼 frames 대기 후 배치 예측)
+    community (독립)
+  → 사이클 시간 = 가장 느린 경로 1개 (심볼 수와 무관)
+📌 작업 프롬프트 요약:
+  ▶ "독립적인 I/O 단계는 동시에 실행하고, 단계마다 마감 시간을 두어 사이클이 가장 느린 분기 시간 안에 끝나게 하라."
+  ▶ "config.json의 모든 심볼을 병렬로 평가하되, 뉴스/감정은 사이클당 한 번만 계산해 공유하라."
+"""
+
+import os
+import time
+import asyncio
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Tuple
+
+STAGE_MAX_WORKERS = 32
+INDICATOR_WORKERS = int(os.getenv("INDICATOR_WORKERS", str(min(4, os.cpu_count() or 1))))
+SHARED_STAGES = ("news", "sentiment", "model")
+
+# asyncio 기본 실행기 대신 전용 풀 사용: asyncio.run() 종료 시 마감 초과 단계의 스레드를 기다리지 않음
+_EXECUTOR = ThreadPoolExecutor(max_workers=STAGE_MAX_WORKERS, thread_name_prefix="cycle-stage")
+_PROCESS_POOL = None
+
+
+@dataclass
+class Stage:
+    name: str
+    func: Callable
+    deps: Tuple[str, ...] = ()
+    timeout: float = 30.0
+    default: Any = None
+
+
+@dataclass
+class StageReport:
+    results: Dict[str, Any] = field(default_factory=dict)
+    timings: Dict[str, float] = field(default_factory=dict)   # 단계별 소요(초)
+    errors: Dict[str, str] = field(default_factory=dict)      # 단계별 오류/타임아웃 메시지
+
+
+async def run_stages(stages: List[Stage]) -> StageReport:
+    """
+    ✅ DAG 실행기
+    - 각 단계는 의존 단계 결과가 준비되면 별도 스레드에서 실행 (블로킹 I/O 함수 그대로 사용)
+    - 마감 시간 초과 또는 예외 시 default 값으로 대체하고 errors에 기록
+    """
+    report = StageReport()
+    by_name = {stage.name: stage for stage in stages}
+    for stage in stages:
+        for dep in stage.deps:
+            if dep not in by_name:
+                raise ValueError(f"{stage.name} 단계의 의존 단계 {dep}가 없습니다.")
+
+    tasks = {}
+
+    async def run(stage: Stage):
+        if stage.deps:
+            await asyncio.gather(*(tasks[dep] for dep in stage.deps))
+        args = [report.results[dep] for dep in stage.deps]
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        try:
+            future = loop.run_in_executor(_EXECUTOR, lambda: stage.func(*args))
+            value = await asyncio.wait_for(future, stage.timeout)
+        except asyncio.TimeoutError:
+            report.errors[stage.name] = f"{stage.timeout:g}초 마감 초과"
+            value = stage.default
+        except Exception as e:
+            report.errors[stage.name] = str(e)
+            value = stage.default
+        report.timings[stage.name] = round(time.perf_counter() - started, 3)
+        report.results[stage.name] = value
+
+    for stage in stages:
+        tasks[stage.name] = asyncio.ensure_future(run(stage))
+    await asyncio.gather(*tasks.values())
+    return report
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """
+    지표 계산용 프로세스 풀 (spawn 방식: 스레드/모델이 로드된 부모 프로세스를 fork하지 않음)
+    """
+    global _PROCESS_POOL
+    if _PROCESS_POOL is None:
+        _PROCESS_POOL = ProcessPoolExecutor(max_workers=INDICATOR_WORKERS,
+                                            mp_context=multiprocessing.get_context("spawn"))
+    return _PROCESS_POOL
+
+def shutdown_process_pool():
+    global _PROCESS_POOL
+    if _PROCESS_POOL is not None:
+        _PROCESS_POOL.shutdown(wait=False, cancel_futures=True)
+        _PROCESS_POOL = None
+
+def compute_frames(base_df, timeframes: tuple, base_timeframe: str) -> dict:
+    """
+    캔들 → 다중 프레임 지표 (프로세스 풀 실행, 풀이 깨졌으면 현재 스레드에서 계산)
+    """
+    from utils.indicators import indicators_from_base_frame
+
+    if base_df is None or base_df.empty:
+        raise RuntimeError("캔들 데이터 없음")
+    try:
+        return get_process_pool().submit(indicators_from_base_frame, base_df, timeframes, base_timeframe).result()
+    except BrokenProcessPool:
+        print("⚠️ 지표 프로세스 풀 오류 → 현재 프로세스에서 계산")
+        shutdown_process_pool()
+        return indicators_from_base_frame(base_df, timeframes, base_timeframe)
+
+
+def build_primary_prompt(indicators: dict, sentiment_score: float, symbol: str = "BTC/USDT") -> str:
+    return f"""
+        Symbol: {symbol}
+        Technical Indicators:
+        RSI: {indicators['rsi']}, BB: {indicators['bb']}, EMA: {indicators['ema']}, TEMA: {indicators['tema']}, MACD: {indicators['macd']}
+        Market Sentiment: {sentiment_score}
+        Should we go LONG, SHORT, or HOLD?
+        """
+
+
+def build_shared_stages() -> List[Stage]:
+    """
+    모든 심볼이 공유하는 단계 (뉴스 → 감정 점수, 사이클당 1회)
+    """
+    from utils.news_fetcher import fetch_news
+    from utils.sentiment import analyze_news_incremental
+
+    def sentiment_stage(news):
+        # 새 기사만 감정 분석, 이미 본 기사는 롤링 윈도우 점수로 반영
+        return analyze_news_incremental(news) if news else 0.35
+
+    return [
+        Stage("news", fetch_news, timeout=20, default=[]),
+        Stage("sentiment", sentiment_stage, deps=("news",), timeout=30, default=0.35),
+    ]
+
+
+def build_symbol_stages(symbol: str = "BTC/USDT", timeframe: str = "15m",
+                        higher_timeframes=("1h", "4h")) -> List[Stage]:
+    """
+    심볼 1개의 전략 단계 정의 (이름: "심볼:단계", 공유 단계 sentiment에 의존)
+    """
+    from utils.candle_store import load_candles
+    from utils.indicators import multi_timeframe_fetch_limit
+    from utils.decision_cache import cached_grok_decision
+    from utils.strategy_analyzer import (
+        analyze_strategy,
+        analyze_strategy_with_context,
+    )
+    from modules.community_sentiment import analyze_community_sentiment
+
+    timeframes = (timeframe,) + tuple(tf for tf in higher_timeframes if tf != timeframe)
+    fetch_limit = multi_timeframe_fetch_limit(timeframes, timeframe)
+    name = lambda stage: f"{symbol}:{stage}"
+
+    def grok_stage(frames, sentiment):
+        indicators = frames.get(timeframe) if frames else None
+        if not indicators:
+            return "HOLD"
+        # 시장 상태(RSI/MACD/BB/감정)가 같은 구간이면 TTL 동안 이전 판단 재사용
+        prompt = build_primary_prompt(indicators, sentiment, symbol)
+        return cached_grok_decision("primary", prompt, indicators, sentiment, symbol)
+
+    def fallback_stage(grok, frames, sentiment):
+        indicators = frames.get(timeframe) if frames else None
+        if not indicators:
+            return None
+        core, _ = analyze_strategy(grok, indicators, sentiment)
+        if core["signal"] != "hold":
+            return None
+        print(f"🤔 {symbol} HOLD → 보완 전략 실행 중...")
+        return analyze_strategy_with_context(sentiment, timeframe, frames=frames, symbol=symbol)
+
+    return [
+        Stage(name("candles"), lambda: load_candles(symbol, timeframe, limit=fetch_limit), timeout=20),
+        Stage(name("frames"), lambda candles: compute_frames(candles, timeframes, timeframe),
+              deps=(name("candles"),), timeout=20),
+        Stage(name("grok"), grok_stage, deps=(name("frames"), "sentiment"), timeout=60, default="HOLD"),
+        Stage(name("fallback"), fallback_stage, deps=(name("grok"), name("frames"), "sentiment"), timeout=60),
+        Stage(name("community"), lambda: analyze_community_sentiment(symbol.split("/")[0]), timeout=30, default=0.0),
+    ]
+
+
+def build_model_stage(symbols, timeframe: str = "15m") -> Stage:
+    """
+    모든 심볼 다중 프레임 지표 + 감정 점수 → LSTM 배치 예측 {symbol: 신호} (공유 단계)
+    """
+    from utils.strategy_analyzer import predict_model_signals
+
+    def model_stage(sentiment, *frames_list):
+        indicators = {symbol: (frames or {}).get(timeframe) for symbol, frames in zip(symbols, frames_list)}
+        return predict_model_signals(indicators, sentiment)
+
+    return Stage("model", model_stage, deps=("sentiment",) + tuple(f"{symbol}:frames" for symbol in symbols),
+                 timeout=30)
+
+
+def _combine_symbol(symbol: str, timeframe: str, report: StageReport) -> dict:
+    """
+    심볼 단계 결과 → core dict (보완 전략 → 딥러닝 보정(실패 시 hold) → 커뮤니티 필터)
+    """
+    from utils.strategy_analyzer import analyze_strategy, apply_model_correction, apply_community_adjustment
+
+    prefix = f"{symbol}:"
+    results = {key[len(prefix):]: value for key, value in report.results.items() if key.startswith(prefix)}
+    errors = {key[len(prefix):]: value for key, value in report.errors.items() if key.startswith(prefix)}
+    timings = {key[len(prefix):]: value for key, value in report.timings.items() if key.startswith(prefix)}
+    outcome = {"symbol": symbol, "core": None, "summary": None, "ai_response": results.get("grok"),
+               "errors": errors, "timings": timings}
+
+    indicators = (results.get("frames") or {}).get(timeframe)
+    if not indicators:
+        errors.setdefault("indicators", errors.get("frames") or errors.get("candles") or "데이터 없음")
+        return outcome
+
+    sentiment_score = report.results["sentiment"]
+    core, summary = analyze_strategy(results["grok"], indicators, sentiment_score)
+    if core["signal"] == "hold" and results.get("fallback"):
+        core = results["fallback"]
+
+    if "model" in report.errors:
+        core["signal"] = "hold"
+    else:
+        model_signal = (report.results["model"] or {}).get(symbol, "hold")
+        core["signal"] = apply_model_correction(core["signal"], indicators, sentiment_score,
+                                                model_signal=model_signal)
+
+    core["signal"] = apply_community_adjustment(core["signal"], community_score=results["community"])
+    core["symbol"] = symbol
+    outcome["core"] = core
+    outcome["summary"] = summary
+    return outcome
+
+
+async def run_multi_symbol_cycle(symbols, timeframe: str = "15m") -> dict:
+    """
+    ✅ 다중 심볼 전략 사이클 1회 실행
+    - 반환: {"sentiment", "news", "symbols": {symbol: {"core", "summary", "ai_response", "errors", "timings"}},
+            "errors", "timings"}  (최상위 errors/timings는 공유 단계, model 오류 시 전 심볼 hold)
+    - 지표 조회 실패 심볼은 core=None, errors["indicators"]에 사유 기록
+    """
+    symbols = list(dict.fromkeys(symbols))
+    stages = build_shared_stages()
+    for symbol in symbols:
+        stages.extend(build_symbol_stages(symbol, timeframe))
+    stages.append(build_model_stage(symbols, timeframe))
+
+    report = await run_stages(stages)
+    return {
+        "sentiment": report.results["sentiment"],
+        "news": report.results["news"],
+        "symbols": {symbol: _combine_symbol(symbol, timeframe, report) for symbol in symbols},
+        "errors": {key: value for key, value in report.errors.items() if key in SHARED_STAGES},
+        "timings": {key: value for key, value in report.timings.items() if key in SHARED_STAGES},
+    }
+
+
+async def run_strategy_cycle(symbol: str = "BTC/USDT", timeframe: str = "15m") -> dict:
+    """
+    ✅ 단일 심볼 전략 사이클 (지표 조회 실패 시 RuntimeError)
+    """
+    cycle = await run_multi_symbol_cycle([symbol], timeframe)
+    outcome = cycle["symbols"][symbol]
+    if outcome["core"] is None:
+        raise RuntimeError(f"지표 계산 실패: {outcome['errors']['indicators']}")
+    outcome["errors"].update(cycle["errors"])
+    outcome["timings"].update(cycle["timings"])
+    return outcome
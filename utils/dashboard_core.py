@@ -4,7 +4,6 @@
 
 import os
 import sys
-import json
 import streamlit as st
 
 # 모듈 경로 추가
@@ -22,7 +21,15 @@ from modules.logger import log_trade_result
 from modules.telegram_notifier import notify_trade_result
 from modules.streamlit_visualizer import visualize_sentiment_over_time
 from modules.visualizer import plot_indicators, plot_hourly_performance
-from modules.time_impact_analyzer import analyze_by_hour
+from modules.time_impact_analyzer import TimeImpactAccumulator
+from utils.trade_simulator import load_trade_log
+
+INDICATOR_PLOT_LIMIT = 500   # 지표 시각화에 쓰는 최근 거래 수
+
+
+@st.cache_resource
+def get_time_impact() -> TimeImpactAccumulator:
+    return TimeImpactAccumulator()
 
 
 def display_dashboard():
@@ -73,16 +80,18 @@ def display_dashboard():
 
         st.markdown("### 🧪 기술적 지표 시각화")
         try:
-            with open("logs/simulation/simulated_trades_cleaned.json", 'r', encoding='utf-8') as f:
-                logs = json.load(f)
-            plot_indicators(logs)
+            # 전체 JSON 로그 대신 거래 저널에서 최근 거래만 조회
+            plot_indicators(load_trade_log(INDICATOR_PLOT_LIMIT))
         except:
             st.warning("⚠️ 로그 파일이 없어 지표 시각화를 건너뜁니다.")
 
         st.markdown("### ⏱ 시간대별 전략 성능 분석")
         try:
-            summary = analyze_by_hour(logs)
-            plot_hourly_performance(summary)
+            # 세션 간 유지되는 누적 집계에 새 거래만 반영 → 거래 수와 무관하게 즉시 표시
+            time_impact = get_time_impact()
+            time_impact.update_from_journal("simulation")
+            plot_hourly_performance(time_impact.by_hour())
+            st.dataframe(time_impact.summary(["session"]))
         except:
             st.warning("⚠️ 로그 파일이 없어 전략 성능 분석을 건너뜁니다.")
 
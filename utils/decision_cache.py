@@ -0,0 +1,118 @@
+# 📁 파일명: utils/decision_cache.py
+"""
+📌 목적: 시장 상태가 거의 그대로일 때 LLM(Grok)에 같은 판단을 다시 묻지 않도록 응답 재사용
+📌 기능:
+  - quantize_market_state(indicators, sentiment): 프롬프트 입력을 구간화한 캐시 키 생성
+      · RSI 1포인트 단위, MACD 부호 + 가격 대비 크기(%) 구간, BB 위치, 다이버전스, 감정 점수 0.1 단위
+  - cached_grok_decision(kind, prompt, indicators, sentiment, symbol): 같은 심볼 + 같은 구간 + TTL 이내면 이전 응답 재사용
+  - get_decision_cache_stats(): 적중/미스 횟수, 절약 토큰 수
+📌 설정:
+  - LLM_DECISION_CACHE_TTL (환경변수, 초, 기본 1800)
+📌 작업 프롬프트 요약:
+  ▶ "RSI, MACD, BB 위치, 감정 점수가 거의 변하지 않았다면 최근 LLM 판단을 TTL 동안 재사용하고, 적중률과 절약 토큰을 기록하라."
+"""
+
+import os
+import time
+import threading
+
+from modules.grok_bridge import query_grok
+from modules.llm_client import get_llm_client
+from utils.token_tracker import track_token_usage, track_cache_event
+
+DECISION_CACHE_TTL = int(os.getenv("LLM_DECISION_CACHE_TTL", "1800"))
+# |MACD| / 종가 (%) 구간 경계 — 심볼 가격대와 무관하게 비교 (BTC 약 83,000 기준 기존 5/15/30/60/120)
+MACD_BANDS_PCT = (0.006, 0.018, 0.036, 0.072, 0.145)
+MACD_BANDS = (5, 15, 30, 60, 120)   # 종가가 없을 때만 쓰는 절댓값 구간 (30은 보완 전략의 급변 기준)
+
+_CACHE = {}   # key → (저장 시각, 응답, 사용 토큰)
+_LOCK = threading.Lock()
+_STATS = {"hits": 0, "misses": 0, "tokens_saved": 0}
+
+def _macd_band(macd, price=None) -> int:
+    """
+    MACD 부호 + 크기 구간 (0: 0 근처, ±1..±N: 구간 번호), price가 있으면 종가 대비 %로 정규화
+    """
+    try:
+        value = float(macd)
+    except (TypeError, ValueError):
+        return 0
+    try:
+        price = float(price)
+    except (TypeError, ValueError):
+        price = 0.0
+    edges = MACD_BANDS
+    magnitude = abs(value)
+    if price > 0:
+        edges = MACD_BANDS_PCT
+        magnitude = magnitude / price * 100
+    band = 0
+    for edge in edges:
+        if magnitude >= edge:
+            band += 1
+    sign = 1 if value > 0 else -1
+    return sign * (band + 1) if magnitude > 0 else 0
+
+def quantize_market_state(indicators: dict, sentiment_score: float) -> tuple:
+    """
+    LLM 프롬프트 입력을 구간화 → 캐시 키
+    """
+    rsi = indicators.get("rsi")
+    try:
+        rsi_bucket = int(round(float(rsi)))
+    except (TypeError, ValueError):
+        rsi_bucket = None
+    return (
+        rsi_bucket,
+        _macd_band(indicators.get("macd"), indicators.get("close")),
+        indicators.get("bb"),
+        indicators.get("divergence"),
+        round(float(sentiment_score or 0.0), 1),
+    )
+
+def cached_grok_decision(kind: str, prompt: str, indicators: dict, sentiment_score: float,
+                         symbol: str = None, model: str = "grok-3-beta", ttl: int = None) -> str:
+    """
+    ✅ 구간화된 시장 상태 기준 Grok 응답 캐시
+    - kind: 프롬프트 종류 구분 ("primary", "context" 등)
+    - symbol: 심볼별로 캐시를 분리 (다른 심볼의 LONG/SHORT 판단을 재사용하지 않음)
+    - 캐시 미스일 때만 query_grok 호출 (실패는 캐시하지 않고 LLMUnavailableError 전달)
+    """
+    ttl = DECISION_CACHE_TTL if ttl is None else ttl
+    key = (kind, model, symbol) + quantize_market_state(indicators, sentiment_score)
+    now = time.time()
+
+    with _LOCK:
+        entry = _CACHE.get(key)
+        if entry and now - entry[0] <= ttl:
+            _STATS["hits"] += 1
+            _STATS["tokens_saved"] += entry[2]
+            hit = entry
+        else:
+            hit = None
+            _STATS["misses"] += 1
+
+    if hit:
+        track_cache_event(model, hit=True, tokens_saved=hit[2])
+        return hit[1]
+
+    response = query_grok(prompt, model, raise_on_error=True)
+    tokens = int(get_llm_client("grok").last_usage.get("total_tokens", 0) or 0)  # 현재 스레드의 직전 호출 기준
+    if tokens:
+        track_token_usage(model, tokens)
+    track_cache_event(model, hit=False)
+
+    with _LOCK:
+        _CACHE[key] = (now, response, tokens)
+        # 만료 항목 정리
+        for stale in [k for k, (saved_at, _, _) in _CACHE.items() if now - saved_at > ttl]:
+            del _CACHE[stale]
+    return response
+
+def get_decision_cache_stats() -> dict:
+    lookups = _STATS["hits"] + _STATS["misses"]
+    return {
+        **_STATS,
+        "size": len(_CACHE),
+        "hit_rate": round(_STATS["hits"] / lookups, 3) if lookups else 0.0,
+    }
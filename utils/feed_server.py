@@ -0,0 +1,120 @@
+# 📁 파일명: utils/feed_server.py
+"""
+📌 목적: RSS 수집(fetch_news) 성능을 오프라인에서 측정하기 위한 로컬 피드 서버 대역
+📌 기능:
+  - build_sample_feed(name, n_items): 코인 키워드가 섞인 샘플 RSS XML 생성
+  - start_feed_server(feeds, delay): /{피드명}.xml 경로로 RSS 제공 (ETag / Last-Modified / 304 지원)
+  - local_feed_list(base_url, names): fetch_news(feeds=...)에 넘길 (이름, URL) 목록
+📌 사용 예:
+  ▶ python -m utils.feed_server  → 순차 vs 동시 수집, 조건부 요청 효과 비교 출력
+"""
+
+import time
+import hashlib
+import threading
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SAMPLE_TITLES = [
+    "비트코인 급등에 투자자 기대감 확대",
+    "연준 금리 동결 전망에 나스닥 상승",
+    "가상자산 규제 강화 우려로 코인 시장 불안",
+    "이더리움 ETF 승인 기대",
+    "반도체 수출 증가세 지속",
+    "부동산 시장 거래량 회복",
+]
+
+def build_sample_feed(name: str, n_items: int = 10) -> str:
+    items = []
+    for i in range(n_items):
+        title = SAMPLE_TITLES[(i + len(name)) % len(SAMPLE_TITLES)]
+        items.append(
+            f"<item><title>{title} ({name} {i})</title>"
+            f"<description>{name} 기사 요약 {i}</description>"
+            f"<link>http://localhost/{name}/{i}</link></item>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+        f"<title>{name}</title>{''.join(items)}</channel></rss>"
+    )
+
+
+class _FeedRequestHandler(BaseHTTPRequestHandler):
+    feeds = {}      # 경로 → (본문 bytes, ETag, Last-Modified)
+    delay = 0.0     # 응답 지연 (느린 언론사 흉내)
+
+    def do_GET(self):
+        feed = self.feeds.get(self.path)
+        if feed is None:
+            self.send_error(404)
+            return
+        body, etag, modified = feed
+
+        if self.delay:
+            time.sleep(self.delay)
+
+        if self.headers.get("If-None-Match") == etag or self.headers.get("If-Modified-Since") == modified:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/rss+xml; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", modified)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # 벤치마크 중 콘솔 출력 억제
+
+
+def start_feed_server(feeds: dict, delay: float = 0.0, host: str = "127.0.0.1", port: int = 0):
+    """
+    ✅ 로컬 RSS 서버를 백그라운드 스레드로 실행
+    - feeds: {피드명: RSS XML 문자열}
+    - delay: 요청마다 추가할 지연(초)
+    - 반환: (server, base_url), 종료는 server.shutdown()
+    """
+    modified = formatdate(usegmt=True)
+    table = {}
+    for name, xml in feeds.items():
+        body = xml.encode("utf-8")
+        etag = '"' + hashlib.md5(body).hexdigest() + '"'
+        table[f"/{name}.xml"] = (body, etag, modified)
+
+    handler = type("FeedRequestHandler", (_FeedRequestHandler,), {"feeds": table, "delay": delay})
+    server = ThreadingHTTPServer((host, port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{server.server_address[0]}:{server.server_address[1]}"
+
+def local_feed_list(base_url: str, names) -> list:
+    return [(name, f"{base_url}/{name}.xml") for name in names]
+
+
+# ✅ 단독 실행: 순차 수집 vs 동시 수집 + 조건부 요청 비교
+if __name__ == "__main__":
+    from utils import news_fetcher
+
+    names = [f"feed{i}" for i in range(6)]
+    server, url = start_feed_server({name: build_sample_feed(name) for name in names}, delay=0.2)
+    feeds = local_feed_list(url, names)
+
+    started = time.perf_counter()
+    for name, feed_url in feeds:
+        news_fetcher.fetch_feed_entries(feed_url)
+    sequential = time.perf_counter() - started
+    news_fetcher.FEED_CACHE.clear()
+
+    started = time.perf_counter()
+    news = news_fetcher.fetch_news(feeds=feeds)
+    concurrent = time.perf_counter() - started
+
+    started = time.perf_counter()
+    news_fetcher.fetch_news(feeds=feeds)
+    conditional = time.perf_counter() - started
+    server.shutdown()
+
+    print(f"📰 기사 {len(news)}건 | 순차: {sequential:.2f}s | 동시: {concurrent:.2f}s | 조건부(304): {conditional:.2f}s")
+    print(f"📊 {news_fetcher.FEED_STATS}")
@@ -2,13 +2,10 @@
 """
 🤖 Grok 또는 GPT 기반 전략 분석 모듈
 - 기술 지표 + 감정 점수 + 뉴스 제목 기반으로 전략 분석 요청
-- OpenAI(gpt-4 또는 grok)를 사용해 응답 처리
+- OpenAI(gpt-4 또는 grok)를 사용해 응답 처리 (modules/llm_client.py 공용 클라이언트)
 """
 
-import os
-from openai import OpenAI
-
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))  # ✅ openai>=1.0.0 구조 반영
+from modules.llm_client import get_llm_client
 
 def get_grok_response(indicators: dict, sentiment_score: float, news_data: list) -> dict:
     """
@@ -47,15 +44,15 @@ def get_grok_response(indicators: dict, sentiment_score: float, news_data: list)
 """
 
     try:
-        response = client.chat.completions.create(
-            model="gpt-4",
-            messages=[
+        text = get_llm_client("openai").chat(
+            [
                 {"role": "system", "content": "당신은 암호화폐 전문 트레이더입니다."},
                 {"role": "user", "content": prompt}
             ],
+            model="gpt-4",
             temperature=0.7,
         )
-        return {"text": response.choices[0].message.content.strip()}
+        return {"text": text.strip()}
 
     except Exception as e:
         print("⚠️ Grok 응답 오류:", e)
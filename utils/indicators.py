@@ -4,6 +4,12 @@
 📌 기능:
   - get_indicators(symbol, timeframe): 심볼과 타임프레임에 대한 주요 기술적 지표 계산
   - detect_rsi_divergence(df): 시가/종가 기반 RSI 다이버전스 판단
+  - get_indicators_batch(symbols, timeframe): 여러 심볼 지표를 (심볼 × 시간) 2차원 배열로 일괄 계산
+  - get_multi_timeframe_indicators(symbol, timeframes): 기본 캔들 1회 조회로 여러 프레임 지표 일괄 계산
+  - indicators_from_base_frame(base_df, timeframes): 조회된 캔들로 다중 프레임 지표 계산 (CPU 전용)
+  - compute_rolling_stats(close): RSI + rolling 평균/표준편차/최저/최고 통합 계산 (NumPy)
+  - IndicatorState: 새 캔들 1개마다 O(1)로 지표를 갱신하는 스트리밍 상태
+  - get_indicator_state(symbol, timeframe): (심볼, 타임프레임)별 IndicatorState 조회/생성
 📌 포함 지표:
   - RSI (상대강도지수, 기준: 20/80)
   - EMA / TEMA
@@ -14,9 +20,13 @@
   ▶ "캔들 데이터를 받아 RSI, MACD, EMA, TEMA, 볼린저 밴드를 계산하고, 시가/종가 기반 RSI 다이버전스 여부까지 판단하라."
 """
 
+import math
+from collections import deque
+
 import numpy as np
 import pandas as pd
-from utils.ohlcv import fetch_ohlcv_data
+from utils.ohlcv import resample_ohlcv, timeframe_to_minutes
+from utils.candle_store import load_candles
 
 def calculate_rsi(series, period=14):
     delta = series.diff()
@@ -40,63 +50,121 @@ def calculate_macd(series, fast=12, slow=26):
     ema_slow = calculate_ema(series, slow)
     return ema_fast - ema_slow
 
-def detect_rsi_divergence(df: pd.DataFrame) -> str:
+def _rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
     """
-    시가/종가 기준 RSI 다이버전스 판단
-    - 강세: 종가 저점 ↓, RSI 저점 ↑
-    - 약세: 종가 고점 ↑, RSI 고점 ↓
+    누적합 기반 rolling 합계 (마지막 축 기준, 앞쪽 window-1개는 NaN)
     """
-    close = df["close"]
-    open_ = df["open"]
-    rsi = calculate_rsi(close)
+    out = np.full(values.shape, np.nan)
+    if values.shape[-1] < window:
+        return out
+    csum = np.cumsum(values, axis=-1)
+    out[..., window - 1] = csum[..., window - 1]
+    out[..., window:] = csum[..., window:] - csum[..., :-window]
+    return out
 
-    if len(df) < 30:
-        return "데이터 부족"
+def _rolling_extrema(values: np.ndarray, window: int) -> tuple:
+    """
+    sliding window 뷰 1개로 rolling min/max 동시 계산 (복사 없음)
+    """
+    low = np.full(values.shape, np.nan)
+    high = np.full(values.shape, np.nan)
+    if values.shape[-1] < window:
+        return low, high
+    view = np.lib.stride_tricks.sliding_window_view(values, window, axis=-1)
+    low[..., window - 1:] = view.min(axis=-1)
+    high[..., window - 1:] = view.max(axis=-1)
+    return low, high
 
-    # 강세 다이버전스 (최근 저점 ↓ / RSI 저점 ↑)
-    recent_close_low = close.rolling(14).min().iloc[-1]
-    prev_close_low = close.rolling(14).min().iloc[-2]
+def compute_rolling_stats(close, bb_window: int = 20, extrema_window: int = 14, rsi_period: int = 14) -> dict:
+    """
+    ✅ 통합 rolling 커널: 종가 배열 1회 순회로 지표 공통 통계 계산
+    - RSI (rolling mean 방식, calculate_rsi와 동일)
+    - 볼린저 밴드용 rolling 평균/표준편차 (ddof=1)
+    - 다이버전스용 종가/RSI rolling 최저/최고
+    - 입력은 1차원(시간) 또는 마지막 축이 시간인 N차원 배열
+    """
+    close = np.asarray(close, dtype=float)
 
-    recent_rsi_low = rsi.rolling(14).min().iloc[-1]
-    prev_rsi_low = rsi.rolling(14).min().iloc[-2]
+    # RSI: 첫 캔들 변화량은 0으로 처리 (pandas diff → where 결과와 동일)
+    delta = np.zeros(close.shape)
+    delta[..., 1:] = np.diff(close, axis=-1)
+    avg_gain = _rolling_sum(np.where(delta > 0, delta, 0.0), rsi_period) / rsi_period
+    avg_loss = _rolling_sum(np.where(delta < 0, -delta, 0.0), rsi_period) / rsi_period
+    rs = avg_gain / (avg_loss + 1e-10)
+    rsi = 100 - (100 / (1 + rs))
 
-    if recent_close_low < prev_close_low and recent_rsi_low > prev_rsi_low:
-        return "강세 다이버전스"
+    # 볼린저 밴드: 기준값을 빼서 제곱합 상쇄 오차 최소화
+    shift = close[..., :1]
+    centered = close - shift
+    window_sum = _rolling_sum(centered, bb_window)
+    window_sq_sum = _rolling_sum(centered * centered, bb_window)
+    bb_mean = window_sum / bb_window
+    bb_var = (window_sq_sum - window_sum * bb_mean) / (bb_window - 1)
+    bb_std = np.sqrt(np.maximum(bb_var, 0.0))
+    bb_mean = bb_mean + shift
 
-    # 약세 다이버전스 (최근 고점 ↑ / RSI 고점 ↓)
-    recent_close_high = close.rolling(14).max().iloc[-1]
-    prev_close_high = close.rolling(14).max().iloc[-2]
+    close_min, close_max = _rolling_extrema(close, extrema_window)
+    rsi_min, rsi_max = _rolling_extrema(rsi, extrema_window)
 
-    recent_rsi_high = rsi.rolling(14).max().iloc[-1]
-    prev_rsi_high = rsi.rolling(14).max().iloc[-2]
+    return {
+        "rsi": rsi,
+        "bb_mean": bb_mean,
+        "bb_std": bb_std,
+        "close_min": close_min,
+        "close_max": close_max,
+        "rsi_min": rsi_min,
+        "rsi_max": rsi_max,
+    }
+
+def _divergence_from_stats(stats: dict, length: int) -> str:
+    if length < 30:
+        return "데이터 부족"
+
+    # 강세 다이버전스 (최근 저점 ↓ / RSI 저점 ↑)
+    close_min, rsi_min = stats["close_min"], stats["rsi_min"]
+    if close_min[-1] < close_min[-2] and rsi_min[-1] > rsi_min[-2]:
+        return "강세 다이버전스"
 
-    if recent_close_high > prev_close_high and recent_rsi_high < prev_rsi_high:
+    # 약세 다이버전스 (최근 고점 ↑ / RSI 고점 ↓)
+    close_max, rsi_max = stats["close_max"], stats["rsi_max"]
+    if close_max[-1] > close_max[-2] and rsi_max[-1] < rsi_max[-2]:
         return "약세 다이버전스"
 
     return "없음"
 
-def get_indicators(symbol: str, timeframe: str = "15m") -> dict:
+def _bb_location_from_stats(close: float, stats: dict) -> str:
+    upper_bb = stats["bb_mean"][-1] + 2 * stats["bb_std"][-1]
+    lower_bb = stats["bb_mean"][-1] - 2 * stats["bb_std"][-1]
+    return "상단" if close >= upper_bb else \
+           "하단" if close <= lower_bb else "중앙"
+
+def detect_rsi_divergence(df: pd.DataFrame, stats: dict = None) -> str:
     """
-    ✅ 전략 판단용 기술적 지표 + 다이버전스 포함
+    시가/종가 기준 RSI 다이버전스 판단
+    - 강세: 종가 저점 ↓, RSI 저점 ↑
+    - 약세: 종가 고점 ↑, RSI 고점 ↓
+    - stats: compute_rolling_stats() 결과 (get_indicators에서 재사용, 없으면 새로 계산)
     """
-    df = fetch_ohlcv_data(symbol, timeframe)
+    if len(df) < 30:
+        return "데이터 부족"
+    if stats is None:
+        stats = compute_rolling_stats(df["close"].to_numpy(dtype=float))
+    return _divergence_from_stats(stats, len(df))
+
+def _indicators_from_df(df: pd.DataFrame) -> dict:
     if df is None or df.empty:
         return {}
 
     close = df["close"]
+    stats = compute_rolling_stats(close.to_numpy(dtype=float))
 
-    rsi = calculate_rsi(close).iloc[-1]
+    rsi = stats["rsi"][-1]
     ema = calculate_ema(close).iloc[-1]
     tema = calculate_tema(close).iloc[-1]
     macd = calculate_macd(close).iloc[-1]
 
-    upper_bb = close.rolling(window=20).mean() + 2 * close.rolling(window=20).std()
-    lower_bb = close.rolling(window=20).mean() - 2 * close.rolling(window=20).std()
-
-    bb_location = "상단" if close.iloc[-1] >= upper_bb.iloc[-1] else \
-                  "하단" if close.iloc[-1] <= lower_bb.iloc[-1] else "중앙"
-
-    divergence = detect_rsi_divergence(df)
+    bb_location = _bb_location_from_stats(close.iloc[-1], stats)
+    divergence = detect_rsi_divergence(df, stats)
 
     return {
         "rsi": round(rsi, 2),
@@ -107,3 +175,278 @@ def get_indicators(symbol: str, timeframe: str = "15m") -> dict:
         "divergence": divergence,
         "close": close.iloc[-1]
     }
+
+def get_indicators(symbol: str, timeframe: str = "15m") -> dict:
+    """
+    ✅ 전략 판단용 기술적 지표 + 다이버전스 포함
+    """
+    return _indicators_from_df(load_candles(symbol, timeframe))
+
+def get_indicators_batch(symbols, timeframe: str = "15m", limit: int = 100) -> dict:
+    """
+    ✅ 다중 심볼 지표 일괄 계산
+    - 심볼별 종가를 (심볼 × 시간) 2차원 배열로 쌓아 모든 지표를 한 번에 벡터 연산
+    - 심볼 간 캔들은 시각(인덱스) 기준으로 정렬해 모든 심볼에 있는 공통 시각만 사용 (누락 캔들로 인한 어긋남 방지)
+    - 공통 시각이 없으면 심볼별 개별 계산
+    - 반환: {symbol: get_indicators()와 같은 형태의 dict} (데이터 없는 심볼은 {})
+    """
+    frames = {}
+    for symbol in symbols:
+        df = load_candles(symbol, timeframe, limit=limit)
+        if df is not None and not df.empty:
+            frames[symbol] = df
+
+    results = {symbol: {} for symbol in symbols}
+    if not frames:
+        return results
+
+    valid_symbols = list(frames.keys())
+    aligned = pd.concat([frames[s]["close"] for s in valid_symbols], axis=1, join="inner", keys=valid_symbols)
+    aligned = aligned[~aligned.index.duplicated(keep="last")].sort_index().dropna()
+    if aligned.empty:
+        print("⚠️ 심볼 간 공통 캔들 시각이 없어 심볼별로 지표를 계산합니다.")
+        return {**results, **{symbol: _indicators_from_df(df) for symbol, df in frames.items()}}
+
+    length = len(aligned)
+    close = aligned.to_numpy(dtype=float).T
+
+    stats = compute_rolling_stats(close)
+
+    # EMA 계열은 (시간 × 심볼) DataFrame 하나로 모든 심볼 동시 계산
+    close_df = pd.DataFrame(close.T)
+    ema = calculate_ema(close_df).to_numpy()[-1]
+    tema = calculate_tema(close_df).to_numpy()[-1]
+    macd = calculate_macd(close_df).to_numpy()[-1]
+
+    for i, symbol in enumerate(valid_symbols):
+        row_stats = {key: values[i] for key, values in stats.items()}
+        last_close = close[i, -1]
+        results[symbol] = {
+            "rsi": round(row_stats["rsi"][-1], 2),
+            "ema": round(ema[i], 2),
+            "tema": round(tema[i], 2),
+            "macd": round(macd[i], 2),
+            "bb": _bb_location_from_stats(last_close, row_stats),
+            "divergence": _divergence_from_stats(row_stats, length),
+            "close": last_close
+        }
+    return results
+
+def _timeframe_ratios(timeframes, base_timeframe: str) -> dict:
+    base_minutes = timeframe_to_minutes(base_timeframe)
+    ratios = {}
+    for tf in timeframes:
+        minutes = timeframe_to_minutes(tf)
+        if minutes % base_minutes != 0:
+            raise ValueError(f"{tf}는 기본 프레임 {base_timeframe}의 배수가 아닙니다.")
+        ratios[tf] = minutes // base_minutes
+    return ratios
+
+def indicators_from_base_frame(base_df: pd.DataFrame, timeframes=("15m", "1h", "4h"),
+                               base_timeframe: str = "15m", limit: int = 100) -> dict:
+    """
+    ✅ 이미 조회한 기본 프레임 캔들로 다중 타임프레임 지표 계산 (네트워크 없음 → 프로세스 풀에서 실행 가능)
+    """
+    ratios = _timeframe_ratios(timeframes, base_timeframe)
+    if base_df is None or base_df.empty:
+        return {tf: {} for tf in timeframes}
+
+    results = {}
+    for tf, ratio in ratios.items():
+        df = base_df if ratio == 1 else resample_ohlcv(base_df, tf, base_timeframe)
+        results[tf] = _indicators_from_df(df.iloc[-limit:])
+    return results
+
+def multi_timeframe_fetch_limit(timeframes=("15m", "1h", "4h"), base_timeframe: str = "15m", limit: int = 100) -> int:
+    # 가장 큰 프레임도 limit개 캔들이 나오도록 기본 캔들 조회량 결정 (앞뒤 미완성 구간 2개 여유)
+    return (limit + 2) * max(_timeframe_ratios(timeframes, base_timeframe).values())
+
+def get_multi_timeframe_indicators(symbol: str, timeframes=("15m", "1h", "4h"),
+                                   base_timeframe: str = "15m", limit: int = 100) -> dict:
+    """
+    ✅ 다중 타임프레임 지표 일괄 계산
+    - 기본 프레임 캔들을 1회만 조회하고 상위 프레임(1h, 4h 등)은 리샘플링으로 생성
+    - 모든 프레임이 같은 캔들 스트림에서 나오므로 프레임 간 시점이 일치
+    - 반환: {timeframe: get_indicators()와 같은 형태의 dict}
+    """
+    fetch_limit = multi_timeframe_fetch_limit(timeframes, base_timeframe, limit)
+    base_df = load_candles(symbol, base_timeframe, limit=fetch_limit)
+    return indicators_from_base_frame(base_df, timeframes, base_timeframe, limit)
+
+
+class IndicatorState:
+    """
+    ✅ 스트리밍 지표 상태 (심볼/타임프레임 1개 단위)
+    - 마감된 캔들의 종가를 update()로 하나씩 넣으면 RSI, EMA, TEMA, MACD, 볼린저 밴드,
+      RSI 다이버전스를 전체 재계산 없이 O(1)로 갱신
+    - as_dict()는 get_indicators()와 같은 형태의 dict 반환
+    """
+
+    RSI_PERIOD = 14
+    EMA_PERIOD = 14
+    MACD_FAST = 12
+    MACD_SLOW = 26
+    BB_PERIOD = 20
+    DIVERGENCE_WINDOW = 14
+    DIVERGENCE_MIN_CANDLES = 30
+    RESYNC_EVERY = 1000  # 누적 합 부동소수 오차 방지용 재합산 주기
+
+    def __init__(self):
+        self.count = 0
+        self.close = None
+
+        # RSI: 최근 14개 상승/하락폭과 그 합
+        self._gains = deque(maxlen=self.RSI_PERIOD)
+        self._losses = deque(maxlen=self.RSI_PERIOD)
+        self._gain_sum = 0.0
+        self._loss_sum = 0.0
+        self.rsi = float("nan")
+
+        # EMA 계열 (adjust=False 재귀식, 첫 값으로 초기화)
+        self._ema = {}
+
+        # 볼린저 밴드: 최근 20개 종가와 합/제곱합
+        self._bb_window = deque(maxlen=self.BB_PERIOD)
+        self._bb_sum = 0.0
+        self._bb_sq_sum = 0.0
+
+        # 다이버전스: 직전 2개 rolling min/max 비교용 (윈도우 + 1)
+        self._div_close = deque(maxlen=self.DIVERGENCE_WINDOW + 1)
+        self._div_rsi = deque(maxlen=self.DIVERGENCE_WINDOW + 1)
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> "IndicatorState":
+        """
+        기존 캔들 DataFrame으로 상태 초기화 (워밍업)
+        """
+        state = cls()
+        if df is not None and not df.empty:
+            for close in df["close"].to_numpy(dtype=float):
+                state.update(close)
+        return state
+
+    def _update_ema(self, key: str, value: float, period: int) -> float:
+        alpha = 2.0 / (period + 1)
+        prev = self._ema.get(key)
+        ema = value if prev is None else prev + alpha * (value - prev)
+        self._ema[key] = ema
+        return ema
+
+    def update(self, close: float) -> dict:
+        """
+        마감된 캔들 종가 1개 반영 후 최신 지표 dict 반환
+        """
+        close = float(close)
+
+        # RSI (rolling mean 방식, 첫 캔들은 변화량 0으로 처리 → pandas 결과와 동일)
+        delta = 0.0 if self.close is None else close - self.close
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        if len(self._gains) == self.RSI_PERIOD:
+            self._gain_sum -= self._gains[0]
+            self._loss_sum -= self._losses[0]
+        self._gains.append(gain)
+        self._losses.append(loss)
+        self._gain_sum += gain
+        self._loss_sum += loss
+        if len(self._gains) == self.RSI_PERIOD:
+            avg_gain = self._gain_sum / self.RSI_PERIOD
+            avg_loss = self._loss_sum / self.RSI_PERIOD
+            rs = avg_gain / (avg_loss + 1e-10)
+            self.rsi = 100 - (100 / (1 + rs))
+
+        # EMA / TEMA / MACD
+        ema1 = self._update_ema("ema1", close, self.EMA_PERIOD)
+        ema2 = self._update_ema("ema2", ema1, self.EMA_PERIOD)
+        ema3 = self._update_ema("ema3", ema2, self.EMA_PERIOD)
+        fast = self._update_ema("fast", close, self.MACD_FAST)
+        slow = self._update_ema("slow", close, self.MACD_SLOW)
+        self.ema = ema1
+        self.tema = 3 * (ema1 - ema2) + ema3
+        self.macd = fast - slow
+
+        # 볼린저 밴드
+        if len(self._bb_window) == self.BB_PERIOD:
+            old = self._bb_window[0]
+            self._bb_sum -= old
+            self._bb_sq_sum -= old * old
+        self._bb_window.append(close)
+        self._bb_sum += close
+        self._bb_sq_sum += close * close
+
+        # 다이버전스용 최근 값
+        self._div_close.append(close)
+        self._div_rsi.append(self.rsi)
+
+        self.close = close
+        self.count += 1
+        if self.count % self.RESYNC_EVERY == 0:
+            self._resync()
+        return self.as_dict()
+
+    def _resync(self):
+        self._gain_sum = float(sum(self._gains))
+        self._loss_sum = float(sum(self._losses))
+        self._bb_sum = float(sum(self._bb_window))
+        self._bb_sq_sum = float(sum(v * v for v in self._bb_window))
+
+    def _bb_location(self) -> str:
+        n = self.BB_PERIOD
+        if len(self._bb_window) < n:
+            return "중앙"
+        mean = self._bb_sum / n
+        var = max((self._bb_sq_sum - n * mean * mean) / (n - 1), 0.0)
+        std = math.sqrt(var)
+        if self.close >= mean + 2 * std:
+            return "상단"
+        if self.close <= mean - 2 * std:
+            return "하단"
+        return "중앙"
+
+    def _divergence(self) -> str:
+        if self.count < self.DIVERGENCE_MIN_CANDLES:
+            return "데이터 부족"
+
+        close = list(self._div_close)
+        rsi = list(self._div_rsi)
+
+        # 강세 다이버전스 (최근 저점 ↓ / RSI 저점 ↑)
+        if min(close[1:]) < min(close[:-1]) and min(rsi[1:]) > min(rsi[:-1]):
+            return "강세 다이버전스"
+
+        # 약세 다이버전스 (최근 고점 ↑ / RSI 고점 ↓)
+        if max(close[1:]) > max(close[:-1]) and max(rsi[1:]) < max(rsi[:-1]):
+            return "약세 다이버전스"
+
+        return "없음"
+
+    def as_dict(self) -> dict:
+        """
+        get_indicators()와 동일한 형태의 지표 dict
+        """
+        if self.count == 0:
+            return {}
+        return {
+            "rsi": round(self.rsi, 2),
+            "ema": round(self.ema, 2),
+            "tema": round(self.tema, 2),
+            "macd": round(self.macd, 2),
+            "bb": self._bb_location(),
+            "divergence": self._divergence(),
+            "close": self.close
+        }
+
+
+_INDICATOR_STATES = {}
+
+def get_indicator_state(symbol: str, timeframe: str = "15m") -> IndicatorState:
+    """
+    ✅ (심볼, 타임프레임)별 스트리밍 지표 상태 조회
+    - 최초 호출 시에만 캔들 윈도우를 받아 워밍업, 이후에는 update()로 새 캔들만 반영
+    """
+    key = (symbol, timeframe)
+    state = _INDICATOR_STATES.get(key)
+    if state is None:
+        state = IndicatorState.from_dataframe(load_candles(symbol, timeframe))
+        _INDICATOR_STATES[key] = state
+    return state
@@ -0,0 +1,93 @@
+# 📁 파일명: utils/keyword_matcher.py
+"""
+📌 목적: 다수 키워드를 텍스트 1회 순회로 찾는 Aho-Corasick 다중 패턴 매처
+📌 기능:
+  - KeywordMatcher(keywords): 키워드(→ 가중치) 목록으로 오토마톤을 1회 컴파일
+      · find_all(text): [(키워드, 시작 위치, 가중치), ...] 모든 매칭 반환
+      · matched(text): 매칭된 키워드 → 가중치 dict (중복 등장은 1회로 계산)
+      · contains_any(text): 하나라도 포함되면 True (첫 매칭 시 즉시 종료)
+📌 특징:
+  - 키워드 수와 무관하게 텍스트 길이에 비례하는 시간으로 동작 (사전을 수천 개로 늘려도 선형 증가 없음)
+  - 뉴스 필터링(utils/news_fetcher.py)과 한글 감정 룰 엔진(utils/sentiment.py)이 같은 스캔 결과 공유
+📌 작업 프롬프트 요약:
+  ▶ "키워드마다 `in` 검사를 반복하지 말고, 한 번 컴파일한 오토마톤으로 텍스트를 한 번만 훑어 매칭 키워드와 위치, 가중치를 돌려줘라."
+"""
+
+from collections import deque
+
+
+class KeywordMatcher:
+    """
+    ✅ Aho-Corasick 오토마톤
+    - keywords: 키워드 리스트 (가중치 1.0) 또는 {키워드: 가중치} dict
+    """
+
+    def __init__(self, keywords):
+        if not isinstance(keywords, dict):
+            keywords = {keyword: 1.0 for keyword in keywords}
+        self.weights = dict(keywords)
+
+        self._goto = [{}]      # 상태별 전이: 문자 → 다음 상태
+        self._fail = [0]       # 실패 링크
+        self._output = [[]]    # 상태에서 끝나는 키워드 목록 (실패 링크 출력 포함)
+        for keyword in self.weights:
+            if keyword:
+                self._add(keyword)
+        self._build()
+
+    def _add(self, keyword: str):
+        state = 0
+        for ch in keyword:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = nxt
+        self._output[state].append(keyword)
+
+    def _build(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._output[nxt] = self._output[nxt] + self._output[self._fail[nxt]]
+
+    def _scan(self, text: str):
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for pos, ch in enumerate(text or ""):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if output[state]:
+                for keyword in output[state]:
+                    yield keyword, pos - len(keyword) + 1
+
+    def find_all(self, text: str) -> list:
+        """
+        모든 매칭 [(키워드, 시작 위치, 가중치), ...] (위치 순)
+        """
+        return [(keyword, start, self.weights[keyword]) for keyword, start in self._scan(text)]
+
+    def matched(self, text: str) -> dict:
+        """
+        매칭된 키워드 → 가중치 (여러 번 등장해도 1회)
+        """
+        return {keyword: self.weights[keyword] for keyword, _ in self._scan(text)}
+
+    def contains_any(self, text: str) -> bool:
+        for _ in self._scan(text):
+            return True
+        return False
+
+    def __len__(self):
+        return len(self.weights)
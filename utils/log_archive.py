@@ -0,0 +1,293 @@
+# 📁 파일명: utils/log_archive.py
+"""
+📌 목적: 전략/거래/시뮬레이션 로그를 날짜·심볼로 파티션한 Parquet(컬럼형) 아카이브로 압축하고,
+        필요한 컬럼만 조건 푸시다운으로 읽어 분석 도구에 NumPy / pandas 형태로 제공
+📌 기능:
+  - compact_logs(datasets): 원본 로그에서 지난 압축 이후 추가된 기록만 Parquet로 기록 (증분)
+  - query_archive(dataset, columns, since, until, symbols, where): 파티션(date/symbol) 가지치기 +
+    행 그룹 통계(timestamp) 기반 필터로 필요한 컬럼만 조회 → DataFrame 또는 {컬럼: np.ndarray}
+  - optimize_archive(dataset): 파티션 안의 작은 파일들을 1개로 병합 (압축을 자주 돌린 경우)
+  - parse_timestamps(values): 로그 timestamp 일괄 파싱 (시간 분석 도구와 공용)
+📌 데이터셋:
+  - "strategy"    : logs/strategy_log.jsonl (전략 판단 로그)
+  - "trades"      : logs/trade_log.jsonl (auto_trader 수익률 로그)
+  - "simulation"  : 거래 저널 source="simulation" (result 누락 시 profit 기준 WIN/LOSS/HOLD 보완)
+  - "auto_trader" : 거래 저널 source="auto_trader"
+📌 저장 구조 (data/archive/):
+  - {dataset}/date=YYYY-MM-DD/symbol=BTCUSDT/part-*.parquet (zstd, timestamp 정렬)
+  - 고정 컬럼 외 필드는 extra 컬럼(JSON 문자열)에 보관, 심볼 없는 기록은 symbol=unknown
+  - _state.json: 데이터셋별 압축 위치 (jsonl 바이트 오프셋 / 저널 id)
+📌 작업 프롬프트 요약:
+  ▶ "분석 도구마다 전체 JSON 로그를 json.load 하지 말고, 날짜/심볼 파티션 Parquet로 압축한 뒤 필요한 컬럼만 조건 푸시다운으로 읽어라."
+"""
+
+import os
+import json
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
+from utils.trade_journal import get_trade_journal
+
+ARCHIVE_DIR = "data/archive"
+STATE_FILE = "_state.json"
+UNKNOWN_PARTITION = "unknown"
+COMPACT_CHUNK = 50_000          # 한 번에 Parquet로 기록할 최대 행 수
+OPTIMIZE_MIN_FILES = 8          # 파티션 파일이 이 개수 이상이면 병합
+
+FLOAT = pa.float64()
+STRING = pa.string()
+
+TRADE_COLUMNS = {
+    "signal": STRING, "tp": FLOAT, "sl": FLOAT, "entry_price": FLOAT, "profit": FLOAT, "result": STRING,
+    "rsi": FLOAT, "ema": FLOAT, "tema": FLOAT, "macd": FLOAT, "bb": STRING,
+    "sentiment_score": FLOAT, "ai_prediction": STRING,
+}
+STRATEGY_COLUMNS = {
+    "signal": STRING, "tp": FLOAT, "sl": FLOAT, "rsi": FLOAT, "ema": FLOAT, "tema": FLOAT, "macd": FLOAT,
+    "bb": STRING, "sentiment": FLOAT, "ai_prediction": STRING, "reason": STRING,
+}
+TRADE_LOG_COLUMNS = {"strategy": STRING, "source": STRING, "return": FLOAT}
+
+DATASETS = {
+    "strategy": {"jsonl": "logs/strategy_log.jsonl", "columns": STRATEGY_COLUMNS},
+    "trades": {"jsonl": "logs/trade_log.jsonl", "columns": TRADE_LOG_COLUMNS},
+    "simulation": {"journal": "simulation", "columns": TRADE_COLUMNS, "fill_result": True},
+    "auto_trader": {"journal": "auto_trader", "columns": TRADE_COLUMNS, "fill_result": True},
+}
+
+# 파티션 값은 문자열로 고정 (날짜/숫자처럼 보이는 값의 타입 추론 방지)
+PARTITIONING = ds.partitioning(pa.schema([("date", STRING), ("symbol", STRING)]), flavor="hive")
+_BASE_FIELDS = ("timestamp", "time", "symbol")
+
+
+def _partition_symbol(symbol) -> str:
+    if symbol is None or (isinstance(symbol, float) and np.isnan(symbol)) or symbol == "":
+        return UNKNOWN_PARTITION
+    return str(symbol).replace("/", "").replace(":", "").upper()
+
+def _schema(columns: dict) -> pa.Schema:
+    fields = [("timestamp", pa.timestamp("us"))] + list(columns.items()) + [("extra", STRING)]
+    return pa.schema(fields + [("date", STRING), ("symbol", STRING)])
+
+def parse_timestamps(values: pd.Series) -> pd.Series:
+    """
+    로그 timestamp 문자열 → datetime64 (파싱 실패는 NaT, 시간대 혼재 시 UTC 기준 naive)
+    """
+    try:
+        return pd.to_datetime(values, format="ISO8601", errors="coerce")
+    except (ValueError, TypeError):
+        # 시간대가 섞인 경우 → UTC 기준으로 맞춘 뒤 시간대 정보 제거
+        return pd.to_datetime(values, format="ISO8601", errors="coerce", utc=True).dt.tz_localize(None)
+
+def _to_table(entries: list, spec: dict) -> pa.Table:
+    """
+    로그 dict 목록 → 고정 스키마 Arrow 테이블 (timestamp 정렬)
+    """
+    columns = spec["columns"]
+    df = pd.DataFrame.from_records(entries)
+    n = len(df)
+
+    raw_ts = df["timestamp"] if "timestamp" in df else pd.Series([None] * n, dtype=object)
+    if "time" in df:
+        raw_ts = raw_ts.where(raw_ts.notna(), df["time"])
+    out = {"timestamp": parse_timestamps(raw_ts.astype(object))}
+
+    for name, dtype in columns.items():
+        values = df[name] if name in df else pd.Series([None] * n, dtype=object)
+        if dtype == FLOAT:
+            out[name] = pd.to_numeric(values, errors="coerce").astype(float)
+        else:
+            out[name] = values.astype(object).where(values.notna(), None).map(
+                lambda v: v if v is None or isinstance(v, str) else str(v))
+
+    if spec.get("fill_result"):
+        profit = out["profit"].fillna(0.0).to_numpy()
+        derived = np.select([profit > 0, profit < 0], ["✅ WIN", "❌ LOSS"], "⚪ HOLD")
+        out["result"] = out["result"].where(out["result"].notna(), pd.Series(derived, index=df.index))
+
+    known = set(columns) | set(_BASE_FIELDS)
+    out["extra"] = pd.Series([
+        json.dumps(rest, ensure_ascii=False, default=str) if rest else None
+        for rest in ({k: v for k, v in entry.items() if k not in known} for entry in entries)
+    ], index=df.index, dtype=object)
+
+    out["date"] = out["timestamp"].dt.strftime("%Y-%m-%d").fillna(UNKNOWN_PARTITION)
+    symbols = df["symbol"] if "symbol" in df else pd.Series([None] * n, dtype=object)
+    out["symbol"] = symbols.map(_partition_symbol)
+
+    table = pa.Table.from_pandas(pd.DataFrame(out), schema=_schema(columns), preserve_index=False)
+    return table.sort_by("timestamp")
+
+def _write(table: pa.Table, dataset: str, root: str):
+    ds.write_dataset(
+        table, os.path.join(root, dataset), format="parquet", partitioning=PARTITIONING,
+        basename_template=f"part-{time.time_ns()}-{{i}}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+        max_partitions=100_000,          # 수년치 날짜 × 심볼 조합을 한 번에 기록하는 경우
+        file_options=ds.ParquetFileFormat().make_write_options(compression="zstd"),
+    )
+
+def _load_state(root: str) -> dict:
+    path = os.path.join(root, STATE_FILE)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (json.JSONDecodeError, OSError):
+        return {}
+
+def _save_state(state: dict, root: str):
+    path = os.path.join(root, STATE_FILE)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp, path)
+
+
+# ----- 압축 -----
+def _compact_jsonl(name: str, spec: dict, state: dict, root: str) -> int:
+    path = spec["jsonl"]
+    if not os.path.exists(path):
+        return 0
+    offset = state.get("offset", 0)
+    if os.path.getsize(path) < offset:
+        print(f"⚠️ {path} 파일이 줄어듦 (교체/잘림) → 처음부터 다시 압축")
+        offset = 0
+
+    written, skipped, entries = 0, 0, []
+    with open(path, "rb") as f:
+        f.seek(offset)
+        for line in f:
+            if not line.endswith(b"\n"):
+                break                      # 기록 중인 마지막 줄은 다음 압축에서 처리
+            offset += len(line)
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                skipped += 1
+                continue
+            if isinstance(entry, dict):
+                entries.append(entry)
+            if len(entries) >= COMPACT_CHUNK:
+                _write(_to_table(entries, spec), name, root)
+                written += len(entries)
+                entries = []
+                state["offset"] = offset
+    if entries:
+        _write(_to_table(entries, spec), name, root)
+        written += len(entries)
+    state["offset"] = offset
+    if skipped:
+        print(f"⚠️ {path}: 손상된 줄 {skipped}개 건너뜀")
+    return written
+
+def _compact_journal(name: str, spec: dict, state: dict, root: str) -> int:
+    journal = get_trade_journal()
+    written = 0
+    while True:
+        rows = journal.rows_after(state.get("last_id", 0), spec["journal"], COMPACT_CHUNK)
+        if not rows:
+            return written
+        _write(_to_table([entry for _, entry in rows], spec), name, root)
+        written += len(rows)
+        state["last_id"] = rows[-1][0]
+
+def compact_logs(datasets=None, root: str = ARCHIVE_DIR) -> dict:
+    """
+    ✅ 지난 압축 이후 추가된 로그만 Parquet 아카이브에 기록
+    - 반환: {데이터셋: 기록 행 수}
+    """
+    os.makedirs(root, exist_ok=True)
+    state = _load_state(root)
+    written = {}
+    for name in datasets or DATASETS:
+        spec = DATASETS[name]
+        dataset_state = state.setdefault(name, {})
+        try:
+            if "jsonl" in spec:
+                written[name] = _compact_jsonl(name, spec, dataset_state, root)
+            else:
+                written[name] = _compact_journal(name, spec, dataset_state, root)
+        except Exception as e:
+            print(f"❌ {name} 로그 압축 실패: {e}")
+            written[name] = 0
+        finally:
+            _save_state(state, root)
+    return written
+
+def optimize_archive(dataset: str, root: str = ARCHIVE_DIR, min_files: int = OPTIMIZE_MIN_FILES) -> int:
+    """
+    파티션별 작은 Parquet 파일들을 1개로 병합, 병합한 파티션 수 반환
+    """
+    import pyarrow.parquet as pq
+
+    merged = 0
+    for directory, _, files in os.walk(os.path.join(root, dataset)):
+        parts = sorted(f for f in files if f.endswith(".parquet"))
+        if len(parts) < min_files:
+            continue
+        paths = [os.path.join(directory, f) for f in parts]
+        table = pa.concat_tables([pq.read_table(p) for p in paths]).sort_by("timestamp")
+        target = os.path.join(directory, f"part-{time.time_ns()}-merged.parquet")
+        pq.write_table(table, target + ".tmp", compression="zstd")
+        os.replace(target + ".tmp", target)
+        for p in paths:
+            os.remove(p)
+        merged += 1
+    return merged
+
+
+# ----- 조회 -----
+def _time_scalar(value) -> pa.Scalar:
+    return pa.scalar(pd.Timestamp(value).to_pydatetime(), type=pa.timestamp("us"))
+
+def query_archive(dataset: str, columns: list = None, since: str = None, until: str = None,
+                  symbols=None, where=None, as_numpy: bool = False, root: str = ARCHIVE_DIR):
+    """
+    ✅ 아카이브 조회 (필요한 컬럼만 읽음)
+    - since / until: ISO 시각 문자열 (until 미포함), 날짜 파티션 가지치기 + timestamp 행 그룹 필터
+    - symbols: 심볼 목록 ("BTC/USDT" 또는 "BTCUSDT"), 결과의 symbol 컬럼은 "BTCUSDT" 형식
+    - where: 추가 pyarrow 조건식 (예: pc.field("signal") != "hold")
+    - as_numpy=True면 {컬럼: np.ndarray}, 아니면 timestamp 순 DataFrame
+    """
+    path = os.path.join(root, dataset)
+    if not os.path.isdir(path):
+        empty = columns or list(_schema(DATASETS[dataset]["columns"]).names)
+        return {name: np.array([]) for name in empty} if as_numpy else pd.DataFrame(columns=empty)
+
+    conditions = []
+    if since is not None:
+        conditions += [pc.field("date") >= str(since)[:10], pc.field("timestamp") >= _time_scalar(since)]
+    if until is not None:
+        conditions += [pc.field("date") <= str(until)[:10], pc.field("timestamp") < _time_scalar(until)]
+    if symbols:
+        if isinstance(symbols, str):
+            symbols = [symbols]
+        conditions.append(pc.field("symbol").isin([_partition_symbol(s) for s in symbols]))
+    if where is not None:
+        conditions.append(where)
+    expression = None
+    for condition in conditions:
+        expression = condition if expression is None else expression & condition
+
+    archive = ds.dataset(path, format="parquet", partitioning=PARTITIONING)
+    table = archive.to_table(columns=columns, filter=expression)
+    if "timestamp" in table.column_names:
+        table = table.sort_by("timestamp")
+    if as_numpy:
+        return {name: table.column(name).to_numpy(zero_copy_only=False) for name in table.column_names}
+    return table.to_pandas()
+
+
+# ✅ 단독 실행: 전체 로그 증분 압축
+if __name__ == "__main__":
+    for name, rows in compact_logs().items():
+        print(f"📦 {name}: {rows}행 압축")
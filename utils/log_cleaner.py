@@ -50,6 +50,9 @@ def clean_log_file(input_path: str, output_path: str = None, overwrite: bool = F
 
 # ✅ 예시 실행
 if __name__ == "__main__":
-    # 기본 테스트 로그 경로
+    # 기본 테스트 로그 경로 (거래 저널 → JSON 내보내기 후 정제)
+    from utils.trade_journal import get_trade_journal
+
     input_file = "logs/simulation/simulated_trades.json"
+    get_trade_journal().export_json(input_file, "simulation")
     clean_log_file(input_path=input_file)
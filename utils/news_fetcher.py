@@ -7,15 +7,22 @@ def example():
 📌 목적: 암호화폐 관련 주요 뉴스 수집 (RSS 기반, 한글 + 키워드 필터링)
 📌 기능:
   - fetch_news(): 지정된 언론사 RSS에서 뉴스 수집 및 코인 관련 기사 필터링
+  - fetch_all_feeds(): 모든 RSS를 스레드 풀로 동시 수집 (피드별 타임아웃)
+  - fetch_feed_entries(url): ETag/Last-Modified 조건부 요청 + 파싱 결과 캐시
 📌 구성 요소:
   - RSS_FEEDS: 국내 언론사 RSS 목록 (경제/블록체인 관련)
   - CRYPTO_KEYWORDS: 필터링용 주요 키워드 (뉴스 제목 및 요약에 적용)
+  - NEWS_KEYWORD_MATCHER: 필터링 + 감정 키워드 통합 Aho-Corasick 매처
 📌 작업 프롬프트 요약:
   ▶ "국내 주요 경제/블록체인 뉴스를 RSS로 수집하고, 암호화폐 관련 키워드가 포함된 기사만 걸러내어 최대 6개를 반환하라."
 """
 
 import feedparser
 import random
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from utils.keyword_matcher import KeywordMatcher
+from utils.sentiment import KO_SENTIMENT_WEIGHTS
 
 # ✅ 주요 한글 뉴스 RSS 출처 목록 (경제/암호화폐 중심)
 RSS_FEEDS = [
@@ -33,36 +40,127 @@ CRYPTO_KEYWORDS = [
     "리플", "XRP", "SEC", "ETF", "금융위", "나스닥", "파월", "연준", "CPI", "금리", "도지", 
     "테더", "테슬라", "트위터", "AI", "중국", "트럼프", "전쟁", "우크라이나", "하락", "급등"
 ]
+CRYPTO_KEYWORD_SET = set(CRYPTO_KEYWORDS)
+
+# 🔎 필터링 키워드 + 한글 감정 키워드를 하나의 오토마톤으로 컴파일 → 기사당 1회 스캔으로 필터링/감정 점수 공유
+NEWS_KEYWORD_MATCHER = KeywordMatcher({
+    **{keyword: 0.0 for keyword in CRYPTO_KEYWORDS},
+    **KO_SENTIMENT_WEIGHTS,
+})
+
+
+# ⏱️ 피드 동시 수집 설정
+FEED_TIMEOUT = 5          # 피드별 요청 타임아웃 (초)
+FEED_MAX_WORKERS = 8      # 동시 요청 스레드 수
+FEED_ENTRY_LIMIT = 10     # 피드당 검사할 최신 기사 수
+
+# url → {"etag", "modified", "entries"}: 조건부 요청(304) 시 이전 파싱 결과 재사용
+FEED_CACHE = {}
+FEED_STATS = {"requests": 0, "not_modified": 0, "errors": 0}
+_SESSION = None
+
+
+def _get_session():
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        _SESSION = requests.Session()
+    return _SESSION
+
+def fetch_feed_entries(url: str, timeout: float = FEED_TIMEOUT) -> list:
+    """
+    📡 RSS 1개 조회 (ETag / Last-Modified 조건부 요청)
+    - 변경 없음(304)이면 캐시된 파싱 결과 그대로 반환
+    - 실패 시 캐시가 있으면 캐시, 없으면 빈 리스트
+    - 반환: [{"title", "summary", "link"}, ...] (최신 FEED_ENTRY_LIMIT개)
+    """
+    cached = FEED_CACHE.get(url)
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("modified"):
+            headers["If-Modified-Since"] = cached["modified"]
 
+    FEED_STATS["requests"] += 1
+    try:
+        response = _get_session().get(url, headers=headers, timeout=timeout)
+        if response.status_code == 304 and cached:
+            FEED_STATS["not_modified"] += 1
+            return cached["entries"]
+        response.raise_for_status()
+    except Exception as e:
+        FEED_STATS["errors"] += 1
+        print(f"⚠️ RSS 수집 실패 ({url}): {e}")
+        return cached["entries"] if cached else []
 
-def fetch_news(max_articles=6):
+    feed = feedparser.parse(response.content)
+    entries = [
+        {
+            "title": entry.get("title", ""),
+            "summary": entry.get("summary", ""),
+            "link": entry.get("link", ""),
+        }
+        for entry in feed.entries[:FEED_ENTRY_LIMIT]
+    ]
+    FEED_CACHE[url] = {
+        "etag": response.headers.get("ETag"),
+        "modified": response.headers.get("Last-Modified"),
+        "entries": entries,
+    }
+    return entries
+
+def _select_news_item(name: str, entries: list):
+    """
+    코인 관련 키워드가 포함된 첫 기사 1개를 뉴스 항목으로 변환 (기관당 1개)
+    """
+    for entry in entries:
+        title = entry["title"]
+        summary = entry["summary"]
+        content = title + " " + summary
+
+        matches = NEWS_KEYWORD_MATCHER.matched(content)
+        if any(keyword in CRYPTO_KEYWORD_SET for keyword in matches):
+            return {
+                "title": title,
+                "summary": summary,
+                "url": entry["link"],
+                "source": name,
+                "sentiment": 0.0,
+                "language": "ko",
+                "keywords": matches  # 감정 분석에서 재사용 (analyze_news)
+            }
+    return None
+
+def fetch_all_feeds(feeds=None, timeout: float = FEED_TIMEOUT, max_workers: int = FEED_MAX_WORKERS) -> dict:
+    """
+    📥 모든 RSS를 스레드 풀로 동시 수집 → {언론사명: 기사 리스트}
+    - 사이클 지연 = 가장 느린 피드 1개 (타임아웃 상한)
+    """
+    feeds = feeds or RSS_FEEDS
+    results = {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(feeds)) or 1) as pool:
+        futures = {pool.submit(fetch_feed_entries, url, timeout): name for name, url in feeds}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    return results
+
+def fetch_news(max_articles=6, feeds=None, timeout: float = FEED_TIMEOUT):
     """
     📥 다기관 뉴스 기사 수집 및 필터링
     - 코인 관련 키워드 포함 기사만 추출
     - 기관당 하나씩 섞어서 최대 max_articles 반환
     - 감정분석용으로 텍스트 포함, 기본 감정 점수는 0.0
+    - 피드는 동시 수집, 변경 없는 피드는 조건부 요청으로 재파싱 생략
     """
-    all_news = []
+    feeds = feeds or RSS_FEEDS
+    entries_by_source = fetch_all_feeds(feeds, timeout)
 
-    for name, url in RSS_FEEDS:
-        feed = feedparser.parse(url)
-        for entry in feed.entries[:10]:
-            title = entry.get("title", "")
-            summary = entry.get("summary", "")
-            link = entry.get("link", "")
-            content = title + " " + summary
-
-            if any(keyword in content for keyword in CRYPTO_KEYWORDS):
-                news_item = {
-                    "title": title,
-                    "summary": summary,
-                    "url": link,
-                    "source": name,
-                    "sentiment": 0.0,
-                    "language": "ko"
-                }
-                all_news.append(news_item)
-                break  # 기관당 1개만 사용
+    all_news = []
+    for name, _ in feeds:
+        news_item = _select_news_item(name, entries_by_source.get(name, []))
+        if news_item:
+            all_news.append(news_item)
 
     # 무작위로 섞고, 상한 제한 적용
     random.shuffle(all_news)
@@ -0,0 +1,148 @@
+# 📁 파일명: utils/news_index.py
+"""
+📌 목적: 사이클 간 뉴스 중복 제거용 영구 인덱스
+📌 기능:
+  - NewsIndex: 기사 지문(정규화 URL / 제목 해시) → 최초 발견 시각 저장
+      · filter_new(news_list): 처음 보는 기사만 반환 (기록은 하지 않음)
+      · record_scored(news_list, scores): 점수 계산에 성공한 기사만 '본 기사'로 기록 + 롤링 윈도우에 보관
+        (분석 실패 기사는 기록되지 않아 다음 사이클에 다시 분석)
+      · recent_scored(hours) / rolling_sentiment(hours): 최근 윈도우 기사 및 평균 점수
+  - get_news_index(): 프로세스 공용 인덱스
+📌 저장 위치:
+  - data/news_index.json (변경 시 원자적 교체 저장, 보관 기간 지난 항목은 자동 정리)
+📌 작업 프롬프트 요약:
+  ▶ "이미 본 기사는 다시 필터링·감정 분석·LLM 프롬프트에 넣지 말고, 새 기사만 처리하면서 최근 점수는 롤링 윈도우로 유지하라."
+"""
+
+import os
+import re
+import json
+import time
+import hashlib
+import threading
+
+NEWS_INDEX_PATH = "data/news_index.json"
+SEEN_RETENTION_HOURS = 72    # 지문 보관 기간 (이보다 오래된 기사는 다시 보면 새 기사로 취급)
+SCORED_WINDOW_HOURS = 24     # 감정 점수 롤링 윈도우
+
+_WHITESPACE = re.compile(r"\s+")
+
+def _normalize(value: str) -> str:
+    return _WHITESPACE.sub(" ", value or "").strip().lower()
+
+def article_fingerprints(news: dict) -> list:
+    """
+    기사 지문 목록: 정규화 URL 해시 + 정규화 제목 해시 (둘 중 하나라도 보았으면 중복)
+    - URL은 쿼리스트링/말미 슬래시 제거 (추적 파라미터로 인한 중복 방지)
+    """
+    fingerprints = []
+    url = _normalize(news.get("url", "")).split("?")[0].split("#")[0].rstrip("/")
+    if url:
+        fingerprints.append("u:" + hashlib.sha1(url.encode("utf-8")).hexdigest())
+    title = _normalize(news.get("title", ""))
+    if title:
+        fingerprints.append("t:" + hashlib.sha1(title.encode("utf-8")).hexdigest())
+    return fingerprints
+
+
+class NewsIndex:
+    """
+    ✅ 영구 기사 지문 인덱스 + 감정 점수 롤링 윈도우
+    """
+
+    def __init__(self, path: str = NEWS_INDEX_PATH, retention_hours: float = SEEN_RETENTION_HOURS,
+                 window_hours: float = SCORED_WINDOW_HOURS):
+        self.path = path
+        self.retention_seconds = retention_hours * 3600
+        self.window_seconds = window_hours * 3600
+        self.seen = {}      # 지문 → 최초 발견 시각
+        self.scored = []    # [{"title", "source", "score", "first_seen"}, ...] (시간 순)
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return
+        self.seen = data.get("seen", {})
+        self.scored = data.get("scored", [])
+        self._prune(time.time())
+
+    def _prune(self, now: float):
+        self.seen = {fp: t for fp, t in self.seen.items() if now - t <= self.retention_seconds}
+        self.scored = [item for item in self.scored if now - item["first_seen"] <= self.window_seconds]
+
+    def save(self):
+        if not self.path:
+            return
+        with self._lock:
+            data = {"seen": dict(self.seen), "scored": list(self.scored)}
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def filter_new(self, news_list: list) -> list:
+        """
+        처음 보는 기사만 반환 (같은 목록 안 중복도 제외)
+        - '본 기사' 기록은 record_scored()에서 점수 계산에 성공한 기사만 수행
+        """
+        now = time.time()
+        new_items = []
+        batch = set()
+        with self._lock:
+            self._prune(now)
+            for news in news_list:
+                fingerprints = article_fingerprints(news)
+                if not fingerprints or any(fp in self.seen or fp in batch for fp in fingerprints):
+                    continue
+                batch.update(fingerprints)
+                news.setdefault("first_seen", now)
+                new_items.append(news)
+        return new_items
+
+    def record_scored(self, news_list: list, scores: list):
+        """
+        감정 점수가 매겨진 새 기사를 '본 기사'로 기록하고 롤링 윈도우에 추가
+        """
+        now = time.time()
+        with self._lock:
+            for news, score in zip(news_list, scores):
+                for fp in article_fingerprints(news):
+                    self.seen[fp] = news.get("first_seen", now)
+                self.scored.append({
+                    "title": news.get("title", ""),
+                    "source": news.get("source", ""),
+                    "score": score,
+                    "first_seen": news.get("first_seen", now),
+                })
+            self._prune(now)
+        self.save()
+
+    def recent_scored(self, hours: float = None) -> list:
+        window = (hours * 3600) if hours is not None else self.window_seconds
+        now = time.time()
+        return [item for item in self.scored if now - item["first_seen"] <= window]
+
+    def rolling_sentiment(self, hours: float = None, default: float = 0.0) -> float:
+        """
+        롤링 윈도우 기사들의 평균 감정 점수 (기사 없으면 default)
+        """
+        items = self.recent_scored(hours)
+        if not items:
+            return default
+        return sum(item["score"] for item in items) / len(items)
+
+
+_INDEX = None
+
+def get_news_index() -> NewsIndex:
+    global _INDEX
+    if _INDEX is None:
+        _INDEX = NewsIndex()
+    return _INDEX
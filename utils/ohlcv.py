@@ -2,36 +2,227 @@
 """
 📌 목적: OHLCV (시가, 고가, 저가, 종가, 거래량) 데이터 수집
 📌 기능:
-  - fetch_ohlcv_data(symbol, timeframe): 지정 심볼의 OHLCV 데이터 DataFrame 반환
+  - fetch_ohlcv_data(symbol, timeframe): 지정 심볼의 OHLCV 데이터 DataFrame 반환 (등록된 백엔드 사용)
+  - register_ohlcv_backend() / set_ohlcv_backend(): OHLCV 백엔드 등록 및 선택 (synthetic / replay / http / ccxt)
+  - get_ohlcv_fetch_stats(): 백엔드별 조회 지연 통계
+  - generate_synthetic_ohlcv(n_symbols, limit): 시드 고정 가능한 벡터화 랜덤워크 캔들 생성 (부하 테스트용)
+  - synthetic_to_frames(data, symbols): 합성 배열 → 심볼별 DataFrame 변환
+  - timeframe_to_minutes(timeframe): "15m", "1h", "4h", "1d" → 분 단위 변환
+  - resample_ohlcv(df, timeframe, base_timeframe): 하위 프레임 캔들로 상위 프레임 캔들 생성 (UTC 경계, 완성 캔들만)
 📌 설명:
-  - 현재는 샘플 데이터(임의 생성)로 구현되어 있으며, 추후 거래소 API 연동 가능
+  - 기본 백엔드는 샘플 데이터(임의 생성), 거래소/리플레이 백엔드는 utils/ohlcv_backends.py
 📌 작업 프롬프트 요약:
   ▶ "주어진 심볼과 타임프레임에 대한 OHLCV 데이터를 반환하는 함수로 구성하되, 초기에는 무작위 데이터 생성 방식으로 제공하라."
 """
 
+import os
+import time
+from datetime import datetime
+
+import numpy as np
 import pandas as pd
-import random
-from datetime import datetime, timedelta
-
-def fetch_ohlcv_data(symbol: str, timeframe: str = "15m", limit: int = 100):
-    """
-    샘플 OHLCV 데이터를 생성하여 DataFrame 반환
-    - 향후 거래소 연동 시 교체 가능
-    """
-    now = datetime.now()
-    data = []
-    base_price = 27500
-
-    for i in range(limit):
-        time = now - timedelta(minutes=15 * (limit - i))
-        open_price = base_price + random.uniform(-100, 100)
-        close_price = open_price + random.uniform(-50, 50)
-        high_price = max(open_price, close_price) + random.uniform(0, 30)
-        low_price = min(open_price, close_price) - random.uniform(0, 30)
-        volume = random.uniform(100, 1000)
-        data.append([time, open_price, high_price, low_price, close_price, volume])
-        base_price = close_price  # 다음 캔들 기준
-
-    df = pd.DataFrame(data, columns=["timestamp", "open", "high", "low", "close", "volume"])
-    df.set_index("timestamp", inplace=True)
-    return df
+
+BASE_PRICE = 27500
+# 캔들 인덱스는 로컬 naive 시각 → 거래소(UTC 기준) 상위 프레임 경계에 맞추기 위한 로컬 UTC 오프셋
+LOCAL_UTC_OFFSET = datetime.now().astimezone().utcoffset()
+
+# 변동성 국면: 노이즈 배율 (잔잔 / 보통 / 급변)
+DEFAULT_VOLATILITY_REGIMES = (0.5, 1.0, 2.5)
+
+def generate_synthetic_ohlcv(n_symbols: int = 1, limit: int = 100, timeframe: str = "15m", seed=None,
+                             base_price=BASE_PRICE, regimes=DEFAULT_VOLATILITY_REGIMES,
+                             regime_switch_prob: float = 0.0, gap_prob: float = 0.0,
+                             jump_prob: float = 0.0, jump_scale: float = 500.0, end=None) -> dict:
+    """
+    ✅ NumPy 랜덤워크 기반 합성 OHLCV 생성기 (심볼 여러 개 동시 생성)
+    - 기존 샘플 생성 규칙과 동일: 시가 = 직전 종가 ± 100, 종가 = 시가 ± 50,
+      고가/저가 = 시가·종가 바깥 0~30, 거래량 100~1000
+    - regimes / regime_switch_prob: 캔들마다 확률적으로 변동성 국면(노이즈 배율) 전환
+    - jump_prob / jump_scale: 시가 가격 갭 발생 확률과 크기(표준편차)
+    - gap_prob: 캔들 누락 확률 (거래소 장애 등), valid 마스크로 표시
+    - seed 지정 시 재현 가능한 데이터 생성
+    - 반환: {"timestamp": (limit,), "open"/"high"/"low"/"close"/"volume": (n_symbols, limit), "valid": bool 마스크}
+    """
+    rng = np.random.default_rng(seed)
+    shape = (n_symbols, limit)
+
+    scale = np.ones(shape)
+    if regime_switch_prob > 0 and len(regimes) > 1:
+        switches = np.cumsum(rng.random(shape) < regime_switch_prob, axis=1)
+        regime_ids = rng.integers(len(regimes), size=(n_symbols, limit + 1))
+        scale = np.asarray(regimes, dtype=float)[np.take_along_axis(regime_ids, switches, axis=1)]
+
+    open_move = rng.uniform(-100, 100, shape) * scale
+    if jump_prob > 0:
+        open_move += np.where(rng.random(shape) < jump_prob, rng.normal(0, jump_scale, shape), 0.0)
+    body = rng.uniform(-50, 50, shape) * scale
+
+    # 변동폭은 BASE_PRICE 기준 비율로 누적 (긴 구간에서도 가격이 음수가 되지 않도록 기하 랜덤워크)
+    base = np.broadcast_to(np.asarray(base_price, dtype=float).reshape(-1, 1), (n_symbols, 1))
+    close = base * np.exp(np.cumsum((open_move + body) / BASE_PRICE, axis=1))
+    open_ = close * np.exp(-body / BASE_PRICE)
+    level = close / BASE_PRICE
+    high = np.maximum(open_, close) + rng.uniform(0, 30, shape) * scale * level
+    low = np.minimum(open_, close) - rng.uniform(0, 30, shape) * scale * level
+    volume = rng.uniform(100, 1000, shape)
+
+    frame = pd.Timedelta(minutes=timeframe_to_minutes(timeframe))
+    end = pd.Timestamp.now() if end is None else pd.Timestamp(end)
+    last_open = end.floor(frame) - frame  # 마지막 캔들 = 가장 최근에 마감된 캔들
+    timestamp = pd.date_range(end=last_open, periods=limit, freq=frame).values
+
+    valid = rng.random(shape) >= gap_prob if gap_prob > 0 else np.ones(shape, dtype=bool)
+
+    return {
+        "timestamp": timestamp,
+        "open": open_,
+        "high": high,
+        "low": low,
+        "close": close,
+        "volume": volume,
+        "valid": valid,
+    }
+
+def synthetic_to_frames(data: dict, symbols) -> dict:
+    """
+    generate_synthetic_ohlcv() 결과를 {symbol: fetch_ohlcv_data()와 같은 DataFrame}으로 변환
+    - 누락(gap) 캔들은 제외
+    """
+    frames = {}
+    index = pd.DatetimeIndex(data["timestamp"], name="timestamp")
+    for i, symbol in enumerate(symbols):
+        mask = data["valid"][i]
+        df = pd.DataFrame({
+            "open": data["open"][i],
+            "high": data["high"][i],
+            "low": data["low"][i],
+            "close": data["close"][i],
+            "volume": data["volume"][i],
+        }, index=index)
+        frames[symbol] = df if mask.all() else df[mask]
+    return frames
+
+def synthetic_backend(symbol: str, timeframe: str = "15m", limit: int = 100, seed=None, **kwargs):
+    """
+    합성 캔들 백엔드 (generate_synthetic_ohlcv 기반, 기본값)
+    """
+    data = generate_synthetic_ohlcv(1, limit, timeframe, seed=seed, **kwargs)
+    return synthetic_to_frames(data, [symbol])[symbol]
+
+# ✅ OHLCV 백엔드 레지스트리: 이름 → fetch(symbol, timeframe, limit, **kwargs) 함수
+OHLCV_BACKENDS = {"synthetic": synthetic_backend}
+OHLCV_BACKEND = os.getenv("OHLCV_BACKEND", "synthetic")
+OHLCV_FETCH_STATS = {}
+
+def register_ohlcv_backend(name: str, fetch_fn):
+    """
+    OHLCV 백엔드 등록 (같은 이름이면 교체)
+    """
+    OHLCV_BACKENDS[name] = fetch_fn
+
+def set_ohlcv_backend(name: str):
+    """
+    fetch_ohlcv_data()가 기본으로 사용할 백엔드 지정
+    """
+    global OHLCV_BACKEND
+    get_ohlcv_backend(name)
+    OHLCV_BACKEND = name
+
+def get_ohlcv_backend(name: str = None):
+    """
+    이름으로 백엔드 조회 (replay / http / ccxt 등 추가 백엔드는 utils/ohlcv_backends.py에서 등록)
+    """
+    name = name or OHLCV_BACKEND
+    if name not in OHLCV_BACKENDS:
+        import utils.ohlcv_backends  # noqa: F401  (import 시 추가 백엔드 등록)
+    if name not in OHLCV_BACKENDS:
+        raise ValueError(f"등록되지 않은 OHLCV 백엔드: {name}")
+    return OHLCV_BACKENDS[name]
+
+def get_ohlcv_fetch_stats() -> dict:
+    """
+    백엔드별 조회 횟수 / 평균·최대 지연(ms) 요약
+    """
+    summary = {}
+    for name, stats in OHLCV_FETCH_STATS.items():
+        count = stats["count"]
+        summary[name] = {
+            "count": count,
+            "errors": stats["errors"],
+            "avg_ms": round(stats["total_ms"] / count, 3) if count else 0.0,
+            "max_ms": round(stats["max_ms"], 3),
+        }
+    return summary
+
+def fetch_ohlcv_data(symbol: str, timeframe: str = "15m", limit: int = 100, backend: str = None, **kwargs):
+    """
+    OHLCV 데이터를 DataFrame으로 반환
+    - backend 미지정 시 OHLCV_BACKEND (환경변수 OHLCV_BACKEND, 기본 synthetic) 사용
+    - 백엔드별 조회 지연은 get_ohlcv_fetch_stats()로 확인
+    """
+    name = backend or OHLCV_BACKEND
+    fetch_fn = get_ohlcv_backend(name)
+    stats = OHLCV_FETCH_STATS.setdefault(name, {"count": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0})
+
+    started = time.perf_counter()
+    try:
+        return fetch_fn(symbol, timeframe, limit=limit, **kwargs)
+    except Exception:
+        stats["errors"] += 1
+        raise
+    finally:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        stats["count"] += 1
+        stats["total_ms"] += elapsed_ms
+        stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+
+TIMEFRAME_UNITS = {"m": 1, "h": 60, "d": 60 * 24, "w": 60 * 24 * 7}
+
+def timeframe_to_minutes(timeframe: str) -> int:
+    """
+    타임프레임 문자열("15m", "1h", "4h", "1d")을 분 단위로 변환
+    - "1M"(월봉)은 길이가 고정되지 않아 분 단위로 바꿀 수 없음 → ValueError (소문자 변환 시 1분으로 오인되는 것 방지)
+    """
+    if timeframe.endswith("M"):
+        raise ValueError(f"월봉 타임프레임은 분 단위로 변환할 수 없습니다: {timeframe}")
+    unit = timeframe[-1].lower()
+    if unit not in TIMEFRAME_UNITS or not timeframe[:-1].isdigit():
+        raise ValueError(f"지원하지 않는 타임프레임: {timeframe}")
+    return int(timeframe[:-1]) * TIMEFRAME_UNITS[unit]
+
+def resample_ohlcv(df: pd.DataFrame, timeframe: str, base_timeframe: str = None) -> pd.DataFrame:
+    """
+    하위 프레임 OHLCV(로컬 naive DatetimeIndex)를 상위 프레임으로 재집계
+    - 시가: 첫 값 / 고가: 최대 / 저가: 최소 / 종가: 마지막 값 / 거래량: 합계
+    - 구간 경계는 거래소와 같은 UTC epoch 기준 (로컬 자정 기준 X)
+    - 처음/마지막 구간에 하위 캔들이 모자라면 (잘린 구간, 형성 중 캔들) 제외 → 완성된 상위 캔들만 반환
+    - base_timeframe 생략 시 인덱스 간격(중앙값)으로 추정
+    """
+    minutes = timeframe_to_minutes(timeframe)
+    if base_timeframe:
+        base_minutes = timeframe_to_minutes(base_timeframe)
+    elif len(df) > 1:
+        base_minutes = max(1, int(pd.Series(df.index).diff().median() / pd.Timedelta(minutes=1)))
+    else:
+        base_minutes = minutes
+    ratio = max(1, minutes // base_minutes)
+
+    resampled = df.resample(f"{minutes}min", label="left", closed="left",
+                            origin="epoch", offset=LOCAL_UTC_OFFSET).agg({
+        "open": "first",
+        "high": "max",
+        "low": "min",
+        "close": ["last", "count"],
+        "volume": "sum",
+    })
+    counts = resampled[("close", "count")].to_numpy()
+    resampled.columns = ["open", "high", "low", "close", "count", "volume"]
+    resampled = resampled[["open", "high", "low", "close", "volume"]]
+
+    keep = counts > 0
+    filled = keep.nonzero()[0]
+    if filled.size:
+        for edge in (filled[0], filled[-1]):
+            if counts[edge] < ratio:
+                keep[edge] = False
+    return resampled[keep]
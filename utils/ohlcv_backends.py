@@ -0,0 +1,194 @@
+# 📁 파일명: utils/ohlcv_backends.py
+"""
+📌 목적: fetch_ohlcv_data()에서 선택 가능한 추가 OHLCV 백엔드 모음
+📌 기능:
+  - replay: 녹화된 캔들 파일(data/replay/*.csv)을 읽어 최근 limit개 반환
+  - http: 로컬 리플레이 서버(또는 호환 API)에서 캔들 조회 (keep-alive 세션 재사용)
+  - ccxt: 거래소별 장기 유지 클라이언트(modules/exchange_client.py)로 실제 캔들 조회
+  - record_candles(): 캔들 DataFrame을 리플레이 파일로 저장
+  - start_replay_server(): 녹화 캔들을 HTTP로 제공하는 로컬 대역 서버 (네트워크 없이 지연 측정용)
+📌 사용 예:
+  ▶ set_ohlcv_backend("replay") 또는 환경변수 OHLCV_BACKEND=http / ccxt
+📌 작업 프롬프트 요약:
+  ▶ "OHLCV 소스를 합성/파일 리플레이/거래소로 교체 가능하게 하고, 오프라인에서도 조회 지연을 측정할 수 있는 로컬 서버를 제공하라."
+"""
+
+import os
+import json
+import time
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+
+from utils.ohlcv import register_ohlcv_backend, timeframe_to_minutes
+
+REPLAY_DIR = "data/replay"
+REPLAY_SERVER_URL = os.getenv("OHLCV_REPLAY_URL", "http://127.0.0.1:8765")
+CCXT_EXCHANGE = os.getenv("OHLCV_EXCHANGE", "bybit")
+OHLCV_COLUMNS = ["open", "high", "low", "close", "volume"]
+
+# fetch_ohlcv_data()는 로컬 시각(naive) 인덱스를 사용, 거래소/HTTP 응답은 UTC epoch ms
+LOCAL_TZ = datetime.now().astimezone().tzinfo
+
+
+# 🔹 캔들 ↔ ccxt 형식 행([ts_ms, o, h, l, c, v]) 변환
+def frame_to_rows(df: pd.DataFrame) -> list:
+    index = df.index
+    if index.tz is None:
+        index = index.tz_localize(LOCAL_TZ)
+    ts = index.tz_convert("UTC").values.astype("datetime64[ms]").astype("int64")
+    values = df[OHLCV_COLUMNS].to_numpy(dtype=float)
+    return [[int(t), *row] for t, row in zip(ts, values.tolist())]
+
+def rows_to_frame(rows: list) -> pd.DataFrame:
+    df = pd.DataFrame(rows, columns=["timestamp"] + OHLCV_COLUMNS)
+    df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms", utc=True).dt.tz_convert(LOCAL_TZ).dt.tz_localize(None)
+    df.set_index("timestamp", inplace=True)
+    return df
+
+
+# 🔹 replay: 녹화 파일 백엔드
+_REPLAY_CACHE = {}
+
+def _replay_path(symbol: str, timeframe: str, root: str) -> str:
+    return os.path.join(root, f"{symbol.replace('/', '')}_{timeframe}.csv")
+
+def record_candles(symbol: str, timeframe: str, df: pd.DataFrame, root: str = REPLAY_DIR) -> str:
+    """
+    캔들 DataFrame을 리플레이 파일로 저장 (기존 파일 덮어씀)
+    """
+    os.makedirs(root, exist_ok=True)
+    path = _replay_path(symbol, timeframe, root)
+    df[OHLCV_COLUMNS].to_csv(path, index_label="timestamp")
+    _REPLAY_CACHE.pop(path, None)
+    return path
+
+def load_replay_candles(symbol: str, timeframe: str, root: str = REPLAY_DIR) -> pd.DataFrame:
+    """
+    리플레이 파일을 읽어 메모리에 보관 (파일 수정 시각이 바뀌면 다시 읽음)
+    """
+    path = _replay_path(symbol, timeframe, root)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"리플레이 파일이 없습니다: {path}")
+    mtime = os.path.getmtime(path)
+    cached = _REPLAY_CACHE.get(path)
+    if cached is None or cached[0] != mtime:
+        df = pd.read_csv(path, index_col="timestamp", parse_dates=["timestamp"])
+        cached = (mtime, df.sort_index())
+        _REPLAY_CACHE[path] = cached
+    return cached[1]
+
+def replay_backend(symbol: str, timeframe: str = "15m", limit: int = 100, until=None,
+                   root: str = REPLAY_DIR, **kwargs) -> pd.DataFrame:
+    """
+    녹화된 캔들 중 until(기본: 전체) 시점까지의 최근 limit개 반환
+    """
+    df = load_replay_candles(symbol, timeframe, root)
+    if until is not None:
+        df = df.loc[:pd.Timestamp(until)]
+    return df.iloc[-limit:]
+
+
+# 🔹 http: 로컬 리플레이 서버 / 호환 API 백엔드
+_HTTP_SESSION = None
+
+def http_backend(symbol: str, timeframe: str = "15m", limit: int = 100, base_url: str = None,
+                 timeout: float = 5.0, **kwargs) -> pd.DataFrame:
+    """
+    GET {base_url}/ohlcv?symbol=&timeframe=&limit= → ccxt 형식 행 목록
+    """
+    global _HTTP_SESSION
+    import requests
+
+    if _HTTP_SESSION is None:
+        _HTTP_SESSION = requests.Session()
+    response = _HTTP_SESSION.get(
+        f"{base_url or REPLAY_SERVER_URL}/ohlcv",
+        params={"symbol": symbol, "timeframe": timeframe, "limit": limit},
+        timeout=timeout,
+    )
+    response.raise_for_status()
+    return rows_to_frame(response.json())
+
+
+# 🔹 ccxt: 거래소 백엔드 (클라이언트는 거래소별 1개 유지)
+def ccxt_backend(symbol: str, timeframe: str = "15m", limit: int = 100, exchange_id: str = None,
+                 since: int = None, **kwargs) -> pd.DataFrame:
+    from modules.exchange_client import get_exchange_client
+
+    client = get_exchange_client(exchange_id or CCXT_EXCHANGE)
+    # 거래소는 아직 형성 중인 마지막 캔들도 돌려줌 → 최근 조회는 1개 더 받아 마감된 캔들만 limit개 반환 (synthetic과 동일)
+    extra = 1 if limit and since is None else 0
+    rows = client.fetch_ohlcv(symbol, timeframe, since=since, limit=limit + extra if limit else limit)
+    frame_ms = timeframe_to_minutes(timeframe) * 60_000
+    now_ms = int(time.time() * 1000)
+    closed = [row for row in rows if row[0] + frame_ms <= now_ms]
+    if extra:
+        closed = closed[-limit:]
+    return rows_to_frame(closed)
+
+
+register_ohlcv_backend("replay", replay_backend)
+register_ohlcv_backend("http", http_backend)
+register_ohlcv_backend("ccxt", ccxt_backend)
+
+
+# 🔹 로컬 리플레이 서버 (오프라인 지연 측정용 거래소 대역)
+class _ReplayRequestHandler(BaseHTTPRequestHandler):
+    root = REPLAY_DIR
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        if parsed.path != "/ohlcv":
+            self.send_error(404)
+            return
+
+        query = parse_qs(parsed.query)
+        symbol = query.get("symbol", ["BTC/USDT"])[0]
+        timeframe = query.get("timeframe", ["15m"])[0]
+        limit = int(query.get("limit", ["100"])[0])
+        try:
+            df = replay_backend(symbol, timeframe, limit=limit, root=self.root)
+        except FileNotFoundError as e:
+            self.send_error(404, str(e))
+            return
+
+        body = json.dumps(frame_to_rows(df)).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # 벤치마크 중 콘솔 출력 억제
+
+
+def start_replay_server(root: str = REPLAY_DIR, host: str = "127.0.0.1", port: int = 0):
+    """
+    ✅ 녹화 캔들을 제공하는 로컬 HTTP 서버를 백그라운드 스레드로 실행
+    - port=0이면 빈 포트 자동 할당
+    - 반환: (server, base_url) → http_backend(base_url=...)로 사용, 종료는 server.shutdown()
+    """
+    handler = type("ReplayRequestHandler", (_ReplayRequestHandler,), {"root": root})
+    server = ThreadingHTTPServer((host, port), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://{server.server_address[0]}:{server.server_address[1]}"
+    return server, base_url
+
+
+# ✅ 단독 실행: 합성 캔들을 녹화한 뒤 로컬 서버 경유 조회 지연 측정
+if __name__ == "__main__":
+    from utils.ohlcv import fetch_ohlcv_data, get_ohlcv_fetch_stats
+
+    record_candles("BTC/USDT", "15m", fetch_ohlcv_data("BTC/USDT", "15m", limit=5000, seed=42))
+    server, url = start_replay_server()
+    for _ in range(50):
+        fetch_ohlcv_data("BTC/USDT", "15m", limit=500, backend="replay")
+        fetch_ohlcv_data("BTC/USDT", "15m", limit=500, backend="http", base_url=url)
+    server.shutdown()
+    print(f"📊 OHLCV 조회 지연: {get_ohlcv_fetch_stats()}")
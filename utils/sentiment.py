@@ -2,78 +2,140 @@
 📁 파일명: utils/sentiment.py
 📌 목적: 뉴스 감정 분석 (제목 + 본문 포함, 다국어 대응)
 🔧 변경 내역:
-  - 영어 뉴스: FinBERT 모델 기반 감정 점수 계산
+  - 영어 뉴스: FinBERT 모델 기반 감정 점수 계산 (utils/sentiment_service.py 공유 모델, 지연 로딩)
   - 한국어 뉴스: 키워드 기반 룰 엔진
   - 제목 + 요약을 함께 분석 텍스트로 사용
+  - 분석 결과는 utils/sentiment_cache.py에 캐시 (같은 기사 재분석 방지)
 📊 포함 함수:
   - analyze_news(news_list): 전체 뉴스 리스트 분석, 평균 점수 반환
+  - analyze_news_incremental(news_list): 새 기사만 분석, 최근 롤링 윈도우 평균 반환 (중복 기사 재분석 방지)
+  - score_news_items(news_list): 기사별 감정 점수 목록
   - analyze_single_news_en(text): 영어 뉴스 감정 분석 (FinBERT)
-  - analyze_single_news_ko(text): 한국어 뉴스 감정 분석 (룰기반)
+  - analyze_news_en_batch(texts): 영어 뉴스 여러 건을 FinBERT 배치 추론으로 분석
+  - analyze_single_news_ko(text): 한국어 뉴스 감정 분석 (룰기반, Aho-Corasick 1회 스캔)
+  - score_ko_keywords(matches): 매칭 키워드 → 한글 감정 점수
   - get_sentiment_summary(score): 점수 기반 요약 텍스트 반환
 """
 
-from transformers import AutoTokenizer, AutoModelForSequenceClassification, pipeline
-import torch
+from utils.sentiment_service import FINBERT_TONE_MODEL
+from utils.sentiment_cache import cached_score_texts, get_sentiment_cache
+from utils.keyword_matcher import KeywordMatcher
 
-# ✅ FinBERT 로드 (영어 금융 감정 분석 전용)
-FINBERT_MODEL = "yiyanghkust/finbert-tone"
-tokenizer = AutoTokenizer.from_pretrained(FINBERT_MODEL)
-model = AutoModelForSequenceClassification.from_pretrained(FINBERT_MODEL)
-finbert_pipeline = pipeline("sentiment-analysis", model=model, tokenizer=tokenizer)
+# ✅ FinBERT (영어 금융 감정 분석 전용) - 첫 영어 뉴스 분석 시 공유 서비스에서 지연 로딩
+FINBERT_MODEL = FINBERT_TONE_MODEL
+KO_RULE_MODEL = "ko-keyword-rule-v1"  # 한글 룰 엔진 캐시 키 (키워드 변경 시 버전 올릴 것)
 
-def analyze_news(news_list):
+# ✅ 한글 감정 키워드 사전 (키워드 → 가중치), 오토마톤은 import 시 1회만 컴파일
+KO_NEGATIVE_KEYWORDS = ["하락", "급락", "규제", "불안", "리스크", "패닉", "부정", "폭락", "제재", "손실"]
+KO_POSITIVE_KEYWORDS = ["상승", "급등", "호재", "기대", "수익", "성장", "호황", "기록", "최고", "강세"]
+KO_SENTIMENT_WEIGHTS = {
+    **{word: 0.5 for word in KO_POSITIVE_KEYWORDS},
+    **{word: -0.5 for word in KO_NEGATIVE_KEYWORDS},
+}
+KO_SENTIMENT_MATCHER = KeywordMatcher(KO_SENTIMENT_WEIGHTS)
+
+def score_news_items(news_list, skip_failed: bool = False):
     """
-    전체 뉴스 리스트를 기반으로 평균 감정 점수 계산
+    기사별 감정 점수 계산 → [(news, score), ...] (분석 실패 기사는 제외)
+    - 영어 뉴스는 모아서 FinBERT 배치 추론 1회로 처리
+    - skip_failed=True: FinBERT 배치 실패 시 영어 기사를 0.0(중립) 대신 결과에서 제외 (증분 분석용 재시도)
     """
-    scores = []
+    scored = []
+    en_items = []
     for news in news_list:
         try:
             lang = news.get("language", "ko")
             text = (news.get("title", "") + " " + news.get("summary", "")).strip()
             if lang == "en":
-                score = analyze_single_news_en(text)
+                en_items.append((news, text))
+            elif "keywords" in news:
+                # fetch_news() 필터링 스캔에서 이미 찾은 키워드 재사용
+                scored.append((news, score_ko_keywords(news["keywords"])))
             else:
-                score = analyze_single_news_ko(text)
-            scores.append(score)
+                scored.append((news, analyze_single_news_ko(text)))
         except:
             continue
 
+    if en_items:
+        try:
+            en_scores = analyze_news_en_batch([text for _, text in en_items], raise_on_error=skip_failed)
+            scored.extend((news, score) for (news, _), score in zip(en_items, en_scores))
+        except Exception as e:
+            print(f"⚠️ 영어 뉴스 감정 분석 실패 ({len(en_items)}건, 다음 사이클에 재시도): {e}")
+    get_sentiment_cache().maybe_flush()
+    return scored
+
+def analyze_news(news_list):
+    """
+    전체 뉴스 리스트를 기반으로 평균 감정 점수 계산
+    """
+    scores = [score for _, score in score_news_items(news_list)]
     if scores:
         return sum(scores) / len(scores)
     return 0.0
 
+def analyze_news_incremental(news_list, index=None):
+    """
+    ✅ 새 기사만 감정 분석 후 롤링 윈도우 평균 반환
+    - 이미 본 기사(utils/news_index.py 지문 인덱스)는 건너뜀
+    - 분석에 실패한 기사는 인덱스에 기록하지 않아 다음 사이클에 다시 분석
+    - 반환: 최근 윈도우(기본 24시간) 내 기사들의 평균 감정 점수
+    """
+    from utils.news_index import get_news_index
+
+    index = index or get_news_index()
+    new_items = index.filter_new(news_list)
+    if new_items:
+        scored = score_news_items(new_items, skip_failed=True)
+        index.record_scored([news for news, _ in scored], [score for _, score in scored])
+    return index.rolling_sentiment()
+
+def _finbert_result_to_score(result: dict) -> float:
+    label = result["label"]
+    score = result["score"]
+    if label == "positive":
+        return score
+    elif label == "negative":
+        return -score
+    else:
+        return 0.0  # neutral
+
+def analyze_news_en_batch(texts, raise_on_error: bool = False):
+    """
+    FinBERT 배치 추론 기반 영어 뉴스 감정 점수 목록 (-1 ~ +1), 실패 시 0.0 (raise_on_error=True면 예외 전달)
+    """
+    try:
+        return [_finbert_result_to_score(r) for r in cached_score_texts(texts, FINBERT_MODEL)]
+    except Exception:
+        if raise_on_error:
+            raise
+        return [0.0] * len(texts)
+
 def analyze_single_news_en(text):
     """
     FinBERT 기반 영어 뉴스 감정 분석 → 점수화 (-1 ~ +1)
     """
-    try:
-        result = finbert_pipeline(text)[0]
-        label = result["label"]
-        score = result["score"]
-        if label == "positive":
-            return score
-        elif label == "negative":
-            return -score
-        else:
-            return 0.0  # neutral
-    except:
-        return 0.0
+    return analyze_news_en_batch([text])[0]
 
 def analyze_single_news_ko(text):
     """
-    한글 뉴스 감정 분석 (키워드 룰 기반)
+    한글 뉴스 감정 분석 (키워드 룰 기반, 결과 캐시)
     """
-    negative_keywords = ["하락", "급락", "규제", "불안", "리스크", "패닉", "부정", "폭락", "제재", "손실"]
-    positive_keywords = ["상승", "급등", "호재", "기대", "수익", "성장", "호황", "기록", "최고", "강세"]
+    cache = get_sentiment_cache()
+    cached = cache.get(text, KO_RULE_MODEL)
+    if cached is not None:
+        return cached
 
-    score = 0
-    for word in positive_keywords:
-        if word in text:
-            score += 0.5
-    for word in negative_keywords:
-        if word in text:
-            score -= 0.5
+    score = score_ko_keywords(KO_SENTIMENT_MATCHER.matched(text))
+    cache.put(text, KO_RULE_MODEL, score)
+    return score
 
+def score_ko_keywords(matches: dict) -> float:
+    """
+    매칭된 키워드 → 가중치 dict로 한글 감정 점수 계산 (-1 ~ +1)
+    - 감정 사전에 없는 키워드(필터링 전용)는 무시
+    """
+    score = sum(KO_SENTIMENT_WEIGHTS.get(word, 0.0) for word in matches)
     return max(-1.0, min(1.0, score))
 
 def get_sentiment_summary(score: float) -> str:
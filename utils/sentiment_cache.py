@@ -0,0 +1,180 @@
+# 📁 파일명: utils/sentiment_cache.py
+"""
+📌 목적: 같은 뉴스/게시글을 사이클마다 다시 감정 분석하지 않도록 결과를 캐시
+📌 기능:
+  - SentimentCache: (정규화 텍스트 + 모델명) 해시 키 기반 LRU + TTL 캐시, 디스크 저장
+  - get_sentiment_cache(): 프로세스 공용 캐시 객체
+  - cached_score_texts(texts, model_name): 캐시 미스 텍스트만 배치 추론 후 결과 병합
+  - get_cache_stats(): 적중률 / 만료 / 축출 횟수 조회 (캐시 크기 조정용)
+📌 저장 위치:
+  - data/sentiment_cache.json (flush() 시 원자적으로 교체 저장, 프로세스 종료 시 자동 저장)
+  - 사이클 중에는 maybe_flush(): 변경 FLUSH_EVERY건 이상 또는 마지막 저장 후 FLUSH_INTERVAL초 경과 시에만 저장
+    (캐시 미스마다 전체 JSON을 다시 쓰지 않음)
+📌 작업 프롬프트 요약:
+  ▶ "RSS에서 반복해서 들어오는 같은 기사는 이전 감정 점수를 재사용하고, 재시작 후에도 유지되게 하라."
+"""
+
+import os
+import re
+import json
+import time
+import atexit
+import hashlib
+import threading
+from collections import OrderedDict
+
+SENTIMENT_CACHE_PATH = "data/sentiment_cache.json"
+MAX_ENTRIES = int(os.getenv("SENTIMENT_CACHE_SIZE", "20000"))
+TTL_SECONDS = int(os.getenv("SENTIMENT_CACHE_TTL", str(24 * 3600)))
+FLUSH_EVERY = int(os.getenv("SENTIMENT_CACHE_FLUSH_EVERY", "200"))       # 미저장 변경 건수
+FLUSH_INTERVAL = int(os.getenv("SENTIMENT_CACHE_FLUSH_INTERVAL", "300"))  # 초
+
+_WHITESPACE = re.compile(r"\s+")
+
+def normalize_text(text: str) -> str:
+    """
+    캐시 키용 텍스트 정규화 (공백 정리 + 소문자)
+    """
+    return _WHITESPACE.sub(" ", text or "").strip().lower()
+
+def make_cache_key(text: str, model_name: str) -> str:
+    return hashlib.sha1(f"{model_name}\0{normalize_text(text)}".encode("utf-8")).hexdigest()
+
+
+class SentimentCache:
+    """
+    ✅ 내용 주소 기반 감정 결과 캐시
+    - 키: sha1(모델명 + 정규화 텍스트), 값: JSON 직렬화 가능한 분석 결과
+    - 용량 초과 시 가장 오래 사용하지 않은 항목 축출 (LRU), TTL 지난 항목은 조회 시 만료
+    """
+
+    def __init__(self, path: str = SENTIMENT_CACHE_PATH, max_entries: int = MAX_ENTRIES,
+                 ttl_seconds: int = TTL_SECONDS):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()  # key → [created_at, value]
+        self._lock = threading.Lock()
+        self._dirty = 0                 # 마지막 저장 이후 변경 건수
+        self._last_flush = time.monotonic()
+        self.stats = {"hits": 0, "misses": 0, "expired": 0, "evictions": 0, "flushes": 0}
+        self._load()
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                items = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return
+        now = time.time()
+        for key, created_at, value in items:
+            if now - created_at <= self.ttl_seconds:
+                self._entries[key] = [created_at, value]
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, text: str, model_name: str):
+        """
+        캐시 조회 (없거나 만료되면 None)
+        """
+        key = make_cache_key(text, model_name)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+            if time.time() - entry[0] > self.ttl_seconds:
+                del self._entries[key]
+                self._dirty += 1
+                self.stats["expired"] += 1
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return entry[1]
+
+    def put(self, text: str, model_name: str, value):
+        key = make_cache_key(text, model_name)
+        with self._lock:
+            self._entries[key] = [time.time(), value]
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+            self._dirty += 1
+
+    def flush(self):
+        """
+        변경 사항이 있으면 디스크에 저장 (임시 파일 → 교체)
+        """
+        if not self.path:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            items = [[key, created_at, value] for key, (created_at, value) in self._entries.items()]
+            self._dirty = 0
+            self._last_flush = time.monotonic()
+            self.stats["flushes"] += 1
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(items, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def maybe_flush(self, every: int = FLUSH_EVERY, interval: float = FLUSH_INTERVAL):
+        """
+        미저장 변경이 every건 이상이거나 마지막 저장 후 interval초가 지났을 때만 flush()
+        """
+        with self._lock:
+            due = self._dirty and (self._dirty >= every or time.monotonic() - self._last_flush >= interval)
+        if due:
+            self.flush()
+
+    def get_stats(self) -> dict:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "size": len(self._entries),
+            "unsaved": self._dirty,
+            "max_entries": self.max_entries,
+            "hit_rate": round(self.stats["hits"] / lookups, 3) if lookups else 0.0,
+        }
+
+
+_CACHE = None
+
+def get_sentiment_cache() -> SentimentCache:
+    """
+    프로세스 공용 감정 캐시 (최초 호출 시 디스크에서 로딩, 종료 시 저장)
+    """
+    global _CACHE
+    if _CACHE is None:
+        _CACHE = SentimentCache()
+        atexit.register(_CACHE.flush)
+    return _CACHE
+
+def cached_score_texts(texts, model_name: str) -> list:
+    """
+    ✅ 캐시 적용 배치 감정 분석
+    - 캐시에 있는 텍스트는 재사용, 나머지만 score_texts()로 한 번에 추론
+    - 반환 형식은 score_texts()와 동일
+    """
+    from utils.sentiment_service import score_texts
+
+    cache = get_sentiment_cache()
+    texts = list(texts)
+    results = [cache.get(text, model_name) for text in texts]
+    missing = [i for i, result in enumerate(results) if result is None]
+    if missing:
+        scored = score_texts([texts[i] for i in missing], model_name)
+        for i, result in zip(missing, scored):
+            results[i] = result
+            cache.put(texts[i], model_name, result)
+        cache.maybe_flush()
+    return results
+
+def get_cache_stats() -> dict:
+    return get_sentiment_cache().get_stats()
@@ -0,0 +1,129 @@
+# 📁 파일명: utils/sentiment_service.py
+"""
+📌 목적: FinBERT 등 감정 분석 모델을 프로세스 전체에서 1개씩만 지연 로딩하여 공유
+📌 기능:
+  - get_sentiment_pipeline(model_name): 최초 호출 시에만 모델 로딩, 이후 같은 파이프라인 재사용
+  - warm_up(model_names): 트레이딩 루프 시작 전 명시적 사전 로딩
+  - get_loaded_models(): 로딩된 모델과 추정 메모리(MB) 조회
+  - unload_model(model_name): 모델 해제
+  - score_texts(texts, model_name): 여러 텍스트를 길이순 정렬 → 마이크로 배치 단위 패딩 → 한 번에 추론
+📌 메모리 예산:
+  - SENTIMENT_MEMORY_BUDGET_MB(환경변수, 기본 1024MB)를 넘으면 가장 오래 사용하지 않은 모델부터 해제
+📌 작업 프롬프트 요약:
+  ▶ "감정 분석 모델을 import 시점에 올리지 말고, 실제로 점수를 매길 때 한 번만 로딩하여 모든 호출자가 공유하라."
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+FINBERT_TONE_MODEL = "yiyanghkust/finbert-tone"
+PROSUS_FINBERT_MODEL = "ProsusAI/finbert"
+MEMORY_BUDGET_MB = float(os.getenv("SENTIMENT_MEMORY_BUDGET_MB", "1024"))
+BATCH_SIZE = int(os.getenv("SENTIMENT_BATCH_SIZE", "16"))
+NUM_THREADS = int(os.getenv("SENTIMENT_NUM_THREADS", "0"))  # 0이면 torch 기본값 사용
+MAX_LENGTH = 512
+
+_PIPELINES = OrderedDict()  # model_name → (pipeline, 추정 메모리 MB), 최근 사용 순
+_LOCK = threading.RLock()
+
+def _estimate_model_mb(model) -> float:
+    try:
+        total = sum(p.numel() * p.element_size() for p in model.parameters())
+        total += sum(b.numel() * b.element_size() for b in model.buffers())
+        return total / (1024 * 1024)
+    except Exception:
+        return 0.0
+
+def _load_pipeline(model_name: str):
+    from transformers import AutoTokenizer, AutoModelForSequenceClassification, pipeline
+
+    print(f"🧠 감정 분석 모델 로딩: {model_name}")
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModelForSequenceClassification.from_pretrained(model_name)
+    model.eval()
+    return pipeline("sentiment-analysis", model=model, tokenizer=tokenizer), _estimate_model_mb(model)
+
+def _enforce_budget(keep: str):
+    used = sum(mb for _, mb in _PIPELINES.values())
+    for name in list(_PIPELINES.keys()):
+        if used <= MEMORY_BUDGET_MB:
+            break
+        if name == keep:
+            continue
+        _, mb = _PIPELINES.pop(name)
+        used -= mb
+        print(f"♻️ 메모리 예산 초과 → 감정 모델 해제: {name} ({mb:.0f}MB)")
+
+def get_sentiment_pipeline(model_name: str = FINBERT_TONE_MODEL):
+    """
+    ✅ 공유 감정 분석 파이프라인 반환 (없으면 1회 로딩)
+    """
+    with _LOCK:
+        entry = _PIPELINES.get(model_name)
+        if entry is None:
+            entry = _load_pipeline(model_name)
+            _PIPELINES[model_name] = entry
+            _enforce_budget(keep=model_name)
+        else:
+            _PIPELINES.move_to_end(model_name)
+        return entry[0]
+
+def warm_up(model_names=(FINBERT_TONE_MODEL,)):
+    """
+    트레이딩 루프 시작 전 모델 사전 로딩 (첫 사이클 지연 방지)
+    """
+    for model_name in model_names:
+        get_sentiment_pipeline(model_name)
+
+def get_loaded_models() -> dict:
+    """
+    로딩된 모델별 추정 메모리(MB)
+    """
+    with _LOCK:
+        return {name: round(mb, 1) for name, (_, mb) in _PIPELINES.items()}
+
+def unload_model(model_name: str) -> bool:
+    """
+    모델 해제 (다음 사용 시 다시 로딩)
+    """
+    with _LOCK:
+        return _PIPELINES.pop(model_name, None) is not None
+
+def score_texts(texts, model_name: str = FINBERT_TONE_MODEL, batch_size: int = None,
+                num_threads: int = None, max_length: int = MAX_LENGTH) -> list:
+    """
+    ✅ 배치 감정 분석 (CPU 최적화)
+    - 텍스트를 토큰 길이 기준(문자 길이 근사)으로 정렬 후 batch_size씩 묶어 배치별 최소 패딩
+    - num_threads: torch 연산 스레드 수 (미지정 시 SENTIMENT_NUM_THREADS)
+    - 반환: 입력 순서와 같은 [{"label": "positive"/"negative"/"neutral", "score": float}, ...]
+      (모델마다 다른 라벨 대소문자는 소문자로 통일)
+    """
+    import torch
+
+    texts = list(texts)
+    if not texts:
+        return []
+
+    nlp = get_sentiment_pipeline(model_name)
+    tokenizer, model = nlp.tokenizer, nlp.model
+    id2label = {int(k): v.lower() for k, v in model.config.id2label.items()}
+
+    threads = num_threads if num_threads is not None else NUM_THREADS
+    if threads and torch.get_num_threads() != threads:
+        torch.set_num_threads(threads)
+
+    batch_size = batch_size or BATCH_SIZE
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+    results = [None] * len(texts)
+
+    with torch.inference_mode():
+        for start in range(0, len(order), batch_size):
+            idx = order[start:start + batch_size]
+            encoded = tokenizer([texts[i] for i in idx], padding=True, truncation=True,
+                                max_length=max_length, return_tensors="pt")
+            probs = torch.softmax(model(**encoded).logits, dim=-1)
+            scores, labels = probs.max(dim=-1)
+            for i, label, score in zip(idx, labels.tolist(), scores.tolist()):
+                results[i] = {"label": id2label[label], "score": score}
+    return results
@@ -9,12 +9,13 @@
 # 📚 주요 함수:
 #     - analyze_strategy()
 #     - analyze_strategy_with_context()
-#     - apply_model_correction()
+#     - predict_model_signal() / predict_model_signals() / apply_model_correction()
 #     - apply_community_adjustment()
 
-from utils.indicators import get_indicators
-from models.model_predictor import predict_with_model, update_sequence
-from modules.grok_bridge import query_grok
+from utils.indicators import get_multi_timeframe_indicators
+from models.model_predictor import predict_with_model, predict_with_model_batch, update_sequence
+from utils.decision_cache import cached_grok_decision
+from modules.llm_client import LLMUnavailableError
 from modules.community_sentiment import analyze_community_sentiment
 
 # ✅ Grok 응답 해석
@@ -55,14 +56,19 @@ def analyze_strategy(ai_response: str, indicators: dict, sentiment_score: float)
     }
 
 # ✅ 상위 프레임 보완 전략
-def analyze_strategy_with_context(sentiment_score: float, base_interval="15m") -> dict:
-    indicators_base = get_indicators("BTC/USDT", base_interval)
-    indicators_1h = get_indicators("BTC/USDT", "1h")
-    indicators_4h = get_indicators("BTC/USDT", "4h")
+def analyze_strategy_with_context(sentiment_score: float, base_interval="15m", frames: dict = None,
+                                  symbol: str = "BTC/USDT") -> dict:
+    # frames: 미리 계산된 get_multi_timeframe_indicators() 결과 (사이클 러너의 선행 조회 재사용)
+    if frames is None:
+        frames = get_multi_timeframe_indicators(symbol, (base_interval, "1h", "4h"), base_timeframe=base_interval)
+    indicators_base = frames[base_interval]
+    indicators_1h = frames["1h"]
+    indicators_4h = frames["4h"]
 
     prompt = f"""
 [Analyze and respond in Korean]
 
+심볼: {symbol}
 기술적 지표:
 RSI: {indicators_base['rsi']}, BB: {indicators_base['bb']},
 EMA: {indicators_base['ema']}, TEMA: {indicators_base['tema']},
@@ -71,7 +77,10 @@ MACD: {indicators_base['macd']}
 
 이 데이터를 기반으로 LONG / SHORT / HOLD 중 적절한 전략을 판단해줘.
 """
-    ai_response = query_grok(prompt).strip().upper()
+    try:
+        ai_response = cached_grok_decision("context", prompt, indicators_base, sentiment_score, symbol).strip().upper()
+    except LLMUnavailableError:
+        ai_response = "HOLD"
 
     signal = "hold"
     if ai_response in ["LONG", "SHORT"]:
@@ -104,23 +113,51 @@ MACD: {indicators_base['macd']}
     }
 
 # ✅ 딥러닝 기반 전략 보정
-def apply_model_correction(signal: str, indicators: dict, sentiment: float) -> str:
+def predict_model_signal(indicators: dict, sentiment: float, symbol: str = None) -> str:
+    """
+    시계열 누적 후 딥러닝 예측 신호 반환 (전략 신호와 무관하므로 다른 단계와 병렬 실행 가능)
+    - symbol: 심볼별 시계열 분리 (생략 시 기본 시퀀스)
+    """
     update_sequence({
         "rsi": indicators.get("rsi"),
         "macd": indicators.get("macd"),
         "ema": indicators.get("ema"),
         "tema": indicators.get("tema"),
         "sentiment": sentiment
-    })
+    }, symbol)
+
+    model_signal = predict_with_model(symbol)
+    print(f"🧠 딥러닝 판단{f' ({symbol})' if symbol else ''}: {model_signal}")
+    return model_signal
+
+def predict_model_signals(indicators_by_symbol: dict, sentiment: float) -> dict:
+    """
+    여러 심볼 시계열 누적 후 LSTM 1회 배치 추론 → {symbol: 신호} (지표 없는 심볼은 제외)
+    """
+    symbols = [symbol for symbol, indicators in indicators_by_symbol.items() if indicators]
+    for symbol in symbols:
+        indicators = indicators_by_symbol[symbol]
+        update_sequence({
+            "rsi": indicators.get("rsi"),
+            "macd": indicators.get("macd"),
+            "ema": indicators.get("ema"),
+            "tema": indicators.get("tema"),
+            "sentiment": sentiment
+        }, symbol)
 
-    model_signal = predict_with_model()
-    print(f"🧠 딥러닝 판단: {model_signal}")
+    signals = predict_with_model_batch(symbols) if symbols else {}
+    print(f"🧠 딥러닝 판단: {signals}")
+    return signals
 
+def apply_model_correction(signal: str, indicators: dict, sentiment: float, model_signal: str = None) -> str:
+    if model_signal is None:
+        model_signal = predict_model_signal(indicators, sentiment)
     return model_signal if model_signal != "hold" else signal
 
 # ✅ 커뮤니티 감정 기반 필터링
-def apply_community_adjustment(signal: str) -> str:
-    community_score = analyze_community_sentiment("BTC")
+def apply_community_adjustment(signal: str, community_score: float = None) -> str:
+    if community_score is None:
+        community_score = analyze_community_sentiment("BTC")
     print(f"📣 커뮤니티 감정 점수: {community_score:.2f}")
 
     if signal == "long" and community_score < -0.3:
@@ -9,19 +9,19 @@
 
 """
 
-from utils.indicators import get_indicators
-from modules.grok_bridge import query_grok
+from utils.indicators import get_multi_timeframe_indicators
+from utils.decision_cache import cached_grok_decision
+from modules.llm_client import LLMUnavailableError
 
 def analyze_strategy_with_context(sentiment_score: float, base_interval="15m") -> dict:
     """
     전략 판단을 수행하고 상위 프레임을 참고하여 HOLD 예외 여부 판단
     """
-    # 1. 기본 프레임 지표 (15m)
-    indicators_base = get_indicators("BTC/USDT", base_interval)
-
-    # 2. 상위 프레임 지표 (1h, 4h)
-    indicators_1h = get_indicators("BTC/USDT", "1h")
-    indicators_4h = get_indicators("BTC/USDT", "4h")
+    # 1~2. 기본 프레임(15m) + 상위 프레임(1h, 4h) 지표 (기본 캔들 1회 조회 후 리샘플링)
+    frames = get_multi_timeframe_indicators("BTC/USDT", (base_interval, "1h", "4h"), base_timeframe=base_interval)
+    indicators_base = frames[base_interval]
+    indicators_1h = frames["1h"]
+    indicators_4h = frames["4h"]
 
     # 3. 전략 판단용 프롬프트
     prompt = f"""
@@ -33,7 +33,10 @@ def analyze_strategy_with_context(sentiment_score: float, base_interval="15m") -
     Based on the above, should we go LONG, SHORT, or HOLD?
     """
 
-    ai_response = query_grok(prompt).strip().upper()
+    try:
+        ai_response = cached_grok_decision("context_en", prompt, indicators_base, sentiment_score, "BTC/USDT").strip().upper()
+    except LLMUnavailableError:
+        ai_response = "HOLD"
 
     # 4. 신호 결정
     signal = "hold"
@@ -7,30 +7,23 @@ def example():
 📌 목적: 매일의 전략 실행 결과를 요약 정리하여 파일 또는 텔레그램 등으로 제공
 📌 기능:
   - generate_daily_summary(): 오늘의 거래 요약 텍스트 생성
-  - get_simulation_performance(): 누적 수익률, 승률 등 통계 계산
+  - get_simulation_performance(): 누적 수익률, 승률 등 통계 (거래 저널 누적 집계, logs를 주면 해당 목록만 계산)
 📌 프롬프트 요약:
   ▶ "시뮬레이션 거래 로그를 바탕으로 당일 전략 요약과 누적 통계를 정리하여 출력하는 유틸리티 구성"
 """
 
-import os
-import json
 from datetime import datetime
 
-SIM_LOG_PATH = "logs/simulation/simulated_trades.json"
+from utils.trade_journal import get_trade_journal, get_trade_stats
 
-def load_trade_log():
-    if not os.path.exists(SIM_LOG_PATH):
-        return []
-    with open(SIM_LOG_PATH, "r", encoding="utf-8") as f:
-        try:
-            return json.load(f)
-        except:
-            return []
+SIM_LOG_PATH = "logs/simulation/simulated_trades.json"   # 기존 JSON 로그 (저널로 1회 이관됨)
+
+def load_trade_log(since: str = None):
+    return get_trade_journal().query("simulation", since=since)
 
 def generate_daily_summary():
-    logs = load_trade_log()
     today = datetime.now().strftime("%Y-%m-%d")
-    today_logs = [entry for entry in logs if entry["timestamp"].startswith(today)]
+    today_logs = load_trade_log(since=today)
 
     if not today_logs:
         return "📭 오늘의 거래가 없습니다."
@@ -40,14 +33,23 @@ def generate_daily_summary():
     for entry in today_logs:
         summary_lines.append(f"- [{entry['timestamp'][11:16]}] {entry['signal']} | 수익: ${entry['profit']:.2f}")
 
-    stats = get_simulation_performance(logs)
+    stats = get_simulation_performance()
     summary_lines.append("")
     summary_lines.append(f"📊 누적 수익: ${stats['total_profit']:.2f}")
     summary_lines.append(f"✅ 승률: {stats['win_rate']}% ({stats['wins']}승 / {stats['total']}회)")
 
     return "\n".join(summary_lines)
 
-def get_simulation_performance(logs: list):
+def get_simulation_performance(logs: list = None):
+    if logs is None:
+        stats = get_trade_stats("simulation")
+        return {
+            "total_profit": stats["profit"],
+            "wins": stats["wins"],
+            "total": stats["trades"],
+            "win_rate": stats["win_rate"]
+        }
+
     total_profit = 0.0
     wins = 0
     total = 0
@@ -4,6 +4,8 @@
 📌 기능:
   - track_token_usage(): 요청마다 토큰 수 추적
   - get_token_cost(): 모델별 예상 요금 계산
+  - track_cache_event(): LLM 응답 캐시 적중/미스 및 절약 토큰 기록
+  - get_cache_savings(): 누적 적중률, 절약 토큰 및 비용 요약
 📌 프롬프트 요약:
   ▶ "OpenAI, Grok 등 모델별 토큰 사용량과 비용을 추적하여 시각화하거나 로그에 남기기 위한 모듈을 작성하라."
 """
@@ -16,11 +18,15 @@ TOKEN_PRICES = {
     "gpt-4": 0.03,
     "gpt-3.5-turbo": 0.002,
     "grok-3": 0.02,
+    "grok-3-beta": 0.02,
     "finbert": 0.00  # 로컬 모델 또는 무료 모델
 }
 
 USAGE_LOG_PATH = "logs/token_usage_log.txt"
 
+# LLM 응답 캐시 누적 통계 (모델별)
+CACHE_SAVINGS = {}
+
 def track_token_usage(model_name: str, tokens_used: int):
     cost = get_token_cost(model_name, tokens_used)
 
@@ -34,3 +40,28 @@ def track_token_usage(model_name: str, tokens_used: int):
 def get_token_cost(model_name: str, tokens_used: int):
     price_per_1k = TOKEN_PRICES.get(model_name, 0.01)  # 기본값 0.01
     return (tokens_used / 1000) * price_per_1k
+
+
+def track_cache_event(model_name: str, hit: bool, tokens_saved: int = 0):
+    stats = CACHE_SAVINGS.setdefault(model_name, {"hits": 0, "misses": 0, "tokens_saved": 0})
+    if hit:
+        stats["hits"] += 1
+        stats["tokens_saved"] += tokens_saved
+        os.makedirs(os.path.dirname(USAGE_LOG_PATH), exist_ok=True)
+        with open(USAGE_LOG_PATH, "a", encoding="utf-8") as f:
+            now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            f.write(f"[{now}] 모델: {model_name}, 캐시 적중 → 절약 토큰: {tokens_saved}, "
+                    f"절약 비용: ${get_token_cost(model_name, tokens_saved):.4f}\n")
+    else:
+        stats["misses"] += 1
+
+def get_cache_savings():
+    summary = {}
+    for model_name, stats in CACHE_SAVINGS.items():
+        lookups = stats["hits"] + stats["misses"]
+        summary[model_name] = {
+            **stats,
+            "hit_rate": round(stats["hits"] / lookups, 3) if lookups else 0.0,
+            "cost_saved": round(get_token_cost(model_name, stats["tokens_saved"]), 4),
+        }
+    return summary
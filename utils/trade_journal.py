@@ -0,0 +1,349 @@
+# 📁 파일명: utils/trade_journal.py
+"""
+📌 목적: 매매 로그를 통째로 읽고 다시 쓰는 JSON 배열 대신, 추가 전용(append-only) SQLite 저널에 기록
+📌 기능:
+  - TradeJournal.append(entry, source): 거래 1건 추가 (기존 기록 재작성 없음 → 기록 수와 무관한 일정 비용)
+  - TradeJournal.query(source, symbol, since, until, limit): 시각/심볼 인덱스 기반 조회
+  - TradeJournal.tail(n, source): 최근 n건 (시간 순)
+  - TradeJournal.rows_after(last_id, source): id 이후 기록 (Parquet 아카이브 증분 압축용)
+  - TradeJournal.batch(): 여러 건을 한 트랜잭션으로 기록 (fsync 1회)
+  - TradeJournal.import_json_log(path, source): 기존 JSON 로그 1회 이관
+  - TradeJournal.export_json(path, source): 기존 JSON 형식이 필요한 도구용 내보내기
+  - TradeJournal.get_aggregates(source): 누적 집계 (거래 수, 승/패, 수익 합, 일별·시간대별·심볼별 구간)
+  - get_trade_stats(source, initial_balance): 잔고 포함 누적 성과 (대시보드 / 텔레그램 요약용)
+  - get_trade_journal(): 프로세스 공용 저널
+📌 누적 집계:
+  - trade_aggregates 테이블을 거래 INSERT와 같은 트랜잭션에서 증분 갱신 (거래당 O(1), 원본 로그 재집계 없음)
+  - 집계 도입 전 기록이 있으면 최초 1회 원본에서 재구성
+  - 이관한 기존 로그 중 시각 없는 기록은 ts="" (가장 오래된 기록 취급)로 저장하고 일별·시간대별 구간에서 제외
+📌 저장 방식:
+  - logs/trade_journal.db, 테이블 trades(ts, symbol, source, signal, profit, entry JSON)
+  - WAL 모드 + synchronous=NORMAL: 커밋마다 fsync하지 않고 체크포인트 시 일괄 fsync,
+    비정상 종료 시에도 DB는 마지막 정상 커밋 상태로 복구
+  - source: "simulation"(sandbox 시뮬레이션 / modules.logger), "auto_trader"(utils/auto_trader) 등
+📌 작업 프롬프트 요약:
+  ▶ "거래마다 전체 로그를 읽고 다시 쓰지 말고, 추가 전용 저널에 기록하며 시각/심볼 인덱스로 조회하라. 기록은 잘라내지 않는다."
+"""
+
+import os
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+import numpy as np
+
+TRADE_JOURNAL_PATH = "logs/trade_journal.db"
+DEFAULT_SOURCE = "simulation"
+AGGREGATES_VERSION = "1"
+UNKNOWN_TS = ""   # 시각 없는 이관 기록 (정렬 시 가장 앞, since 조회·일별/시간대별 집계에서 제외)
+
+_INSERT_SQL = "INSERT INTO trades (ts, symbol, source, signal, profit, entry) VALUES (?, ?, ?, ?, ?, ?)"
+_BUMP_SQL = """
+INSERT INTO trade_aggregates (source, kind, bucket, trades, wins, losses, profit) VALUES (?, ?, ?, 1, ?, ?, ?)
+ON CONFLICT (source, kind, bucket) DO UPDATE SET
+    trades = trades + 1,
+    wins = wins + excluded.wins,
+    losses = losses + excluded.losses,
+    profit = profit + excluded.profit
+"""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS trades (
+    id      INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts      TEXT NOT NULL,
+    symbol  TEXT,
+    source  TEXT NOT NULL,
+    signal  TEXT,
+    profit  REAL,
+    entry   TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_trades_source_ts ON trades(source, ts);
+CREATE INDEX IF NOT EXISTS idx_trades_symbol_ts ON trades(symbol, ts);
+CREATE TABLE IF NOT EXISTS trade_aggregates (
+    source  TEXT NOT NULL,
+    kind    TEXT NOT NULL,     -- total / day / hour / symbol
+    bucket  TEXT NOT NULL,
+    trades  INTEGER NOT NULL DEFAULT 0,
+    wins    INTEGER NOT NULL DEFAULT 0,
+    losses  INTEGER NOT NULL DEFAULT 0,
+    profit  REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (source, kind, bucket)
+);
+CREATE TABLE IF NOT EXISTS journal_meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def _json_default(value):
+    # pandas / numpy 스칼라 → 파이썬 기본형
+    if isinstance(value, np.generic):
+        return value.item()
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    if hasattr(value, "iloc"):
+        return _json_default(value.iloc[-1]) if len(value) else 0
+    return str(value)
+
+
+class TradeJournal:
+    """
+    ✅ 추가 전용 거래 저널 (SQLite)
+    """
+
+    def __init__(self, path: str = TRADE_JOURNAL_PATH, durable: bool = False):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._lock = threading.RLock()
+        self._in_batch = False
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        # durable=True면 커밋마다 fsync (실매매 등), 기본은 체크포인트 단위 일괄 fsync
+        self.conn.execute(f"PRAGMA synchronous={'FULL' if durable else 'NORMAL'}")
+        self.conn.executescript(_SCHEMA)
+        self._ensure_aggregates()
+
+    # ----- 기록 -----
+    @staticmethod
+    def _row(entry: dict, source: str, stamp: bool = True) -> tuple:
+        # stamp=False: 기존 로그 이관 (시각 없는 기록에 이관 시각을 넣으면 '오늘 거래'로 집계되므로 비워 둠)
+        entry = dict(entry)
+        if stamp and not entry.get("timestamp"):
+            entry["timestamp"] = datetime.now().isoformat()
+        data = json.dumps(entry, ensure_ascii=False, default=_json_default)
+        profit = entry.get("profit")
+        try:
+            profit = float(profit) if profit is not None else None
+        except (TypeError, ValueError):
+            profit = None
+        ts = str(entry["timestamp"]) if entry.get("timestamp") else UNKNOWN_TS
+        return (ts, entry.get("symbol"), source, entry.get("signal"), profit, data)
+
+    def append(self, entry: dict, source: str = DEFAULT_SOURCE) -> dict:
+        """
+        거래 1건 추가 (timestamp 없으면 현재 시각), 저장된 entry 반환
+        """
+        row = self._row(entry, source)
+        with self.batch():
+            self._insert([row])
+        return json.loads(row[-1])
+
+    def extend(self, entries, source: str = DEFAULT_SOURCE) -> int:
+        rows = [self._row(entry, source) for entry in entries]
+        with self.batch():
+            self._insert(rows)
+        return len(rows)
+
+    @staticmethod
+    def _buckets(row: tuple) -> list:
+        ts, symbol, source, _, profit, _ = row
+        profit = profit or 0.0
+        win, loss = int(profit > 0), int(profit < 0)
+        buckets = [("total", "")]
+        if ts != UNKNOWN_TS:
+            buckets += [("day", ts[:10]), ("hour", ts[11:13] if len(ts) >= 13 else "??")]
+        if symbol:
+            buckets.append(("symbol", symbol))
+        return [(source, kind, bucket, win, loss, profit) for kind, bucket in buckets]
+
+    def _insert(self, rows: list):
+        # 호출 측에서 batch() 트랜잭션 보유 → 원본 기록과 집계가 항상 함께 반영
+        self.conn.executemany(_INSERT_SQL, rows)
+        self.conn.executemany(_BUMP_SQL, [bucket for row in rows for bucket in self._buckets(row)])
+
+    def _ensure_aggregates(self):
+        """
+        집계 테이블 도입 전 저널이면 원본에서 1회 재구성
+        """
+        version = self.conn.execute("SELECT value FROM journal_meta WHERE key = 'aggregates_version'").fetchone()
+        if version and version[0] == AGGREGATES_VERSION:
+            return
+        self.rebuild_aggregates()
+
+    def rebuild_aggregates(self):
+        """
+        원본 거래 기록에서 집계 전체 재계산 (SQL GROUP BY, 복구/검증용)
+        """
+        day, hour = "substr(ts, 1, 10)", "CASE WHEN length(ts) >= 13 THEN substr(ts, 12, 2) ELSE '??' END"
+        with self.batch():
+            self.conn.execute("DELETE FROM trade_aggregates")
+            known = "WHERE ts != ''"
+            for kind, expr, where in (("total", "''", ""), ("day", day, known), ("hour", hour, known),
+                                      ("symbol", "symbol", "WHERE symbol IS NOT NULL AND symbol != ''")):
+                self.conn.execute(f"""
+                    INSERT INTO trade_aggregates (source, kind, bucket, trades, wins, losses, profit)
+                    SELECT source, '{kind}', {expr}, COUNT(*),
+                           SUM(COALESCE(profit, 0) > 0), SUM(COALESCE(profit, 0) < 0), COALESCE(SUM(profit), 0)
+                    FROM trades {where} GROUP BY source, {expr}
+                """)
+            self.conn.execute("INSERT OR REPLACE INTO journal_meta (key, value) VALUES ('aggregates_version', ?)",
+                              (AGGREGATES_VERSION,))
+
+    def get_aggregates(self, source: str = DEFAULT_SOURCE) -> dict:
+        """
+        누적 집계 조회 (원본 로그를 읽지 않음)
+        - 반환: {"trades", "wins", "losses", "profit", "win_rate", "daily": {일: 집계}, "hourly": {시: 집계}, "symbols": {...}}
+        """
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT kind, bucket, trades, wins, losses, profit FROM trade_aggregates WHERE source = ? ORDER BY bucket",
+                (source,)).fetchall()
+
+        def bucket_stats(trades, wins, losses, profit):
+            return {"trades": trades, "wins": wins, "losses": losses, "profit": profit,
+                    "win_rate": round(wins / trades * 100, 1) if trades else 0.0}
+
+        result = {**bucket_stats(0, 0, 0, 0.0), "daily": {}, "hourly": {}, "symbols": {}}
+        groups = {"day": result["daily"], "hour": result["hourly"], "symbol": result["symbols"]}
+        for kind, bucket, trades, wins, losses, profit in rows:
+            if kind == "total":
+                result.update(bucket_stats(trades, wins, losses, profit))
+            elif kind in groups:
+                groups[kind][bucket] = bucket_stats(trades, wins, losses, profit)
+        return result
+
+    @contextmanager
+    def batch(self):
+        """
+        블록 안의 append를 한 트랜잭션으로 묶음 (중첩 시 바깥 트랜잭션만 유효)
+        """
+        with self._lock:
+            if self._in_batch:
+                yield self
+                return
+            self._in_batch = True
+            self.conn.execute("BEGIN")
+            try:
+                yield self
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+            else:
+                self.conn.execute("COMMIT")
+            finally:
+                self._in_batch = False
+
+    # ----- 조회 -----
+    def query(self, source: str = DEFAULT_SOURCE, symbol: str = None, since: str = None, until: str = None,
+              limit: int = None, newest_first: bool = False) -> list:
+        """
+        조건에 맞는 거래 entry 목록 (since/until: ISO 시각 문자열 접두사 비교, until은 미포함)
+        """
+        clauses, params = [], []
+        if source is not None:
+            clauses.append("source = ?")
+            params.append(source)
+        if symbol is not None:
+            clauses.append("symbol = ?")
+            params.append(symbol)
+        if since is not None:
+            clauses.append("ts >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("ts < ?")
+            params.append(until)
+        sql = "SELECT entry FROM trades"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += f" ORDER BY ts {'DESC' if newest_first else 'ASC'}, id {'DESC' if newest_first else 'ASC'}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def rows_after(self, last_id: int = 0, source: str = DEFAULT_SOURCE, limit: int = 50_000) -> list:
+        """
+        id가 last_id보다 큰 기록을 id 순서로 [(id, entry), ...] 반환 (증분 내보내기 / 아카이브 압축용)
+        """
+        sql = "SELECT id, entry FROM trades WHERE id > ?"
+        params = [int(last_id)]
+        if source is not None:
+            sql += " AND source = ?"
+            params.append(source)
+        sql += " ORDER BY id LIMIT ?"
+        params.append(int(limit))
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        return [(row_id, json.loads(entry)) for row_id, entry in rows]
+
+    def tail(self, n: int = 10, source: str = DEFAULT_SOURCE, symbol: str = None) -> list:
+        """
+        최근 n건 (오래된 → 최신 순)
+        """
+        return list(reversed(self.query(source, symbol, limit=n, newest_first=True)))
+
+    def count(self, source: str = DEFAULT_SOURCE) -> int:
+        with self._lock:
+            if source is None:
+                return self.conn.execute("SELECT COUNT(*) FROM trades").fetchone()[0]
+            return self.conn.execute("SELECT COUNT(*) FROM trades WHERE source = ?", (source,)).fetchone()[0]
+
+    # ----- 이관 / 내보내기 -----
+    def import_json_log(self, path: str, source: str = DEFAULT_SOURCE) -> int:
+        """
+        기존 JSON 배열 로그를 1회만 이관 (이관 여부는 journal_meta에 기록)
+        """
+        key = f"imported:{source}:{os.path.abspath(path)}"
+        with self._lock:
+            if self.conn.execute("SELECT 1 FROM journal_meta WHERE key = ?", (key,)).fetchone():
+                return 0
+            entries = []
+            if os.path.exists(path):
+                try:
+                    with open(path, "r", encoding="utf-8") as f:
+                        entries = json.load(f)
+                except (json.JSONDecodeError, ValueError, OSError):
+                    print(f"⚠️ 기존 로그 이관 실패 (손상된 파일): {path}")
+                    entries = []
+            with self.batch():
+                if entries:
+                    self._insert([self._row(entry, source, stamp=False) for entry in entries if isinstance(entry, dict)])
+                self.conn.execute("INSERT INTO journal_meta (key, value) VALUES (?, ?)",
+                                  (key, datetime.now().isoformat()))
+        if entries:
+            print(f"📦 기존 로그 {len(entries)}건을 거래 저널로 이관: {path}")
+        return len(entries)
+
+    def export_json(self, path: str, source: str = DEFAULT_SOURCE, limit: int = None) -> str:
+        entries = self.tail(limit, source) if limit else self.query(source)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(entries, f, indent=2, ensure_ascii=False)
+        return path
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+_JOURNAL = None
+_JOURNAL_LOCK = threading.Lock()
+
+# 기존 JSON 로그 위치 → 저널 source (첫 사용 시 1회 이관)
+LEGACY_LOGS = {
+    "logs/simulation/simulated_trades.json": "simulation",
+    "simulated_trades.json": "auto_trader",
+}
+
+def get_trade_journal() -> TradeJournal:
+    global _JOURNAL
+    with _JOURNAL_LOCK:
+        if _JOURNAL is None:
+            _JOURNAL = TradeJournal()
+            for path, source in LEGACY_LOGS.items():
+                _JOURNAL.import_json_log(path, source)
+        return _JOURNAL
+
+def get_trade_stats(source: str = DEFAULT_SOURCE, initial_balance: float = 0.0) -> dict:
+    """
+    ✅ 누적 성과 + 잔고 (initial_balance + 누적 수익) — 대시보드 / 텔레그램 요약용
+    """
+    stats = get_trade_journal().get_aggregates(source)
+    stats["balance"] = initial_balance + stats["profit"]
+    return stats
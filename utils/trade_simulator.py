@@ -3,28 +3,26 @@
 📌 목적: 전략 결과에 기반한 가상 매매 시뮬레이션
 📌 기능:
   - simulate_trade(): 전략 실행에 따른 수익 계산
-  - record_trade_log(): 개별 매매 결과 저장
-  - record_daily_summary(): 일일 누적 수익 요약 기록
+  - record_trade_log(): 개별 매매 결과 저장 (추가 전용 거래 저널, source="simulation")
+  - record_daily_summary(): 일일 누적 수익 요약 기록 (저널 누적 집계 사용, 원본 로그 재집계 없음)
+  - get_simulation_stats(): 잔고 / 거래 수 / 승률 / 일별·시간대별 누적 성과
 📌 프롬프트 요약:
   ▶ "전략 결과를 받아 수익을 시뮬레이션하고, 일일 로그 및 수익률을 기록하라."
 """
 
 import os
-import json
 from datetime import datetime
 
-SIMULATION_LOG_PATH = "logs/simulation/simulated_trades.json"
+from utils.trade_journal import get_trade_journal, get_trade_stats
+
+SIMULATION_LOG_PATH = "logs/simulation/simulated_trades.json"   # 기존 JSON 로그 (저널로 1회 이관됨)
+JOURNAL_SOURCE = "simulation"
 DAILY_SUMMARY_PATH = "logs/daily_summaries"
 INITIAL_BALANCE = 1_000_000
 
-def load_trade_log():
-    if not os.path.exists(SIMULATION_LOG_PATH):
-        return []
-    with open(SIMULATION_LOG_PATH, "r", encoding="utf-8") as f:
-        try:
-            return json.load(f)
-        except json.JSONDecodeError:
-            return []
+def load_trade_log(limit: int = None):
+    journal = get_trade_journal()
+    return journal.tail(limit, JOURNAL_SOURCE) if limit else journal.query(JOURNAL_SOURCE)
 
 def simulate_trade(signal: str, entry_price: float, tp: float, sl: float):
     if signal == "long":
@@ -36,21 +34,19 @@ def simulate_trade(signal: str, entry_price: float, tp: float, sl: float):
     return profit
 
 def record_trade_log(entry: dict):
-    logs = load_trade_log()
-    logs.append(entry)
-    logs = logs[-1000:]
-    os.makedirs(os.path.dirname(SIMULATION_LOG_PATH), exist_ok=True)
-    with open(SIMULATION_LOG_PATH, "w", encoding="utf-8") as f:
-        json.dump(logs, f, indent=2, ensure_ascii=False)
+    entry.setdefault("timestamp", datetime.now().isoformat())
+    get_trade_journal().append(entry, JOURNAL_SOURCE)
+
+def get_simulation_stats() -> dict:
+    return get_trade_stats(JOURNAL_SOURCE, INITIAL_BALANCE)
 
 def record_daily_summary():
-    logs = load_trade_log()
+    stats = get_simulation_stats()
     os.makedirs(DAILY_SUMMARY_PATH, exist_ok=True)
     today = datetime.now().strftime("%Y-%m-%d")
     summary_path = os.path.join(DAILY_SUMMARY_PATH, f"{today}.txt")
 
-    balance = INITIAL_BALANCE + sum(entry["profit"] for entry in logs if "profit" in entry)
     with open(summary_path, "w", encoding="utf-8") as f:
         f.write(f"[{today}] 누적 수익 요약\n")
-        f.write(f"시뮬레이션 잔고: {balance:,.2f}원\n")
-        f.write(f"총 거래 수: {len(logs)}회\n")
+        f.write(f"시뮬레이션 잔고: {stats['balance']:,.2f}원\n")
+        f.write(f"총 거래 수: {stats['trades']}회\n")